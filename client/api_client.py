@@ -1,42 +1,103 @@
 """
 REST API клиент для BeautyPro
 """
+import json
 import requests
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from datetime import date, datetime
 
+from client.cache import ResponseCache
+
+
+# Сколько секунд справочники отдаются из кэша клиента без запроса к серверу
+CACHE_TTLS = {
+    "professions": 300,
+    "services": 60,
+    "masters": 60,
+}
+
+# Изменяющие запросы к этим эндпоинтам сбрасывают кэш справочников
+CATALOG_ENDPOINTS = ("/api/professions", "/api/services", "/api/masters")
+
+
+class APIError(Exception):
+    """Ошибка запроса к API при постраничном переборе"""
+    pass
+
 
 class BeautyProAPI:
     """Клиент для взаимодействия с BeautyPro API"""
     
-    def __init__(self, base_url: str = "http://127.0.0.1:8000"):
+    def __init__(self, base_url: str = "http://127.0.0.1:8000", cache: Optional[ResponseCache] = None):
         self.base_url = base_url
         self.session = requests.Session()
+        # Кэш справочников можно разделить с AsyncBeautyProAPI
+        self.cache = cache if cache is not None else ResponseCache()
+        # ETag и данные последнего ответа на каждый GET-запрос
+        self._validators: Dict[Tuple, Tuple[str, Any]] = {}
     
     def _request(
-        self, 
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        params: Optional[Dict] = None,
+        cache_ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        HTTP запрос с кэшем справочников: GET с cache_ttl отдается из кэша,
+        изменяющий запрос к справочникам сбрасывает кэш
+        """
+        if cache_ttl is not None:
+            return self.cache.get_or_load(
+                (endpoint, tuple(sorted((params or {}).items()))),
+                cache_ttl,
+                lambda: self._send(method, endpoint, data, params),
+                cacheable=lambda result: result["success"]
+            )
+        
+        result = self._send(method, endpoint, data, params)
+        if method != "GET" and endpoint.startswith(CATALOG_ENDPOINTS):
+            self.cache.invalidate()
+        return result
+    
+    def _send(
+        self,
         method: str, 
         endpoint: str, 
-        data: Optional[Dict] = None,
+        data: Optional[Any] = None,
         params: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Базовый метод для HTTP запросов"""
         url = f"{self.base_url}{endpoint}"
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
         
         try:
             if method == "GET":
-                response = self.session.get(url, params=params)
+                # Отправляем ETag прошлого ответа: если данные не изменились,
+                # сервер ответит 304 без тела
+                headers = {}
+                cached = self._validators.get(cache_key)
+                if cached:
+                    headers["If-None-Match"] = cached[0]
+                response = self.session.get(url, params=params, headers=headers)
+                if response.status_code == 304 and cached:
+                    return {"success": True, "data": cached[1]}
             elif method == "POST":
                 response = self.session.post(url, json=data, params=params)
             elif method == "PUT":
-                response = self.session.put(url, json=data)
+                response = self.session.put(url, json=data, params=params)
             elif method == "DELETE":
                 response = self.session.delete(url, params=params)
             else:
                 raise ValueError(f"Неподдерживаемый метод: {method}")
             
             if response.status_code == 200:
-                return {"success": True, "data": response.json()}
+                data = response.json()
+                etag = response.headers.get("ETag")
+                if method == "GET" and etag:
+                    self._validators[cache_key] = (etag, data)
+                return {"success": True, "data": data}
             elif response.status_code == 422:
                 return {"success": False, "error": "Ошибка валидации данных"}
             else:
@@ -48,6 +109,10 @@ class BeautyProAPI:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def cache_stats(self) -> Dict[str, int]:
+        """Статистика кэша справочников (попадания, промахи, объединенные запросы)"""
+        return self.cache.stats()
+    
     # ==================== AUTH ====================
     
     def register(self, phone_number: str, password: str, full_name: str) -> Dict:
@@ -59,17 +124,24 @@ class BeautyProAPI:
         })
     
     def login(self, phone_number: str, password: str) -> Dict:
-        """Авторизация пользователя"""
-        return self._request("POST", "/api/auth/login", {
+        """Авторизация пользователя; токен сессии подставляется во все следующие запросы"""
+        result = self._request("POST", "/api/auth/login", {
             "phone_number": phone_number,
             "password": password
         })
+        if result["success"]:
+            self.session.headers["Authorization"] = f"Bearer {result['data']['access_token']}"
+        return result
+    
+    def logout(self):
+        """Забыть токен сессии"""
+        self.session.headers.pop("Authorization", None)
     
     # ==================== PROFESSIONS ====================
     
     def get_professions(self) -> Dict:
         """Получить список профессий"""
-        return self._request("GET", "/api/professions")
+        return self._request("GET", "/api/professions", cache_ttl=CACHE_TTLS["professions"])
     
     # ==================== SERVICES ====================
     
@@ -78,15 +150,23 @@ class BeautyProAPI:
         params = {}
         if profession_id:
             params["profession_id"] = profession_id
-        return self._request("GET", "/api/services", params=params)
+        return self._request("GET", "/api/services", params=params, cache_ttl=CACHE_TTLS["services"])
     
     def get_service(self, service_id: int) -> Dict:
         """Получить услугу по ID"""
-        return self._request("GET", f"/api/services/{service_id}")
+        return self._request("GET", f"/api/services/{service_id}", cache_ttl=CACHE_TTLS["services"])
     
     def get_service_masters(self, service_id: int) -> Dict:
         """Получить мастеров для услуги"""
-        return self._request("GET", f"/api/services/{service_id}/masters")
+        return self._request("GET", f"/api/services/{service_id}/masters", cache_ttl=CACHE_TTLS["masters"])
+    
+    def get_service_availability(self, service_id: int, target_date: date) -> Dict:
+        """Получить свободное время всех мастеров услуги на дату"""
+        return self._request(
+            "GET",
+            f"/api/services/{service_id}/availability",
+            params={"target_date": target_date.isoformat()}
+        )
     
     def create_service(
         self,
@@ -124,6 +204,14 @@ class BeautyProAPI:
             data["profession_id"] = profession_id
         return self._request("PUT", f"/api/services/{service_id}", data)
     
+    def bulk_create_services(self, services: List[Dict], atomic: bool = False) -> Dict:
+        """Создать пакет услуг одним запросом (поля как у create_service)"""
+        return self._request("POST", "/api/services/bulk", services, params={"atomic": atomic})
+    
+    def bulk_update_services(self, services: List[Dict], atomic: bool = False) -> Dict:
+        """Обновить пакет услуг одним запросом (в каждом элементе обязателен id)"""
+        return self._request("PUT", "/api/services/bulk", services, params={"atomic": atomic})
+    
     def delete_service(self, service_id: int) -> Dict:
         """Удалить услугу"""
         return self._request("DELETE", f"/api/services/{service_id}")
@@ -132,15 +220,41 @@ class BeautyProAPI:
     
     def get_masters(self, active_only: bool = True) -> Dict:
         """Получить список мастеров"""
-        return self._request("GET", "/api/masters", params={"active_only": active_only})
+        return self._request(
+            "GET", "/api/masters", params={"active_only": active_only}, cache_ttl=CACHE_TTLS["masters"]
+        )
+    
+    def get_masters_page(
+        self,
+        active_only: bool = True,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Dict:
+        """Получить страницу мастеров"""
+        params = {"active_only": active_only, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return self._request("GET", "/api/masters/page", params=params, cache_ttl=CACHE_TTLS["masters"])
+    
+    def iter_masters(self, active_only: bool = True, page_size: int = 50) -> Iterator[Dict]:
+        """Перебрать мастеров, загружая следующую страницу только по мере перебора"""
+        cursor = None
+        while True:
+            result = self.get_masters_page(active_only, cursor, page_size)
+            if not result["success"]:
+                raise APIError(result["error"])
+            yield from result["data"]["items"]
+            cursor = result["data"]["next_cursor"]
+            if not cursor:
+                return
     
     def get_master(self, master_id: int) -> Dict:
         """Получить мастера по ID"""
-        return self._request("GET", f"/api/masters/{master_id}")
+        return self._request("GET", f"/api/masters/{master_id}", cache_ttl=CACHE_TTLS["masters"])
     
     def get_master_services(self, master_id: int) -> Dict:
         """Получить услуги мастера"""
-        return self._request("GET", f"/api/masters/{master_id}/services")
+        return self._request("GET", f"/api/masters/{master_id}/services", cache_ttl=CACHE_TTLS["services"])
     
     def create_master(
         self, 
@@ -179,6 +293,14 @@ class BeautyProAPI:
             data["service_ids"] = service_ids
         return self._request("PUT", f"/api/masters/{master_id}", data)
     
+    def bulk_create_masters(self, masters: List[Dict], atomic: bool = False) -> Dict:
+        """Создать пакет мастеров одним запросом (поля как у create_master)"""
+        return self._request("POST", "/api/masters/bulk", masters, params={"atomic": atomic})
+    
+    def bulk_update_masters(self, masters: List[Dict], atomic: bool = False) -> Dict:
+        """Обновить пакет мастеров одним запросом (в каждом элементе обязателен id)"""
+        return self._request("PUT", "/api/masters/bulk", masters, params={"atomic": atomic})
+    
     def delete_master(self, master_id: int) -> Dict:
         """Удалить мастера"""
         return self._request("DELETE", f"/api/masters/{master_id}")
@@ -201,6 +323,38 @@ class BeautyProAPI:
             params["status"] = status
         return self._request("GET", "/api/appointments", params=params)
     
+    def get_appointments_page(
+        self,
+        client_id: int,
+        status: str = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Dict:
+        """Получить страницу записей клиента (от новых к старым)"""
+        params = {"client_id": client_id, "limit": limit}
+        if status:
+            params["status"] = status
+        if cursor:
+            params["cursor"] = cursor
+        return self._request("GET", "/api/appointments/page", params=params)
+    
+    def iter_appointments(
+        self,
+        client_id: int,
+        status: str = None,
+        page_size: int = 50
+    ) -> Iterator[Dict]:
+        """Перебрать записи клиента, загружая следующую страницу только по мере перебора"""
+        cursor = None
+        while True:
+            result = self.get_appointments_page(client_id, status, cursor, page_size)
+            if not result["success"]:
+                raise APIError(result["error"])
+            yield from result["data"]["items"]
+            cursor = result["data"]["next_cursor"]
+            if not cursor:
+                return
+    
     def create_appointment(
         self,
         client_id: int,
@@ -238,6 +392,86 @@ class BeautyProAPI:
         }
         return self._request("GET", "/api/available-slots", params=params)
     
+    def get_available_slots_range(
+        self,
+        master_id: int,
+        service_id: int,
+        date_from: date,
+        date_to: date
+    ) -> Dict:
+        """Получить доступные слоты на каждый день диапазона"""
+        params = {
+            "master_id": master_id,
+            "service_id": service_id,
+            "from": date_from.isoformat(),
+            "to": date_to.isoformat()
+        }
+        return self._request("GET", "/api/available-slots/range", params=params)
+    
+    # ==================== ADMIN ====================
+    
+    def iter_all_appointments(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        master_id: Optional[int] = None,
+        service_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Перебрать все записи салона по фильтрам (только для админа), читая поток NDJSON"""
+        params = {"format": "ndjson"}
+        if date_from:
+            params["from"] = date_from.isoformat()
+        if date_to:
+            params["to"] = date_to.isoformat()
+        if master_id:
+            params["master_id"] = master_id
+        if service_id:
+            params["service_id"] = service_id
+        if status:
+            params["status"] = status
+        
+        try:
+            with self.session.get(
+                f"{self.base_url}/api/admin/appointments", params=params, stream=True
+            ) as response:
+                if response.status_code != 200:
+                    raise APIError(response.json().get("detail", "Неизвестная ошибка"))
+                for line in response.iter_lines():
+                    if line:
+                        yield json.loads(line)
+        except requests.exceptions.ConnectionError:
+            raise APIError("Не удалось подключиться к серверу")
+    
+    def export_appointments(
+        self,
+        file_path: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        output_format: str = "csv"
+    ) -> Dict:
+        """Сохранить выгрузку записей для бухгалтерии (csv или parquet) в файл"""
+        params = {"format": output_format}
+        if date_from:
+            params["from"] = date_from.isoformat()
+        if date_to:
+            params["to"] = date_to.isoformat()
+        
+        try:
+            with self.session.get(
+                f"{self.base_url}/api/admin/export/appointments", params=params, stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return {"success": False, "error": response.json().get("detail", "Неизвестная ошибка")}
+                with open(file_path, "wb") as file:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        file.write(chunk)
+            return {"success": True, "data": file_path}
+        except requests.exceptions.ConnectionError:
+            return {"success": False, "error": "Не удалось подключиться к серверу"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
     # ==================== HEALTH ====================
     
     def health_check(self) -> Dict:
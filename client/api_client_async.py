@@ -0,0 +1,535 @@
+"""
+Асинхронный REST API клиент для BeautyPro (httpx, пул keep-alive соединений)
+"""
+import asyncio
+import json
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Tuple
+from datetime import date, datetime
+
+try:
+    import httpx
+except ImportError:  # httpx - необязательная зависимость, без нее используется BeautyProAPI
+    httpx = None
+
+from client.api_client import APIError, CACHE_TTLS, CATALOG_ENDPOINTS
+from client.cache import ResponseCache
+
+
+# Справочники, которые можно загрузить одним вызовом get_catalog
+CATALOG_PARTS = ("professions", "services", "masters")
+
+
+def async_client_available() -> bool:
+    """Установлен ли httpx для асинхронного клиента"""
+    return httpx is not None
+
+
+class AsyncBeautyProAPI:
+    """
+    Асинхронный клиент BeautyPro API с теми же методами, что и BeautyProAPI.
+    
+    Все запросы идут через один httpx.AsyncClient: соединения HTTP/1.1
+    переиспользуются (keep-alive), а независимые запросы выполняются
+    одновременно через gather/get_catalog. Клиент нужно использовать
+    из одного цикла событий.
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8000",
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        cache: Optional[ResponseCache] = None
+    ):
+        self.base_url = base_url
+        # Кэш справочников можно разделить с BeautyProAPI
+        self.cache = cache if cache is not None else ResponseCache()
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+        # ETag и данные последнего ответа на каждый GET-запрос
+        self._validators: Dict[Tuple, Tuple[str, Any]] = {}
+    
+    async def aclose(self):
+        """Закрыть соединения пула"""
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        params: Optional[Dict] = None,
+        cache_ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        HTTP запрос с кэшем справочников: GET с cache_ttl отдается из кэша,
+        изменяющий запрос к справочникам сбрасывает кэш
+        """
+        if cache_ttl is not None:
+            return await self.cache.get_or_load_async(
+                (endpoint, tuple(sorted((params or {}).items()))),
+                cache_ttl,
+                lambda: self._send(method, endpoint, data, params),
+                cacheable=lambda result: result["success"]
+            )
+        
+        result = await self._send(method, endpoint, data, params)
+        if method != "GET" and endpoint.startswith(CATALOG_ENDPOINTS):
+            self.cache.invalidate()
+        return result
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Базовый метод для HTTP запросов"""
+        url = f"{self.base_url}{endpoint}"
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
+        
+        try:
+            if method == "GET":
+                # Отправляем ETag прошлого ответа: если данные не изменились,
+                # сервер ответит 304 без тела
+                headers = {}
+                cached = self._validators.get(cache_key)
+                if cached:
+                    headers["If-None-Match"] = cached[0]
+                response = await self.client.get(url, params=params, headers=headers)
+                if response.status_code == 304 and cached:
+                    return {"success": True, "data": cached[1]}
+            elif method == "POST":
+                response = await self.client.post(url, json=data, params=params)
+            elif method == "PUT":
+                response = await self.client.put(url, json=data, params=params)
+            elif method == "DELETE":
+                response = await self.client.delete(url, params=params)
+            else:
+                raise ValueError(f"Неподдерживаемый метод: {method}")
+            
+            if response.status_code == 200:
+                data = response.json()
+                etag = response.headers.get("ETag")
+                if method == "GET" and etag:
+                    self._validators[cache_key] = (etag, data)
+                return {"success": True, "data": data}
+            elif response.status_code == 422:
+                return {"success": False, "error": "Ошибка валидации данных"}
+            else:
+                error_detail = response.json().get("detail", "Неизвестная ошибка")
+                return {"success": False, "error": error_detail}
+        
+        except httpx.ConnectError:
+            return {"success": False, "error": "Не удалось подключиться к серверу"}
+        except httpx.TimeoutException:
+            return {"success": False, "error": "Сервер не ответил вовремя"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Статистика кэша справочников (попадания, промахи, объединенные запросы)"""
+        return self.cache.stats()
+    
+    # ==================== FAN-OUT ====================
+    
+    async def gather(self, **requests: Awaitable[Dict]) -> Dict[str, Dict]:
+        """
+        Выполнить независимые запросы одновременно:
+        gather(professions=api.get_professions(), services=api.get_services())
+        вернет {"professions": {...}, "services": {...}}
+        """
+        results = await asyncio.gather(*requests.values())
+        return dict(zip(requests.keys(), results))
+    
+    async def get_catalog(self, *parts: str) -> Dict[str, Dict]:
+        """Параллельно загрузить справочники: professions, services, masters (по умолчанию все)"""
+        loaders = {
+            "professions": self.get_professions,
+            "services": self.get_services,
+            "masters": lambda: self.get_masters(active_only=False),
+        }
+        return await self.gather(**{part: loaders[part]() for part in parts or CATALOG_PARTS})
+    
+    # ==================== AUTH ====================
+    
+    async def register(self, phone_number: str, password: str, full_name: str) -> Dict:
+        """Регистрация нового клиента"""
+        return await self._request("POST", "/api/auth/register", {
+            "phone_number": phone_number,
+            "password": password,
+            "full_name": full_name
+        })
+    
+    async def login(self, phone_number: str, password: str) -> Dict:
+        """Авторизация пользователя; токен сессии подставляется во все следующие запросы"""
+        result = await self._request("POST", "/api/auth/login", {
+            "phone_number": phone_number,
+            "password": password
+        })
+        if result["success"]:
+            self.client.headers["Authorization"] = f"Bearer {result['data']['access_token']}"
+        return result
+    
+    def logout(self):
+        """Забыть токен сессии"""
+        self.client.headers.pop("Authorization", None)
+    
+    # ==================== PROFESSIONS ====================
+    
+    async def get_professions(self) -> Dict:
+        """Получить список профессий"""
+        return await self._request("GET", "/api/professions", cache_ttl=CACHE_TTLS["professions"])
+    
+    # ==================== SERVICES ====================
+    
+    async def get_services(self, profession_id: Optional[int] = None) -> Dict:
+        """Получить список услуг"""
+        params = {}
+        if profession_id:
+            params["profession_id"] = profession_id
+        return await self._request("GET", "/api/services", params=params, cache_ttl=CACHE_TTLS["services"])
+    
+    async def get_service(self, service_id: int) -> Dict:
+        """Получить услугу по ID"""
+        return await self._request("GET", f"/api/services/{service_id}", cache_ttl=CACHE_TTLS["services"])
+    
+    async def get_service_masters(self, service_id: int) -> Dict:
+        """Получить мастеров для услуги"""
+        return await self._request("GET", f"/api/services/{service_id}/masters", cache_ttl=CACHE_TTLS["masters"])
+    
+    async def get_service_availability(self, service_id: int, target_date: date) -> Dict:
+        """Получить свободное время всех мастеров услуги на дату"""
+        return await self._request(
+            "GET",
+            f"/api/services/{service_id}/availability",
+            params={"target_date": target_date.isoformat()}
+        )
+    
+    async def create_service(
+        self,
+        name: str,
+        price: float,
+        duration_minutes: int,
+        profession_id: int
+    ) -> Dict:
+        """Создать новую услугу"""
+        data = {
+            "name": name,
+            "price": price,
+            "duration_minutes": duration_minutes,
+            "profession_id": profession_id
+        }
+        return await self._request("POST", "/api/services", data)
+    
+    async def update_service(
+        self,
+        service_id: int,
+        name: str = None,
+        price: float = None,
+        duration_minutes: int = None,
+        profession_id: int = None
+    ) -> Dict:
+        """Обновить услугу"""
+        data = {}
+        if name is not None:
+            data["name"] = name
+        if price is not None:
+            data["price"] = price
+        if duration_minutes is not None:
+            data["duration_minutes"] = duration_minutes
+        if profession_id is not None:
+            data["profession_id"] = profession_id
+        return await self._request("PUT", f"/api/services/{service_id}", data)
+    
+    async def bulk_create_services(self, services: List[Dict], atomic: bool = False) -> Dict:
+        """Создать пакет услуг одним запросом (поля как у create_service)"""
+        return await self._request("POST", "/api/services/bulk", services, params={"atomic": atomic})
+    
+    async def bulk_update_services(self, services: List[Dict], atomic: bool = False) -> Dict:
+        """Обновить пакет услуг одним запросом (в каждом элементе обязателен id)"""
+        return await self._request("PUT", "/api/services/bulk", services, params={"atomic": atomic})
+    
+    async def delete_service(self, service_id: int) -> Dict:
+        """Удалить услугу"""
+        return await self._request("DELETE", f"/api/services/{service_id}")
+    
+    # ==================== MASTERS ====================
+    
+    async def get_masters(self, active_only: bool = True) -> Dict:
+        """Получить список мастеров"""
+        return await self._request(
+            "GET", "/api/masters", params={"active_only": active_only}, cache_ttl=CACHE_TTLS["masters"]
+        )
+    
+    async def get_masters_page(
+        self,
+        active_only: bool = True,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Dict:
+        """Получить страницу мастеров"""
+        params = {"active_only": active_only, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return await self._request("GET", "/api/masters/page", params=params, cache_ttl=CACHE_TTLS["masters"])
+    
+    async def iter_masters(self, active_only: bool = True, page_size: int = 50) -> AsyncIterator[Dict]:
+        """Перебрать мастеров, загружая следующую страницу только по мере перебора"""
+        cursor = None
+        while True:
+            result = await self.get_masters_page(active_only, cursor, page_size)
+            if not result["success"]:
+                raise APIError(result["error"])
+            for master in result["data"]["items"]:
+                yield master
+            cursor = result["data"]["next_cursor"]
+            if not cursor:
+                return
+    
+    async def get_master(self, master_id: int) -> Dict:
+        """Получить мастера по ID"""
+        return await self._request("GET", f"/api/masters/{master_id}", cache_ttl=CACHE_TTLS["masters"])
+    
+    async def get_master_services(self, master_id: int) -> Dict:
+        """Получить услуги мастера"""
+        return await self._request("GET", f"/api/masters/{master_id}/services", cache_ttl=CACHE_TTLS["services"])
+    
+    async def create_master(
+        self,
+        full_name: str,
+        profession_id: Optional[int] = None,
+        contact_info: str = "",
+        service_ids: List[int] = None
+    ) -> Dict:
+        """Создать нового мастера"""
+        data = {
+            "full_name": full_name,
+            "contact_info": contact_info,
+            "service_ids": service_ids or []
+        }
+        if profession_id is not None:
+            data["profession_id"] = profession_id
+        return await self._request("POST", "/api/masters", data)
+    
+    async def update_master(
+        self,
+        master_id: int,
+        full_name: str = None,
+        profession_id: int = None,
+        contact_info: str = None,
+        service_ids: List[int] = None
+    ) -> Dict:
+        """Обновить данные мастера"""
+        data = {}
+        if full_name is not None:
+            data["full_name"] = full_name
+        if profession_id is not None:
+            data["profession_id"] = profession_id
+        if contact_info is not None:
+            data["contact_info"] = contact_info
+        if service_ids is not None:
+            data["service_ids"] = service_ids
+        return await self._request("PUT", f"/api/masters/{master_id}", data)
+    
+    async def bulk_create_masters(self, masters: List[Dict], atomic: bool = False) -> Dict:
+        """Создать пакет мастеров одним запросом (поля как у create_master)"""
+        return await self._request("POST", "/api/masters/bulk", masters, params={"atomic": atomic})
+    
+    async def bulk_update_masters(self, masters: List[Dict], atomic: bool = False) -> Dict:
+        """Обновить пакет мастеров одним запросом (в каждом элементе обязателен id)"""
+        return await self._request("PUT", "/api/masters/bulk", masters, params={"atomic": atomic})
+    
+    async def delete_master(self, master_id: int) -> Dict:
+        """Удалить мастера"""
+        return await self._request("DELETE", f"/api/masters/{master_id}")
+    
+    async def assign_services_to_master(self, master_id: int, service_ids: List[int]) -> Dict:
+        """Назначить услуги мастеру"""
+        return await self._request("POST", f"/api/masters/{master_id}/services", service_ids)
+    
+    # ==================== APPOINTMENTS ====================
+    
+    async def get_appointments(
+        self,
+        client_id: int,
+        status: str = None,
+        upcoming_only: bool = False
+    ) -> Dict:
+        """Получить записи клиента"""
+        params = {"client_id": client_id, "upcoming_only": upcoming_only}
+        if status:
+            params["status"] = status
+        return await self._request("GET", "/api/appointments", params=params)
+    
+    async def get_appointments_page(
+        self,
+        client_id: int,
+        status: str = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Dict:
+        """Получить страницу записей клиента (от новых к старым)"""
+        params = {"client_id": client_id, "limit": limit}
+        if status:
+            params["status"] = status
+        if cursor:
+            params["cursor"] = cursor
+        return await self._request("GET", "/api/appointments/page", params=params)
+    
+    async def iter_appointments(
+        self,
+        client_id: int,
+        status: str = None,
+        page_size: int = 50
+    ) -> AsyncIterator[Dict]:
+        """Перебрать записи клиента, загружая следующую страницу только по мере перебора"""
+        cursor = None
+        while True:
+            result = await self.get_appointments_page(client_id, status, cursor, page_size)
+            if not result["success"]:
+                raise APIError(result["error"])
+            for appointment in result["data"]["items"]:
+                yield appointment
+            cursor = result["data"]["next_cursor"]
+            if not cursor:
+                return
+    
+    async def create_appointment(
+        self,
+        client_id: int,
+        master_id: int,
+        service_id: int,
+        appointment_datetime: datetime
+    ) -> Dict:
+        """Создать новую запись"""
+        data = {
+            "master_id": master_id,
+            "service_id": service_id,
+            "appointment_datetime": appointment_datetime.isoformat()
+        }
+        return await self._request("POST", "/api/appointments", data, params={"client_id": client_id})
+    
+    async def cancel_appointment(self, appointment_id: int, client_id: int) -> Dict:
+        """Отменить запись"""
+        return await self._request(
+            "DELETE",
+            f"/api/appointments/{appointment_id}",
+            params={"client_id": client_id}
+        )
+    
+    async def get_available_slots(
+        self,
+        master_id: int,
+        service_id: int,
+        target_date: date
+    ) -> Dict:
+        """Получить доступные временные слоты"""
+        params = {
+            "master_id": master_id,
+            "service_id": service_id,
+            "target_date": target_date.isoformat()
+        }
+        return await self._request("GET", "/api/available-slots", params=params)
+    
+    async def get_available_slots_range(
+        self,
+        master_id: int,
+        service_id: int,
+        date_from: date,
+        date_to: date
+    ) -> Dict:
+        """Получить доступные слоты на каждый день диапазона"""
+        params = {
+            "master_id": master_id,
+            "service_id": service_id,
+            "from": date_from.isoformat(),
+            "to": date_to.isoformat()
+        }
+        return await self._request("GET", "/api/available-slots/range", params=params)
+    
+    # ==================== ADMIN ====================
+    
+    async def iter_all_appointments(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        master_id: Optional[int] = None,
+        service_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> AsyncIterator[Dict]:
+        """Перебрать все записи салона по фильтрам (только для админа), читая поток NDJSON"""
+        params = {"format": "ndjson"}
+        if date_from:
+            params["from"] = date_from.isoformat()
+        if date_to:
+            params["to"] = date_to.isoformat()
+        if master_id:
+            params["master_id"] = master_id
+        if service_id:
+            params["service_id"] = service_id
+        if status:
+            params["status"] = status
+        
+        try:
+            async with self.client.stream(
+                "GET", f"{self.base_url}/api/admin/appointments", params=params
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise APIError(response.json().get("detail", "Неизвестная ошибка"))
+                async for line in response.aiter_lines():
+                    if line:
+                        yield json.loads(line)
+        except httpx.ConnectError:
+            raise APIError("Не удалось подключиться к серверу")
+    
+    async def export_appointments(
+        self,
+        file_path: str,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        output_format: str = "csv"
+    ) -> Dict:
+        """Сохранить выгрузку записей для бухгалтерии (csv или parquet) в файл"""
+        params = {"format": output_format}
+        if date_from:
+            params["from"] = date_from.isoformat()
+        if date_to:
+            params["to"] = date_to.isoformat()
+        
+        try:
+            async with self.client.stream(
+                "GET", f"{self.base_url}/api/admin/export/appointments", params=params
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    return {"success": False, "error": response.json().get("detail", "Неизвестная ошибка")}
+                with open(file_path, "wb") as file:
+                    async for chunk in response.aiter_bytes(chunk_size=64 * 1024):
+                        file.write(chunk)
+            return {"success": True, "data": file_path}
+        except httpx.ConnectError:
+            return {"success": False, "error": "Не удалось подключиться к серверу"}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    # ==================== HEALTH ====================
+    
+    async def health_check(self) -> Dict:
+        """Проверка работоспособности сервера"""
+        return await self._request("GET", "/api/health")
@@ -0,0 +1,150 @@
+"""
+Кэш ответов API на стороне клиента (справочники: профессии, услуги, мастера)
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class ResponseCache:
+    """
+    Версионированный LRU-кэш с TTL у каждой записи и объединением запросов.
+
+    Одновременные запросы с одним ключом объединяются: загрузку выполняет
+    первый, остальные ждут его результат. Изменение справочников клиентом
+    увеличивает версию и очищает кэш; результат загрузки, начатой до
+    изменения, не сохраняется.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # Ключ -> Future загрузки, которая сейчас выполняется
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_async: Dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        """Свежее значение из кэша (вызывается под блокировкой)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        return None
+
+    def _store(self, key: Hashable, value: Any, ttl_seconds: float, version: int):
+        """Сохранить значение, если кэш не сбрасывали с начала загрузки (под блокировкой)"""
+        if version != self.version or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        ttl_seconds: float,
+        loader: Callable[[], Any],
+        cacheable: Callable[[Any], bool] = lambda value: True
+    ) -> Any:
+        """Значение из кэша; при промахе - результат loader(), один на все одновременные вызовы"""
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                self.misses += 1
+                inflight = self._inflight[key] = Future()
+                version = self.version
+                leader = True
+        if not leader:
+            return inflight.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            inflight.set_exception(e)
+            raise
+
+        with self._lock:
+            if cacheable(value):
+                self._store(key, value, ttl_seconds, version)
+            del self._inflight[key]
+        inflight.set_result(value)
+        return value
+
+    async def get_or_load_async(
+        self,
+        key: Hashable,
+        ttl_seconds: float,
+        loader: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = lambda value: True
+    ) -> Any:
+        """То же, что get_or_load, для корутин одного цикла asyncio"""
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            inflight = self._inflight_async.get(key)
+            if inflight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                self.misses += 1
+                inflight = self._inflight_async[key] = asyncio.ensure_future(loader())
+                version = self.version
+                leader = True
+        if not leader:
+            # shield: отмена одного из ожидающих не должна отменять общую загрузку
+            return await asyncio.shield(inflight)
+
+        try:
+            value = await asyncio.shield(inflight)
+        finally:
+            with self._lock:
+                self._inflight_async.pop(key, None)
+        with self._lock:
+            if cacheable(value):
+                self._store(key, value, ttl_seconds, version)
+        return value
+
+    def invalidate(self):
+        """Сбросить кэш после изменения справочников"""
+        with self._lock:
+            self.version += 1
+            self.invalidations += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Счетчики для диагностики"""
+        with self._lock:
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,109 @@
+"""
+Списки карточек, которые обновляются по ключу, а не пересоздаются целиком
+"""
+from typing import Any, Callable, Dict, Hashable, List
+
+from PySide6.QtWidgets import QGridLayout, QLayout, QWidget
+
+
+class CardList:
+    """
+    Карточки (или кнопки) в раскладке, сопоставленные записям по ключу.
+
+    set_items сравнивает новый список записей с показанным: карточки
+    оставшихся записей сохраняются и обновляются, только если данные
+    изменились; карточки исчезнувших записей прячутся в пул и достаются
+    из него для новых записей. Карточка создается через create и
+    заполняется через update(карточка, запись).
+
+    В QBoxLayout карточки занимают первые позиции - надписи и растяжка,
+    добавленные после них, остаются в конце. В QGridLayout карточки
+    раскладываются по columns в ряд.
+    """
+
+    def __init__(
+        self,
+        layout: QLayout,
+        create: Callable[[], QWidget],
+        update: Callable[[QWidget, Any], None],
+        key: Callable[[Any], Hashable] = lambda item: item['id'],
+        columns: int = 1,
+        pool_size: int = 32
+    ):
+        self.layout = layout
+        self.create = create
+        self.update = update
+        self.key = key
+        self.columns = columns
+        self.pool_size = pool_size
+        self._widgets: Dict[Hashable, QWidget] = {}
+        self._items: Dict[Hashable, Any] = {}
+        self._pool: List[QWidget] = []
+        # Что изменил последний вызов set_items (для диагностики)
+        self.changes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+    def widget(self, key: Hashable) -> QWidget:
+        """Карточка записи с этим ключом"""
+        return self._widgets[key]
+
+    def _position(self, widget: QWidget):
+        index = self.layout.indexOf(widget)
+        if isinstance(self.layout, QGridLayout):
+            return self.layout.getItemPosition(index)[:2] if index >= 0 else None
+        return index
+
+    def _place(self, widget: QWidget, index: int):
+        """Поставить карточку на позицию index"""
+        self.layout.removeWidget(widget)
+        if isinstance(self.layout, QGridLayout):
+            self.layout.addWidget(widget, *divmod(index, self.columns))
+        else:
+            self.layout.insertWidget(index, widget)
+
+    def set_items(self, items: List[Any]):
+        """Привести карточки к новому списку записей"""
+        changes = dict.fromkeys(("created", "reused", "updated", "moved", "removed"), 0)
+        keys = [self.key(item) for item in items]
+
+        # Карточки исчезнувших записей - в пул
+        new_keys = set(keys)
+        for key in [key for key in self._widgets if key not in new_keys]:
+            widget = self._widgets.pop(key)
+            del self._items[key]
+            self.layout.removeWidget(widget)
+            widget.hide()
+            if len(self._pool) < self.pool_size:
+                self._pool.append(widget)
+            else:
+                widget.deleteLater()
+            changes["removed"] += 1
+
+        for index, (key, item) in enumerate(zip(keys, items)):
+            widget = self._widgets.get(key)
+            if widget is None:
+                if self._pool:
+                    widget = self._pool.pop()
+                    changes["reused"] += 1
+                else:
+                    widget = self.create()
+                    changes["created"] += 1
+                self._widgets[key] = widget
+                self._items[key] = item
+                self.update(widget, item)
+                self._place(widget, index)
+                widget.show()
+                continue
+
+            if self._items[key] != item:
+                self._items[key] = item
+                self.update(widget, item)
+                changes["updated"] += 1
+            target = divmod(index, self.columns) if isinstance(self.layout, QGridLayout) else index
+            if self._position(widget) != target:
+                self._place(widget, index)
+                changes["moved"] += 1
+
+        self.changes = changes
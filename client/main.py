@@ -5,6 +5,7 @@ BeautyPro Desktop Application
 import sys
 import os
 from datetime import datetime, date, timedelta
+from itertools import islice
 
 # Поддержка High DPI для Windows (до импорта Qt)
 os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
@@ -14,13 +15,19 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QFrame, QScrollArea, QGridLayout,
     QStackedWidget, QTabWidget, QMessageBox, QDialog, QComboBox,
-    QSpinBox, QTableWidget, QTableWidgetItem, QHeaderView, QListWidget,
+    QSpinBox, QHeaderView, QListWidget,
     QListWidgetItem, QCheckBox, QSizePolicy, QSpacerItem, QCalendarWidget
 )
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, QDate
-from PySide6.QtGui import QFont, QColor, QPalette, QIcon, QFontDatabase
+from PySide6.QtGui import QFont, QColor, QPalette, QIcon, QFontDatabase, QTextCharFormat
 
-from client.api_client import BeautyProAPI
+from client.api_client import APIError, BeautyProAPI
+from client.api_client_async import AsyncBeautyProAPI, async_client_available
+from client.cards import CardList
+from client.tables import (
+    ActionButtonsDelegate, DataTableView, HistoryTableModel, MastersTableModel, ServicesTableModel
+)
+from client.workers import RequestExecutor
 
 
 class Colors:
@@ -276,7 +283,7 @@ class Styles:
             color: white;
         }}
         
-        QTableWidget {{
+        DataTableView {{
             background-color: {Colors.WHITE};
             border: none;
             border-radius: 8px;
@@ -285,19 +292,19 @@ class Styles:
             alternate-background-color: {Colors.BACKGROUND};
         }}
         
-        QTableWidget::item {{
+        DataTableView::item {{
             padding: 12px;
             border-bottom: 1px solid {Colors.BORDER};
             color: {Colors.TEXT};
             background-color: {Colors.WHITE};
         }}
         
-        QTableWidget::item:selected {{
+        DataTableView::item:selected {{
             background-color: {Colors.PRIMARY_LIGHT};
             color: {Colors.TEXT};
         }}
         
-        QTableWidget::item:alternate {{
+        DataTableView::item:alternate {{
             background-color: {Colors.BACKGROUND};
             color: {Colors.TEXT};
         }}
@@ -466,9 +473,17 @@ class ModernInput(QLineEdit):
 class BeautyProApp(QMainWindow):
     """Главное приложение BeautyPro"""
     
+    # Сколько записей истории загружается за один запрос
+    HISTORY_PAGE_SIZE = 50
+    
     def __init__(self):
         super().__init__()
         self.api = BeautyProAPI()
+        # Справочники для диалогов загружаются одновременно асинхронным клиентом (нужен httpx)
+        self.async_api = AsyncBeautyProAPI(cache=self.api.cache) if async_client_available() else None
+        # Все запросы к серверу выполняются в пуле потоков, а не в потоке интерфейса
+        self.requests = RequestExecutor(self)
+        self.requests.busy_changed.connect(self.on_requests_busy)
         self.current_user = None
         self.selected_master = None
         self.selected_service = None
@@ -496,6 +511,82 @@ class BeautyProApp(QMainWindow):
         
         self.show_login()
     
+    def on_requests_busy(self, busy):
+        """Курсор ожидания, пока есть незавершенные запросы (интерфейс при этом доступен)"""
+        if busy:
+            self.setCursor(Qt.BusyCursor)
+        else:
+            self.unsetCursor()
+    
+    def loading_label(self):
+        """Надпись-заглушка на время загрузки данных"""
+        label = QLabel("Загрузка...")
+        label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 14px;")
+        label.setAlignment(Qt.AlignCenter)
+        return label
+    
+    def set_list_message(self, label, text="", color=Colors.TEXT_SECONDARY, font_size=14):
+        """Показать у списка надпись (загрузка, ошибка, пустой список) или скрыть ее, если text пуст"""
+        label.setText(text)
+        label.setStyleSheet(f"color: {color}; font-size: {font_size}px;")
+        label.setVisible(bool(text))
+    
+    def load_dialog_data(self, dialog, save_btn, **handlers):
+        """
+        Параллельно загрузить справочники для диалога (professions=..., services=...).
+        Обработчик получает список; кнопка сохранения доступна, когда загружено все.
+        """
+        loaders = {"professions": self.api.get_professions, "services": self.api.get_services}
+        pending = set(handlers)
+        save_btn.setEnabled(False)
+        
+        def make_callback(name, handler):
+            def callback(result):
+                handler(result["data"] if result["success"] else [])
+                pending.discard(name)
+                if not pending:
+                    save_btn.setEnabled(True)
+            return callback
+        
+        callbacks = {name: make_callback(name, handler) for name, handler in handlers.items()}
+        
+        if self.async_api is not None:
+            # Один вызов: запросы идут одновременно по keep-alive соединениям пула
+            def on_catalog(results):
+                for name, callback in callbacks.items():
+                    # Если весь вызов завершился ошибкой, results - сама ошибка
+                    callback(results.get(name, results))
+            
+            self.requests.submit(
+                "dialog_data", self.async_api.get_catalog, *handlers, owner=dialog,
+                on_result=on_catalog
+            )
+            return
+        
+        for name, callback in callbacks.items():
+            self.requests.submit(f"dialog_{name}", loaders[name], owner=dialog, on_result=callback)
+    
+    def cancel_dialog_data(self):
+        """Отбросить загрузку справочников закрытого диалога"""
+        self.requests.cancel("dialog_data")
+        self.requests.cancel("dialog_professions")
+        self.requests.cancel("dialog_services")
+    
+    def submit_dialog_save(self, dialog, save_btn, message, reload, call, *args):
+        """Сохранить данные диалога в фоне; кнопка заблокирована до ответа сервера"""
+        save_btn.setEnabled(False)
+        
+        def on_saved(result):
+            if result["success"]:
+                self.styled_info(dialog, "Успех", message)
+                dialog.accept()
+                reload()
+            else:
+                save_btn.setEnabled(True)
+                QMessageBox.critical(dialog, "Ошибка", result["error"])
+        
+        self.requests.submit("dialog_save", call, *args, on_result=on_saved)
+    
     def show_login(self):
         """Показать экран входа"""
         self.central_widget.setCurrentWidget(self.login_screen)
@@ -693,6 +784,7 @@ class BeautyProApp(QMainWindow):
         """)
         login_btn.clicked.connect(self.do_login)
         form_layout.addWidget(login_btn)
+        self.login_btn = login_btn
         
         # Ссылка на регистрацию
         form_layout.addSpacing(16)
@@ -853,6 +945,7 @@ class BeautyProApp(QMainWindow):
         """)
         reg_btn.clicked.connect(self.do_register)
         form_layout.addWidget(reg_btn)
+        self.register_btn = reg_btn
         
         back_btn = ModernButton("← Назад к входу", "secondary")
         back_btn.setStyleSheet(f"""
@@ -886,7 +979,15 @@ class BeautyProApp(QMainWindow):
             QMessageBox.warning(self, "Внимание", "Заполните все поля")
             return
         
-        result = self.api.login(phone, password)
+        # Проверка пароля (bcrypt) на сервере занимает заметное время
+        self.login_btn.setEnabled(False)
+        self.login_btn.setText("Вход...")
+        self.requests.submit("auth", self.api.login, phone, password, on_result=self.on_login_finished)
+    
+    def on_login_finished(self, result):
+        """Обработать ответ на вход"""
+        self.login_btn.setEnabled(True)
+        self.login_btn.setText("Войти →")
         
         if result["success"]:
             self.current_user = result["data"]
@@ -907,7 +1008,12 @@ class BeautyProApp(QMainWindow):
             QMessageBox.warning(self, "Внимание", "Заполните все поля")
             return
         
-        result = self.api.register(phone, password, name)
+        self.register_btn.setEnabled(False)
+        self.requests.submit("auth", self.api.register, phone, password, name, on_result=self.on_register_finished)
+    
+    def on_register_finished(self, result):
+        """Обработать ответ на регистрацию"""
+        self.register_btn.setEnabled(True)
         
         if result["success"]:
             QMessageBox.information(self, "Успех", "Регистрация успешна! Теперь вы можете войти.")
@@ -917,6 +1023,9 @@ class BeautyProApp(QMainWindow):
     
     def logout(self):
         """Выйти из аккаунта"""
+        # Ответы на запросы прежнего пользователя больше не нужны
+        self.requests.cancel_all()
+        self.api.logout()
         self.current_user = None
         self.selected_master = None
         self.selected_service = None
@@ -1038,6 +1147,8 @@ class BeautyProApp(QMainWindow):
         
         # Стек для переключения между экранами
         self.booking_stack = QStackedWidget()
+        # Экраны списков мастеров и услуг: создаются один раз, затем обновляются
+        self.booking_lists = {}
         layout.addWidget(self.booking_stack)
         
         # Экран выбора способа записи
@@ -1115,123 +1226,156 @@ class BeautyProApp(QMainWindow):
         
         return widget
     
-    def show_masters_list(self):
-        """Показать список мастеров"""
-        # Удаляем ВСЕ виджеты кроме первого (choice screen)
-        while self.booking_stack.count() > 1:
-            old_widget = self.booking_stack.widget(1)
+    def close_booking_screens(self, keep=1):
+        """Убрать из стека экраны записи после первых keep (экраны списков не удаляются)"""
+        list_screens = [screen for screen, _, _ in self.booking_lists.values()]
+        while self.booking_stack.count() > keep:
+            old_widget = self.booking_stack.widget(keep)
             self.booking_stack.removeWidget(old_widget)
-            old_widget.deleteLater()
+            if not any(old_widget is screen for screen in list_screens):
+                old_widget.deleteLater()
+    
+    def booking_list_screen(self, name, title_text, create_card, update_card, columns, spacing, margins=None):
+        """
+        Показать экран списка (мастера или услуги) в стеке записи. Экран создается
+        при первом показе; при следующих карточки обновляются по ответу сервера.
+        """
+        self.close_booking_screens()
         
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
+        if name not in self.booking_lists:
+            widget = QWidget()
+            layout = QVBoxLayout(widget)
+            
+            # Заголовок с кнопкой назад
+            header = QWidget()
+            header_layout = QHBoxLayout(header)
+            header_layout.setContentsMargins(0, 0, 0, 0)
+            
+            back_btn = ModernButton("← Назад", "secondary")
+            back_btn.setFixedWidth(140)
+            back_btn.clicked.connect(lambda: self.booking_stack.setCurrentIndex(0))
+            header_layout.addWidget(back_btn)
+            
+            title = QLabel(title_text)
+            title.setFont(QFont("Arial", 18, QFont.Bold))
+            title.setStyleSheet(f"color: {Colors.PRIMARY};")
+            header_layout.addWidget(title)
+            header_layout.addStretch()
+            
+            layout.addWidget(header)
+            
+            # Загрузка, ошибка или пустой список
+            message = self.loading_label()
+            layout.addWidget(message)
+            
+            # Скролл-область
+            scroll = QScrollArea()
+            scroll.setWidgetResizable(True)
+            scroll.setStyleSheet("background-color: transparent;")
+            
+            scroll_content = QWidget()
+            grid = QGridLayout(scroll_content)
+            grid.setSpacing(spacing)
+            if margins is not None:
+                grid.setContentsMargins(margins, margins, margins, margins)
+            
+            scroll.setWidget(scroll_content)
+            layout.addWidget(scroll)
+            
+            cards = CardList(grid, create_card, update_card, columns=columns)
+            self.booking_lists[name] = (widget, cards, message)
         
-        # Заголовок с кнопкой назад
-        header = QWidget()
-        header_layout = QHBoxLayout(header)
-        header_layout.setContentsMargins(0, 0, 0, 0)
+        widget, cards, message = self.booking_lists[name]
+        # Карточки прошлого показа остаются до ответа сервера
+        if not len(cards):
+            self.set_list_message(message, "Загрузка...")
         
-        back_btn = ModernButton("← Назад", "secondary")
-        back_btn.setFixedWidth(140)
-        back_btn.clicked.connect(lambda: self.booking_stack.setCurrentIndex(0))
-        header_layout.addWidget(back_btn)
+        self.booking_stack.addWidget(widget)
+        self.booking_stack.setCurrentIndex(1)
+        return widget
+    
+    def fill_booking_list(self, name, result, error_text, empty_text):
+        """Обновить карточки экрана списка, когда пришел ответ сервера"""
+        _, cards, message = self.booking_lists[name]
         
-        title = QLabel("Выберите мастера")
-        title.setFont(QFont("Arial", 18, QFont.Bold))
-        title.setStyleSheet(f"color: {Colors.PRIMARY};")
-        header_layout.addWidget(title)
-        header_layout.addStretch()
+        if not result["success"]:
+            cards.set_items([])
+            self.set_list_message(message, error_text, Colors.DANGER)
+            return
         
-        layout.addWidget(header)
+        cards.set_items(result["data"])
+        self.set_list_message(message, "" if result["data"] else empty_text)
+    
+    def show_masters_list(self):
+        """Показать список мастеров"""
+        widget = self.booking_list_screen(
+            "masters", "Выберите мастера", self.create_master_card, self.update_master_card,
+            columns=5, spacing=8, margins=5
+        )
         
         # Загружаем мастеров
-        result = self.api.get_masters()
-        
-        if not result["success"]:
-            error_label = QLabel("Ошибка загрузки мастеров")
-            error_label.setStyleSheet(f"color: {Colors.DANGER};")
-            layout.addWidget(error_label)
-        else:
-            masters = result["data"]
-            
-            if not masters:
-                empty_label = QLabel("Нет доступных мастеров")
-                empty_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
-                layout.addWidget(empty_label)
-            else:
-                # Скролл-область
-                scroll = QScrollArea()
-                scroll.setWidgetResizable(True)
-                scroll.setStyleSheet("background-color: transparent;")
-                
-                scroll_content = QWidget()
-                grid = QGridLayout(scroll_content)
-                grid.setSpacing(8)
-                grid.setContentsMargins(5, 5, 5, 5)
-                
-                cols = 5
-                for i, master in enumerate(masters):
-                    row = i // cols
-                    col = i % cols
-                    
-                    card = Card(clickable=True, padding=10)
-                    card.setFixedSize(170, 150)
-                    card_layout = QVBoxLayout(card)
-                    card_layout.setAlignment(Qt.AlignCenter)
-                    
-                    card_layout.setSpacing(2)
-                    card_layout.setContentsMargins(5, 5, 5, 5)
-                    
-                    avatar = QLabel("👨‍🎨")
-                    avatar.setFont(QFont("Arial", 24))
-                    avatar.setAlignment(Qt.AlignCenter)
-                    card_layout.addWidget(avatar)
-                    
-                    name = QLabel(master['full_name'])
-                    name.setFont(QFont("Arial", 11, QFont.Bold))
-                    name.setWordWrap(True)
-                    name.setAlignment(Qt.AlignCenter)
-                    card_layout.addWidget(name)
-                    
-                    profession = master.get('profession', {}).get('name', '') if master.get('profession') else ''
-                    prof_label = QLabel(profession)
-                    prof_label.setFont(QFont("Arial", 9))
-                    prof_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
-                    prof_label.setAlignment(Qt.AlignCenter)
-                    card_layout.addWidget(prof_label)
-                    
-                    services_count = len(master.get('services', []))
-                    services_label = QLabel(f"{services_count} услуг")
-                    services_label.setFont(QFont("Arial", 9))
-                    services_label.setStyleSheet(f"color: {Colors.PRIMARY};")
-                    services_label.setAlignment(Qt.AlignCenter)
-                    card_layout.addWidget(services_label)
-                    
-                    card.clicked.connect(lambda m=master: self.select_master(m))
-                    grid.addWidget(card, row, col)
-                
-                scroll.setWidget(scroll_content)
-                layout.addWidget(scroll)
-        
-        self.booking_stack.addWidget(widget)
-        self.booking_stack.setCurrentIndex(1)
+        self.requests.submit(
+            "booking_list", self.api.get_masters, owner=widget,
+            on_result=lambda result: self.fill_booking_list(
+                "masters", result, "Ошибка загрузки мастеров", "Нет доступных мастеров"
+            )
+        )
+    
+    def create_master_card(self):
+        """Карточка мастера; данные подставляет update_master_card"""
+        card = Card(clickable=True, padding=10)
+        card.setFixedSize(170, 150)
+        card_layout = QVBoxLayout(card)
+        card_layout.setAlignment(Qt.AlignCenter)
+        
+        card_layout.setSpacing(2)
+        card_layout.setContentsMargins(5, 5, 5, 5)
+        
+        avatar = QLabel("👨‍🎨")
+        avatar.setFont(QFont("Arial", 24))
+        avatar.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(avatar)
+        
+        card.name_label = QLabel()
+        card.name_label.setFont(QFont("Arial", 11, QFont.Bold))
+        card.name_label.setWordWrap(True)
+        card.name_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(card.name_label)
+        
+        card.prof_label = QLabel()
+        card.prof_label.setFont(QFont("Arial", 9))
+        card.prof_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        card.prof_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(card.prof_label)
+        
+        card.services_label = QLabel()
+        card.services_label.setFont(QFont("Arial", 9))
+        card.services_label.setStyleSheet(f"color: {Colors.PRIMARY};")
+        card.services_label.setAlignment(Qt.AlignCenter)
+        card_layout.addWidget(card.services_label)
+        
+        card.clicked.connect(lambda: self.select_master(card.master))
+        return card
+    
+    def update_master_card(self, card, master):
+        """Показать в карточке данные мастера"""
+        card.master = master
+        card.name_label.setText(master['full_name'])
+        profession = master.get('profession', {}).get('name', '') if master.get('profession') else ''
+        card.prof_label.setText(profession)
+        services_count = len(master.get('services', []))
+        card.services_label.setText(f"{services_count} услуг")
     
     def go_back_to_masters(self):
         """Вернуться к списку мастеров"""
         # Удаляем виджеты выше индекса 1
-        while self.booking_stack.count() > 2:
-            old_widget = self.booking_stack.widget(2)
-            self.booking_stack.removeWidget(old_widget)
-            old_widget.deleteLater()
+        self.close_booking_screens(2)
         self.booking_stack.setCurrentIndex(1)
     
     def go_back_to_services(self):
         """Вернуться к списку услуг"""
         # Удаляем виджеты выше индекса 1
-        while self.booking_stack.count() > 2:
-            old_widget = self.booking_stack.widget(2)
-            self.booking_stack.removeWidget(old_widget)
-            old_widget.deleteLater()
+        self.close_booking_screens(2)
         self.booking_stack.setCurrentIndex(1)
     
     def select_master(self, master):
@@ -1319,80 +1463,41 @@ class BeautyProApp(QMainWindow):
     
     def show_services_list(self):
         """Показать список услуг"""
-        # Удаляем ВСЕ виджеты кроме первого (choice screen)
-        while self.booking_stack.count() > 1:
-            old_widget = self.booking_stack.widget(1)
-            self.booking_stack.removeWidget(old_widget)
-            old_widget.deleteLater()
-        
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        header = QWidget()
-        header_layout = QHBoxLayout(header)
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        
-        back_btn = ModernButton("← Назад", "secondary")
-        back_btn.setFixedWidth(140)
-        back_btn.clicked.connect(lambda: self.booking_stack.setCurrentIndex(0))
-        header_layout.addWidget(back_btn)
+        widget = self.booking_list_screen(
+            "services", "Выберите услугу", self.create_service_card, self.update_service_card,
+            columns=3, spacing=15
+        )
         
-        title = QLabel("Выберите услугу")
-        title.setFont(QFont("Arial", 18, QFont.Bold))
-        title.setStyleSheet(f"color: {Colors.PRIMARY};")
-        header_layout.addWidget(title)
-        header_layout.addStretch()
+        self.requests.submit(
+            "booking_list", self.api.get_services, owner=widget,
+            on_result=lambda result: self.fill_booking_list(
+                "services", result, "Ошибка загрузки услуг", "Нет доступных услуг"
+            )
+        )
+    
+    def create_service_card(self):
+        """Карточка услуги; данные подставляет update_service_card"""
+        card = Card(clickable=True)
+        card.setMinimumHeight(120)
+        card_layout = QVBoxLayout(card)
         
-        layout.addWidget(header)
+        card.name_label = QLabel()
+        card.name_label.setFont(QFont("Arial", 13, QFont.Bold))
+        card.name_label.setWordWrap(True)
+        card_layout.addWidget(card.name_label)
         
-        result = self.api.get_services()
+        card.details_label = QLabel()
+        card.details_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        card_layout.addWidget(card.details_label)
         
-        if not result["success"]:
-            error_label = QLabel("Ошибка загрузки услуг")
-            error_label.setStyleSheet(f"color: {Colors.DANGER};")
-            layout.addWidget(error_label)
-        else:
-            services = result["data"]
-            
-            if not services:
-                empty_label = QLabel("Нет доступных услуг")
-                empty_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
-                layout.addWidget(empty_label)
-            else:
-                scroll = QScrollArea()
-                scroll.setWidgetResizable(True)
-                scroll.setStyleSheet("background-color: transparent;")
-                
-                scroll_content = QWidget()
-                grid = QGridLayout(scroll_content)
-                grid.setSpacing(15)
-                
-                cols = 3
-                for i, service in enumerate(services):
-                    row = i // cols
-                    col = i % cols
-                    
-                    card = Card(clickable=True)
-                    card.setMinimumHeight(120)
-                    card_layout = QVBoxLayout(card)
-                    
-                    name = QLabel(service['name'])
-                    name.setFont(QFont("Arial", 13, QFont.Bold))
-                    name.setWordWrap(True)
-                    card_layout.addWidget(name)
-                    
-                    details = QLabel(f"{service['price']} руб. • {service['duration_minutes']} мин.")
-                    details.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
-                    card_layout.addWidget(details)
-                    
-                    card.clicked.connect(lambda s=service: self.select_service_and_show_service_masters(s))
-                    grid.addWidget(card, row, col)
-                
-                scroll.setWidget(scroll_content)
-                layout.addWidget(scroll)
-        
-        self.booking_stack.addWidget(widget)
-        self.booking_stack.setCurrentIndex(1)
+        card.clicked.connect(lambda: self.select_service_and_show_service_masters(card.service))
+        return card
+    
+    def update_service_card(self, card, service):
+        """Показать в карточке данные услуги"""
+        card.service = service
+        card.name_label.setText(service['name'])
+        card.details_label.setText(f"{service['price']} руб. • {service['duration_minutes']} мин.")
     
     def select_service_and_show_service_masters(self, service):
         """Выбрать услугу и показать мастеров"""
@@ -1426,7 +1531,19 @@ class BeautyProApp(QMainWindow):
         
         layout.addWidget(header)
         
-        result = self.api.get_service_masters(self.selected_service['id'])
+        loading = self.loading_label()
+        layout.addWidget(loading)
+        self.requests.submit(
+            "booking_detail", self.api.get_service_masters, self.selected_service['id'], owner=widget,
+            on_result=lambda result: self.fill_service_masters(layout, loading, result)
+        )
+        
+        self.booking_stack.addWidget(widget)
+        self.booking_stack.setCurrentIndex(2)
+    
+    def fill_service_masters(self, layout, loading, result):
+        """Заполнить список мастеров услуги, когда пришел ответ сервера"""
+        loading.deleteLater()
         
         if not result["success"]:
             error_label = QLabel("Ошибка загрузки мастеров")
@@ -1477,9 +1594,6 @@ class BeautyProApp(QMainWindow):
                 
                 scroll.setWidget(scroll_content)
                 layout.addWidget(scroll)
-        
-        self.booking_stack.addWidget(widget)
-        self.booking_stack.setCurrentIndex(2)
     
     def select_master_and_show_calendar(self, master):
         """Выбрать мастера и показать календарь"""
@@ -1648,6 +1762,16 @@ class BeautyProApp(QMainWindow):
         self.time_layout = QVBoxLayout(self.time_container)
         self.time_layout.setSpacing(8)
         self.time_layout.setContentsMargins(12, 12, 12, 12)
+        # Кнопки слотов переиспользуются при смене даты; под ними - надпись
+        self.slot_buttons = CardList(
+            self.time_layout,
+            lambda: self.create_slot_button(dialog),
+            self.update_slot_button,
+            key=lambda time_str: time_str
+        )
+        self.time_message = self.loading_label()
+        self.time_layout.addWidget(self.time_message)
+        self.time_layout.addStretch()
         self.time_scroll.setWidget(self.time_container)
         right_layout.addWidget(self.time_scroll)
         
@@ -1664,18 +1788,20 @@ class BeautyProApp(QMainWindow):
         
         layout.addWidget(right)
         
-        # Загружаем слоты для выбранной даты
+        # Загружаем слоты на весь диапазон календаря и показываем выбранную дату
         self.selected_slot = None
+        self.load_calendar_availability()
         self.load_time_slots(dialog)
         
         result = dialog.exec()
         
+        # Слоты закрытого диалога больше не нужны
+        self.requests.cancel("calendar")
+        self.requests.cancel("time_slots")
+        
         # Если диалог закрыт без записи - очищаем стек
         if result == QDialog.Rejected:
-            while self.booking_stack.count() > 1:
-                widget = self.booking_stack.widget(1)
-                self.booking_stack.removeWidget(widget)
-                widget.deleteLater()
+            self.close_booking_screens()
             self.booking_stack.setCurrentIndex(0)
             self.selected_master = None
             self.selected_service = None
@@ -1685,30 +1811,95 @@ class BeautyProApp(QMainWindow):
         if hasattr(self, 'dialog_ref') and self.dialog_ref:
             self.load_time_slots(self.dialog_ref)
     
+    def load_calendar_availability(self):
+        """Загрузить слоты на весь диапазон календаря одним запросом и отметить занятые дни"""
+        self.slots_by_date = {}
+        
+        self.requests.submit(
+            "calendar",
+            self.api.get_available_slots_range,
+            self.selected_master['id'],
+            self.selected_service['id'],
+            self.calendar.minimumDate().toPython(),
+            self.calendar.maximumDate().toPython(),
+            owner=self.calendar,
+            on_result=self.apply_calendar_availability
+        )
+    
+    def apply_calendar_availability(self, result):
+        """Разложить слоты диапазона по дням, отметить занятые дни и показать выбранную дату"""
+        if not result["success"]:
+            # Слоты выбранной даты будут запрошены отдельно
+            self.load_time_slots(self.dialog_ref)
+            return
+        
+        # Полностью занятые дни показываем приглушенным цветом
+        booked_format = QTextCharFormat()
+        booked_format.setForeground(QColor(Colors.TEXT_MUTED))
+        booked_format.setBackground(QColor(Colors.BORDER_LIGHT))
+        
+        for day in result["data"]["days"]:
+            day_date = date.fromisoformat(day["date"])
+            self.slots_by_date[day_date] = day["slots"]
+            if day["free_count"] == 0:
+                self.calendar.setDateTextFormat(
+                    QDate(day_date.year, day_date.month, day_date.day),
+                    booked_format
+                )
+        
+        self.load_time_slots(self.dialog_ref)
+    
+    def create_slot_button(self, dialog):
+        """Кнопка слота; время подставляет update_slot_button"""
+        btn = ModernButton("", "secondary")
+        btn.clicked.connect(lambda checked: self.select_slot_and_confirm(btn.time_str, dialog))
+        return btn
+    
+    def update_slot_button(self, btn, time_str):
+        """Показать на кнопке время слота"""
+        btn.time_str = time_str
+        btn.setText(f"🕐  {time_str}")
+    
     def load_time_slots(self, dialog):
         """Загрузить временные слоты"""
-        # Очищаем предыдущие слоты
-        while self.time_layout.count():
-            item = self.time_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Ответ на запрос слотов прежней даты уже не нужен
+        self.requests.cancel("time_slots")
         
         selected_date = self.calendar.selectedDate().toPython()
         
-        result = self.api.get_available_slots(
+        # Слоты дня обычно уже загружены вместе со всем диапазоном календаря
+        if selected_date in getattr(self, 'slots_by_date', {}):
+            self.show_time_slots(dialog, self.slots_by_date[selected_date])
+            return
+        
+        # Слоты прежней даты нельзя оставлять: по ним записали бы на новую дату
+        self.slot_buttons.set_items([])
+        self.set_list_message(self.time_message, "Загрузка...")
+        
+        if self.requests.is_pending("calendar"):
+            return  # Слоты придут вместе со всем диапазоном
+        
+        self.requests.submit(
+            "time_slots",
+            self.api.get_available_slots,
             self.selected_master['id'],
             self.selected_service['id'],
-            selected_date
+            selected_date,
+            owner=dialog,
+            on_result=lambda result: self.on_time_slots_loaded(dialog, result)
         )
-        
+    
+    def on_time_slots_loaded(self, dialog, result):
+        """Показать слоты, полученные отдельным запросом"""
         if not result["success"]:
-            error_label = QLabel("Ошибка загрузки")
-            error_label.setStyleSheet(f"color: {Colors.DANGER};")
-            self.time_layout.addWidget(error_label)
+            self.slot_buttons.set_items([])
+            self.set_list_message(self.time_message, "Ошибка загрузки", Colors.DANGER)
             return
         
-        data = result["data"]
-        
+        self.show_time_slots(dialog, result["data"])
+    
+    def show_time_slots(self, dialog, data):
+        """Показать кнопки свободного времени"""
         # Обрабатываем разные форматы ответа API
         # Может быть: список ["10:00", "11:00"] или dict {"date": "...", "slots": [...]}
         if isinstance(data, dict):
@@ -1718,28 +1909,21 @@ class BeautyProApp(QMainWindow):
         else:
             slots = []
         
-        if not slots:
-            empty_label = QLabel("Нет доступного времени на эту дату")
-            empty_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 14px;")
-            empty_label.setAlignment(Qt.AlignCenter)
-            self.time_layout.addWidget(empty_label)
-            return
+        # slot может быть строкой "10:00" или dict {'time': '10:00'}
+        times = [
+            slot.get('time', str(slot)) if isinstance(slot, dict) else str(slot)
+            for slot in slots
+        ]
         
-        for slot in slots:
-            # slot может быть строкой "10:00" или dict {'time': '10:00'}
-            if isinstance(slot, dict):
-                time_str = slot.get('time', str(slot))
-            else:
-                time_str = str(slot)
-            
-            btn = ModernButton(f"🕐  {time_str}", "secondary")
-            btn.clicked.connect(lambda checked, s=time_str: self.select_slot_and_confirm(s, dialog))
-            self.time_layout.addWidget(btn)
-        
-        self.time_layout.addStretch()
+        # Кнопки совпадающего времени остаются на месте
+        self.slot_buttons.set_items(times)
+        self.set_list_message(self.time_message, "" if times else "Нет доступного времени на эту дату")
     
     def select_slot_and_confirm(self, slot, dialog):
         """Выбрать слот и подтвердить запись"""
+        if self.requests.is_pending("booking"):
+            return  # Предыдущая запись еще создается
+        
         selected_date = self.calendar.selectedDate().toPython()
         
         # slot теперь строка времени "10:00"
@@ -1764,29 +1948,35 @@ class BeautyProApp(QMainWindow):
                 datetime.strptime(time_str, '%H:%M').time()
             )
             
-            result = self.api.create_appointment(
+            self.requests.submit(
+                "booking",
+                self.api.create_appointment,
                 self.current_user['id'],
                 self.selected_master['id'],
                 self.selected_service['id'],
-                appointment_datetime
+                appointment_datetime,
+                owner=dialog,
+                on_result=lambda result: self.on_appointment_created(dialog, result)
             )
-            
-            if result["success"]:
-                self.styled_info(dialog, "Успех", "Запись успешно создана!")
-                dialog.accept()
-                # Очищаем все промежуточные виджеты из стека
-                while self.booking_stack.count() > 1:
-                    widget = self.booking_stack.widget(1)
-                    self.booking_stack.removeWidget(widget)
-                    widget.deleteLater()
-                self.booking_stack.setCurrentIndex(0)
-                self.selected_master = None
-                self.selected_service = None
-                # Обновляем записи и историю
-                self.load_appointments()
-                self.load_history()
-            else:
-                QMessageBox.critical(dialog, "Ошибка", result["error"])
+    
+    def on_appointment_created(self, dialog, result):
+        """Обработать ответ на создание записи"""
+        if result["success"]:
+            self.styled_info(dialog, "Успех", "Запись успешно создана!")
+            dialog.accept()
+            # Очищаем все промежуточные виджеты из стека
+            self.close_booking_screens()
+            self.booking_stack.setCurrentIndex(0)
+            self.selected_master = None
+            self.selected_service = None
+            # Обновляем записи и историю
+            self.load_appointments()
+            self.load_history()
+        else:
+            QMessageBox.critical(dialog, "Ошибка", result["error"])
+            # Слот мог занять другой клиент - обновляем доступное время
+            self.load_calendar_availability()
+            self.load_time_slots(dialog)
     
     def create_appointments_tab(self):
         """Создать вкладку записей"""
@@ -1830,6 +2020,13 @@ class BeautyProApp(QMainWindow):
         # Контейнер для записей
         self.appointments_container = QWidget()
         self.appointments_layout = QVBoxLayout(self.appointments_container)
+        # Карточки записей обновляются по id; под ними - надпись о загрузке или ошибке
+        self.appointment_cards = CardList(
+            self.appointments_layout, self.create_appointment_card, self.update_appointment_card
+        )
+        self.appointments_message = self.loading_label()
+        self.appointments_layout.addWidget(self.appointments_message)
+        self.appointments_layout.addStretch()
         
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1844,87 +2041,99 @@ class BeautyProApp(QMainWindow):
     
     def load_appointments(self):
         """Загрузить записи"""
-        # Очищаем
-        while self.appointments_layout.count():
-            item = self.appointments_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        result = self.api.get_appointments(self.current_user['id'], upcoming_only=True)
-        
+        # Карточки остаются на месте до ответа сервера
+        if not len(self.appointment_cards):
+            self.set_list_message(self.appointments_message, "Загрузка...")
+        
+        self.requests.submit(
+            "appointments",
+            self.api.get_appointments,
+            self.current_user['id'],
+            upcoming_only=True,
+            owner=self.appointments_container,
+            on_result=self.show_appointments
+        )
+    
+    def show_appointments(self, result):
+        """Показать предстоящие записи: меняются только карточки изменившихся записей"""
         if not result["success"]:
-            error_label = QLabel("Ошибка загрузки записей")
-            error_label.setStyleSheet(f"color: {Colors.DANGER};")
-            self.appointments_layout.addWidget(error_label)
+            self.appointment_cards.set_items([])
+            self.set_list_message(self.appointments_message, "Ошибка загрузки записей", Colors.DANGER)
             return
         
         appointments = result["data"]
+        self.appointment_cards.set_items(appointments)
         
-        if not appointments:
-            empty_label = QLabel("У вас пока нет предстоящих записей")
-            empty_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 16px;")
-            empty_label.setAlignment(Qt.AlignCenter)
-            self.appointments_layout.addWidget(empty_label)
-            self.appointments_layout.setAlignment(Qt.AlignCenter)
-            return
+        if appointments:
+            self.set_list_message(self.appointments_message)
+        else:
+            self.set_list_message(self.appointments_message, "У вас пока нет предстоящих записей", font_size=16)
+    
+    def create_appointment_card(self):
+        """Карточка записи; данные подставляет update_appointment_card"""
+        card = Card()
+        card_layout = QHBoxLayout(card)
         
-        for appointment in appointments:
-            card = Card()
-            card_layout = QHBoxLayout(card)
-            
-            # Информация
-            info = QWidget()
-            info_layout = QVBoxLayout(info)
-            info_layout.setContentsMargins(0, 0, 0, 0)
-            
-            service_name = appointment.get('service', {}).get('name', 'Услуга')
-            master_name = appointment.get('master', {}).get('full_name', 'Мастер')
-            
-            service_label = QLabel(service_name)
-            service_label.setFont(QFont("Arial", 14, QFont.Bold))
-            info_layout.addWidget(service_label)
-            
-            master_label = QLabel(f"Мастер: {master_name}")
-            info_layout.addWidget(master_label)
-            
-            dt = datetime.fromisoformat(appointment['appointment_datetime'].replace('Z', '+00:00'))
-            date_label = QLabel(f"Дата: {dt.strftime('%d.%m.%Y')} в {dt.strftime('%H:%M')}")
-            date_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
-            info_layout.addWidget(date_label)
-            
-            card_layout.addWidget(info)
-            card_layout.addStretch()
-            
-            # Кнопка отмены
-            if appointment.get('status') == 'scheduled':
-                cancel_btn = ModernButton("Отменить", "danger")
-                cancel_btn.setFixedWidth(140)
-                cancel_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #EF4444, stop:1 #DC2626);
-                        color: white;
-                        font-weight: bold;
-                        font-size: 13px;
-                        padding: 10px 16px;
-                        border-radius: 8px;
-                        border: none;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #DC2626, stop:1 #B91C1C);
-                    }
-                    QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #B91C1C, stop:1 #991B1B);
-                    }
-                """)
-                cancel_btn.clicked.connect(lambda checked, a=appointment: self.cancel_appointment(a))
-                card_layout.addWidget(cancel_btn)
-            
-            self.appointments_layout.addWidget(card)
+        # Информация
+        info = QWidget()
+        info_layout = QVBoxLayout(info)
+        info_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.appointments_layout.addStretch()
+        card.service_label = QLabel()
+        card.service_label.setFont(QFont("Arial", 14, QFont.Bold))
+        info_layout.addWidget(card.service_label)
+        
+        card.master_label = QLabel()
+        info_layout.addWidget(card.master_label)
+        
+        card.date_label = QLabel()
+        card.date_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        info_layout.addWidget(card.date_label)
+        
+        card_layout.addWidget(info)
+        card_layout.addStretch()
+        
+        # Кнопка отмены (только для запланированных записей)
+        card.cancel_btn = ModernButton("Отменить", "danger")
+        card.cancel_btn.setFixedWidth(140)
+        card.cancel_btn.setStyleSheet("""
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #EF4444, stop:1 #DC2626);
+                color: white;
+                font-weight: bold;
+                font-size: 13px;
+                padding: 10px 16px;
+                border-radius: 8px;
+                border: none;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #DC2626, stop:1 #B91C1C);
+            }
+            QPushButton:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #B91C1C, stop:1 #991B1B);
+            }
+        """)
+        card.cancel_btn.clicked.connect(lambda checked: self.cancel_appointment(card.appointment))
+        card_layout.addWidget(card.cancel_btn)
+        
+        return card
+    
+    def update_appointment_card(self, card, appointment):
+        """Показать в карточке данные записи"""
+        card.appointment = appointment
+        
+        service_name = appointment.get('service', {}).get('name', 'Услуга')
+        master_name = appointment.get('master', {}).get('full_name', 'Мастер')
+        card.service_label.setText(service_name)
+        card.master_label.setText(f"Мастер: {master_name}")
+        
+        dt = datetime.fromisoformat(appointment['appointment_datetime'].replace('Z', '+00:00'))
+        card.date_label.setText(f"Дата: {dt.strftime('%d.%m.%Y')} в {dt.strftime('%H:%M')}")
+        
+        card.cancel_btn.setVisible(appointment.get('status') == 'scheduled')
     
     def refresh_appointments(self, layout):
         """Обновить записи"""
@@ -1939,14 +2148,22 @@ class BeautyProApp(QMainWindow):
         )
         
         if confirm:
-            result = self.api.cancel_appointment(appointment['id'], self.current_user['id'])
-            
-            if result["success"]:
-                QMessageBox.information(self, "Успех", "Запись отменена")
-                self.load_appointments()
-                self.load_history()
-            else:
-                QMessageBox.critical(self, "Ошибка", result["error"])
+            self.requests.submit(
+                f"cancel_appointment_{appointment['id']}",
+                self.api.cancel_appointment,
+                appointment['id'],
+                self.current_user['id'],
+                on_result=self.on_appointment_canceled
+            )
+    
+    def on_appointment_canceled(self, result):
+        """Обработать ответ на отмену записи"""
+        if result["success"]:
+            QMessageBox.information(self, "Успех", "Запись отменена")
+            self.load_appointments()
+            self.load_history()
+        else:
+            QMessageBox.critical(self, "Ошибка", result["error"])
     
     def create_history_tab(self):
         """Создать вкладку истории"""
@@ -1991,10 +2208,10 @@ class BeautyProApp(QMainWindow):
         
         layout.addWidget(header)
         
-        # Таблица
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels(["Дата", "Время", "Услуга", "Мастер", "Статус"])
+        # Таблица: страницы подгружаются моделью, когда таблица прокручена до конца
+        self.history_model = HistoryTableModel(self.load_more_history, self)
+        self.history_table = DataTableView()
+        self.history_table.setModel(self.history_model)
         # Настраиваем ширину колонок
         header = self.history_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Дата
@@ -2002,9 +2219,10 @@ class BeautyProApp(QMainWindow):
         header.setSectionResizeMode(2, QHeaderView.Stretch)           # Услуга
         header.setSectionResizeMode(3, QHeaderView.Stretch)           # Мастер
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Статус
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.history_table.setSelectionBehavior(DataTableView.SelectRows)
+        self.history_table.setEditTriggers(DataTableView.NoEditTriggers)
         self.history_table.setAlternatingRowColors(True)
+        self.history_iter = None
         
         layout.addWidget(self.history_table)
         
@@ -2024,47 +2242,69 @@ class BeautyProApp(QMainWindow):
         return tab
     
     def load_history(self):
-        """Загрузить историю записей"""
+        """Загрузить историю записей: первую страницу, остальные - при прокрутке вниз"""
         if not hasattr(self, 'history_table'):
             return
-            
-        result = self.api.get_appointments(self.current_user['id'])
         
-        if result["success"]:
-            appointments = result["data"]
-            # Очищаем таблицу перед загрузкой
-            self.history_table.clearContents()
-            self.history_table.setRowCount(len(appointments))
-            
-            # Показываем/скрываем сообщение о пустой истории
-            if hasattr(self, 'history_empty_label'):
-                if not appointments:
-                    self.history_empty_label.setVisible(True)
-                    self.history_table.setVisible(False)
-                else:
-                    self.history_empty_label.setVisible(False)
-                    self.history_table.setVisible(True)
-            
-            for i, appointment in enumerate(appointments):
-                dt = datetime.fromisoformat(appointment['appointment_datetime'].replace('Z', '+00:00'))
-                
-                self.history_table.setItem(i, 0, QTableWidgetItem(dt.strftime('%d.%m.%Y')))
-                self.history_table.setItem(i, 1, QTableWidgetItem(dt.strftime('%H:%M')))
-                self.history_table.setItem(i, 2, QTableWidgetItem(appointment.get('service', {}).get('name', '')))
-                self.history_table.setItem(i, 3, QTableWidgetItem(appointment.get('master', {}).get('full_name', '')))
-                
-                status_map = {
-                    'scheduled': 'Запланировано',
-                    'completed': 'Завершено',
-                    'cancelled': 'Отменено',
-                    'canceled': 'Отменено'  # Оба варианта написания
-                }
-                status = appointment.get('status', '')
-                status_text = status_map.get(status, status if status else 'Неизвестно')
-                self.history_table.setItem(i, 4, QTableWidgetItem(status_text))
-            
-            # Обновляем отображение
-            self.history_table.viewport().update()
+        # Итератор запрашивает следующую страницу у сервера, только когда до нее дошли
+        self.history_iter = self.api.iter_appointments(
+            self.current_user['id'],
+            page_size=self.HISTORY_PAGE_SIZE
+        )
+        
+        # Очищаем таблицу перед загрузкой; страница прежнего итератора уже не нужна
+        self.requests.cancel("history")
+        self.history_model.restart()
+        self.history_model.fetchMore()
+    
+    def load_more_history(self):
+        """Запросить следующую страницу истории в фоновом потоке (вызывается моделью)"""
+        if self.history_iter is None:
+            return
+        
+        history_iter = self.history_iter
+        page_size = self.HISTORY_PAGE_SIZE
+        
+        def fetch_page():
+            # Итератор сам запрашивает страницу у сервера - это сетевой вызов
+            try:
+                return {"success": True, "data": list(islice(history_iter, page_size))}
+            except APIError as e:
+                return {"success": False, "error": str(e)}
+        
+        self.requests.submit(
+            "history", fetch_page,
+            owner=self.history_table,
+            on_result=lambda result: self.append_history(history_iter, result)
+        )
+    
+    def append_history(self, history_iter, result):
+        """Дописать в таблицу истории следующую страницу записей"""
+        if history_iter is not self.history_iter:
+            return  # Историю уже перезагрузили
+        
+        if not result["success"]:
+            # Ошибка - не пустая история: уже загруженные страницы остаются, следующие
+            # не запрашиваются до перезагрузки кнопкой "Обновить"
+            self.history_iter = None
+            self.history_model.finish_page([], False)
+            self.set_list_message(self.history_empty_label, "Ошибка загрузки истории", Colors.DANGER, font_size=16)
+            self.history_table.setVisible(self.history_model.rowCount() > 0)
+            return
+        
+        appointments = result["data"]
+        has_more = len(appointments) == self.HISTORY_PAGE_SIZE
+        if not has_more:
+            self.history_iter = None  # Больше страниц нет
+        self.history_model.finish_page(appointments, has_more)
+        
+        # Показываем/скрываем сообщение о пустой истории
+        if self.history_model.rowCount() == 0:
+            self.set_list_message(self.history_empty_label, "История записей пуста", font_size=16)
+            self.history_table.setVisible(False)
+        else:
+            self.set_list_message(self.history_empty_label)
+            self.history_table.setVisible(True)
     
     def show_admin_interface(self):
         """Показать интерфейс администратора"""
@@ -2139,6 +2379,13 @@ class BeautyProApp(QMainWindow):
         
         return screen
     
+    def create_actions_delegate(self, table):
+        """Кнопки "Изменить" и "Удалить" для колонки действий таблицы"""
+        return ActionButtonsDelegate([
+            ("edit", "Изменить", Colors.PRIMARY, Colors.PRIMARY_DARK),
+            ("delete", "Удалить", Colors.DANGER, "#DC2626"),
+        ], table)
+    
     def create_masters_management_tab(self):
         """Создать вкладку управления мастерами"""
         tab = QWidget()
@@ -2187,9 +2434,9 @@ class BeautyProApp(QMainWindow):
         layout.addWidget(header)
         
         # Таблица мастеров
-        self.masters_table = QTableWidget()
-        self.masters_table.setColumnCount(5)
-        self.masters_table.setHorizontalHeaderLabels(["ID", "ФИО", "Профессия", "Контакт", "Действия"])
+        self.masters_model = MastersTableModel(self)
+        self.masters_table = DataTableView()
+        self.masters_table.setModel(self.masters_model)
         
         # Настраиваем ширину колонок для оптимального отображения
         masters_header = self.masters_table.horizontalHeader()
@@ -2215,9 +2462,16 @@ class BeautyProApp(QMainWindow):
         masters_header.setSectionResizeMode(4, QHeaderView.Fixed)
         self.masters_table.setColumnWidth(4, 300)
         
-        self.masters_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.masters_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.masters_table.setSelectionBehavior(DataTableView.SelectRows)
+        self.masters_table.setEditTriggers(DataTableView.NoEditTriggers)
         self.masters_table.setAlternatingRowColors(True)
+        # Высота строк для видимости кнопок
+        self.masters_table.verticalHeader().setDefaultSectionSize(75)
+        
+        # Кнопки действий рисуются делегатом, а не виджетами в каждой строке
+        masters_actions = self.create_actions_delegate(self.masters_table)
+        masters_actions.action_clicked.connect(self.on_master_action)
+        self.masters_table.setItemDelegateForColumn(4, masters_actions)
         
         layout.addWidget(self.masters_table)
         
@@ -2228,79 +2482,25 @@ class BeautyProApp(QMainWindow):
     
     def load_masters_table(self):
         """Загрузить таблицу мастеров"""
-        result = self.api.get_masters(active_only=False)
-        
+        self.requests.submit(
+            "masters_table", self.api.get_masters, active_only=False,
+            owner=self.masters_table, on_result=self.fill_masters_table
+        )
+    
+    def fill_masters_table(self, result):
+        """Обновить таблицу мастеров: меняются только изменившиеся строки"""
         if not result["success"]:
             return
         
-        masters = result["data"]
-        self.masters_table.setRowCount(len(masters))
-        
-        # Устанавливаем высоту строк для видимости кнопок
-        self.masters_table.verticalHeader().setDefaultSectionSize(75)
-        
-        for i, master in enumerate(masters):
-            self.masters_table.setItem(i, 0, QTableWidgetItem(str(master['id'])))
-            self.masters_table.setItem(i, 1, QTableWidgetItem(master['full_name']))
-            
-            profession = master.get('profession', {}).get('name', '') if master.get('profession') else ''
-            self.masters_table.setItem(i, 2, QTableWidgetItem(profession))
-            self.masters_table.setItem(i, 3, QTableWidgetItem(master.get('contact_info', '')))
-            
-            # Кнопки действий - контейнер с выравниванием по правому краю
-            actions = QWidget()
-            actions_layout = QHBoxLayout(actions)
-            actions_layout.setContentsMargins(5, 10, 10, 10)  # Вертикальные отступы для центрирования
-            actions_layout.setSpacing(8)  # Промежуток между кнопками
-            actions_layout.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            edit_btn = QPushButton("Изменить")
-            edit_btn.setFixedSize(130, 36)  # Фиксированный размер кнопки
-            edit_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {Colors.PRIMARY};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 13px;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{
-                    background-color: {Colors.PRIMARY_DARK};
-                }}
-                QPushButton:pressed {{
-                    background-color: #3730A3;
-                }}
-            """)
-            edit_btn.setCursor(Qt.PointingHandCursor)
-            edit_btn.clicked.connect(lambda checked, m=master: self.show_edit_master_dialog(m))
-            actions_layout.addWidget(edit_btn)
-            
-            delete_btn = QPushButton("Удалить")
-            delete_btn.setFixedSize(130, 36)  # Фиксированный размер кнопки
-            delete_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {Colors.DANGER};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 13px;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{
-                    background-color: #DC2626;
-                }}
-                QPushButton:pressed {{
-                    background-color: #B91C1C;
-                }}
-            """)
-            delete_btn.setCursor(Qt.PointingHandCursor)
-            delete_btn.clicked.connect(lambda checked, m=master: self.delete_master(m))
-            actions_layout.addWidget(delete_btn)
-            
-            self.masters_table.setCellWidget(i, 4, actions)
+        self.masters_model.set_records(result["data"])
+    
+    def on_master_action(self, row, action):
+        """Нажата кнопка в строке таблицы мастеров"""
+        master = self.masters_model.record(row)
+        if action == "edit":
+            self.show_edit_master_dialog(master)
+        else:
+            self.delete_master(master)
     
     def show_add_master_dialog(self):
         """Показать диалог добавления мастера"""
@@ -2334,9 +2534,8 @@ class BeautyProApp(QMainWindow):
         prof_input = ModernInput("Введите профессию")
         layout.addWidget(prof_input)
         
-        # Загружаем профессии для поиска
-        result = self.api.get_professions()
-        professions = result["data"] if result["success"] else []
+        # Профессии для поиска загружаются в фоне
+        professions = []
         
         # Контакт
         contact_label = QLabel("Контакт")
@@ -2351,10 +2550,6 @@ class BeautyProApp(QMainWindow):
         services_label.setFont(QFont("Arial", 12, QFont.Bold))
         layout.addWidget(services_label)
         
-        # Загружаем услуги
-        services_result = self.api.get_services()
-        all_services = services_result["data"] if services_result["success"] else []
-        
         # Скроллируемая область для чекбоксов услуг
         services_scroll = QScrollArea()
         services_scroll.setWidgetResizable(True)
@@ -2366,29 +2561,36 @@ class BeautyProApp(QMainWindow):
         services_layout.setSpacing(8)
         services_layout.setContentsMargins(10, 10, 10, 10)
         
+        services_layout.addWidget(self.loading_label())
         service_checkboxes = {}
-        for service in all_services:
-            checkbox = QCheckBox(f"{service['name']} ({service['price']} руб.)")
-            checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    color: {Colors.TEXT};
-                    font-size: 12px;
-                    padding: 4px;
-                }}
-                QCheckBox::indicator {{
-                    width: 18px;
-                    height: 18px;
-                    border: 2px solid {Colors.PRIMARY};
-                    border-radius: 4px;
-                    background-color: white;
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: {Colors.PRIMARY};
-                    border-color: {Colors.PRIMARY};
-                }}
-            """)
-            service_checkboxes[service['id']] = checkbox
-            services_layout.addWidget(checkbox)
+        
+        def fill_services(all_services):
+            # Убираем надпись "Загрузка..."
+            services_layout.takeAt(0).widget().deleteLater()
+            
+            for service in all_services:
+                checkbox = QCheckBox(f"{service['name']} ({service['price']} руб.)")
+                checkbox.setStyleSheet(f"""
+                    QCheckBox {{
+                        color: {Colors.TEXT};
+                        font-size: 12px;
+                        padding: 4px;
+                    }}
+                    QCheckBox::indicator {{
+                        width: 18px;
+                        height: 18px;
+                        border: 2px solid {Colors.PRIMARY};
+                        border-radius: 4px;
+                        background-color: white;
+                    }}
+                    QCheckBox::indicator:checked {{
+                        background-color: {Colors.PRIMARY};
+                        border-color: {Colors.PRIMARY};
+                    }}
+                """)
+                service_checkboxes[service['id']] = checkbox
+                # Перед растяжкой в конце списка
+                services_layout.insertWidget(services_layout.count() - 1, checkbox)
         
         services_layout.addStretch()
         services_scroll.setWidget(services_widget)
@@ -2443,21 +2645,19 @@ class BeautyProApp(QMainWindow):
             # Собираем выбранные услуги
             selected_service_ids = [service_id for service_id, checkbox in service_checkboxes.items() if checkbox.isChecked()]
             
-            result = self.api.create_master(name, profession_id, contact, selected_service_ids)
-            
-            if result["success"]:
-                self.styled_info(dialog, "Успех", "Мастер добавлен")
-                dialog.accept()
-                self.load_masters_table()
-            else:
-                QMessageBox.critical(dialog, "Ошибка", result["error"])
+            self.submit_dialog_save(
+                dialog, save_btn, "Мастер добавлен", self.load_masters_table,
+                self.api.create_master, name, profession_id, contact, selected_service_ids
+            )
         
         save_btn.clicked.connect(save_master)
         buttons_layout.addWidget(save_btn)
         
         layout.addWidget(buttons)
         
+        self.load_dialog_data(dialog, save_btn, professions=professions.extend, services=fill_services)
         dialog.exec()
+        self.cancel_dialog_data()
     
     def show_edit_master_dialog(self, master):
         """Показать диалог редактирования мастера"""
@@ -2495,9 +2695,8 @@ class BeautyProApp(QMainWindow):
             prof_input.setText(master['profession'].get('name', ''))
         layout.addWidget(prof_input)
         
-        # Загружаем профессии для поиска
-        result = self.api.get_professions()
-        professions = result["data"] if result["success"] else []
+        # Профессии для поиска загружаются в фоне
+        professions = []
         
         # Контакт
         contact_label = QLabel("Контакт")
@@ -2513,10 +2712,6 @@ class BeautyProApp(QMainWindow):
         services_label.setFont(QFont("Arial", 12, QFont.Bold))
         layout.addWidget(services_label)
         
-        # Загружаем услуги
-        services_result = self.api.get_services()
-        all_services = services_result["data"] if services_result["success"] else []
-        
         # Получаем текущие услуги мастера
         current_service_ids = [s['id'] for s in master.get('services', [])]
         
@@ -2531,32 +2726,39 @@ class BeautyProApp(QMainWindow):
         services_layout.setSpacing(8)
         services_layout.setContentsMargins(10, 10, 10, 10)
         
+        services_layout.addWidget(self.loading_label())
         service_checkboxes = {}
-        for service in all_services:
-            checkbox = QCheckBox(f"{service['name']} ({service['price']} руб.)")
-            checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    color: {Colors.TEXT};
-                    font-size: 12px;
-                    padding: 4px;
-                }}
-                QCheckBox::indicator {{
-                    width: 18px;
-                    height: 18px;
-                    border: 2px solid {Colors.PRIMARY};
-                    border-radius: 4px;
-                    background-color: white;
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: {Colors.PRIMARY};
-                    border-color: {Colors.PRIMARY};
-                }}
-            """)
-            # Отмечаем текущие услуги мастера
-            if service['id'] in current_service_ids:
-                checkbox.setChecked(True)
-            service_checkboxes[service['id']] = checkbox
-            services_layout.addWidget(checkbox)
+        
+        def fill_services(all_services):
+            # Убираем надпись "Загрузка..."
+            services_layout.takeAt(0).widget().deleteLater()
+            
+            for service in all_services:
+                checkbox = QCheckBox(f"{service['name']} ({service['price']} руб.)")
+                checkbox.setStyleSheet(f"""
+                    QCheckBox {{
+                        color: {Colors.TEXT};
+                        font-size: 12px;
+                        padding: 4px;
+                    }}
+                    QCheckBox::indicator {{
+                        width: 18px;
+                        height: 18px;
+                        border: 2px solid {Colors.PRIMARY};
+                        border-radius: 4px;
+                        background-color: white;
+                    }}
+                    QCheckBox::indicator:checked {{
+                        background-color: {Colors.PRIMARY};
+                        border-color: {Colors.PRIMARY};
+                    }}
+                """)
+                # Отмечаем текущие услуги мастера
+                if service['id'] in current_service_ids:
+                    checkbox.setChecked(True)
+                service_checkboxes[service['id']] = checkbox
+                # Перед растяжкой в конце списка
+                services_layout.insertWidget(services_layout.count() - 1, checkbox)
         
         services_layout.addStretch()
         services_scroll.setWidget(services_widget)
@@ -2611,21 +2813,19 @@ class BeautyProApp(QMainWindow):
             # Собираем выбранные услуги
             selected_service_ids = [service_id for service_id, checkbox in service_checkboxes.items() if checkbox.isChecked()]
             
-            result = self.api.update_master(master['id'], name, profession_id, contact, selected_service_ids)
-            
-            if result["success"]:
-                self.styled_info(dialog, "Успех", "Мастер обновлен")
-                dialog.accept()
-                self.load_masters_table()
-            else:
-                QMessageBox.critical(dialog, "Ошибка", result["error"])
+            self.submit_dialog_save(
+                dialog, save_btn, "Мастер обновлен", self.load_masters_table,
+                self.api.update_master, master['id'], name, profession_id, contact, selected_service_ids
+            )
         
         save_btn.clicked.connect(update_master)
         buttons_layout.addWidget(save_btn)
         
         layout.addWidget(buttons)
         
+        self.load_dialog_data(dialog, save_btn, professions=professions.extend, services=fill_services)
         dialog.exec()
+        self.cancel_dialog_data()
     
     def delete_master(self, master):
         """Удалить мастера"""
@@ -2636,13 +2836,18 @@ class BeautyProApp(QMainWindow):
         )
         
         if confirm:
-            result = self.api.delete_master(master['id'])
-            
-            if result["success"]:
-                QMessageBox.information(self, "Успех", "Мастер удален")
-                self.load_masters_table()
-            else:
-                QMessageBox.critical(self, "Ошибка", result["error"])
+            self.requests.submit(
+                f"delete_master_{master['id']}", self.api.delete_master, master['id'],
+                on_result=self.on_master_deleted
+            )
+    
+    def on_master_deleted(self, result):
+        """Обработать ответ на удаление мастера"""
+        if result["success"]:
+            QMessageBox.information(self, "Успех", "Мастер удален")
+            self.load_masters_table()
+        else:
+            QMessageBox.critical(self, "Ошибка", result["error"])
     
     def create_services_management_tab(self):
         """Создать вкладку управления услугами"""
@@ -2692,9 +2897,9 @@ class BeautyProApp(QMainWindow):
         layout.addWidget(header)
         
         # Таблица услуг
-        self.services_table = QTableWidget()
-        self.services_table.setColumnCount(5)
-        self.services_table.setHorizontalHeaderLabels(["ID", "Название", "Цена", "Время (мин)", "Действия"])
+        self.services_model = ServicesTableModel(self)
+        self.services_table = DataTableView()
+        self.services_table.setModel(self.services_model)
         
         # Настраиваем ширину колонок для оптимального отображения
         services_header = self.services_table.horizontalHeader()
@@ -2718,9 +2923,16 @@ class BeautyProApp(QMainWindow):
         services_header.setSectionResizeMode(4, QHeaderView.Fixed)
         self.services_table.setColumnWidth(4, 300)
         
-        self.services_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.services_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.services_table.setSelectionBehavior(DataTableView.SelectRows)
+        self.services_table.setEditTriggers(DataTableView.NoEditTriggers)
         self.services_table.setAlternatingRowColors(True)
+        # Высота строк для видимости кнопок
+        self.services_table.verticalHeader().setDefaultSectionSize(75)
+        
+        # Кнопки действий рисуются делегатом, а не виджетами в каждой строке
+        services_actions = self.create_actions_delegate(self.services_table)
+        services_actions.action_clicked.connect(self.on_service_action)
+        self.services_table.setItemDelegateForColumn(4, services_actions)
         
         layout.addWidget(self.services_table)
         
@@ -2730,77 +2942,25 @@ class BeautyProApp(QMainWindow):
     
     def load_services_table(self):
         """Загрузить таблицу услуг"""
-        result = self.api.get_services()
-        
+        self.requests.submit(
+            "services_table", self.api.get_services,
+            owner=self.services_table, on_result=self.fill_services_table
+        )
+    
+    def fill_services_table(self, result):
+        """Обновить таблицу услуг: меняются только изменившиеся строки"""
         if not result["success"]:
             return
         
-        services = result["data"]
-        self.services_table.setRowCount(len(services))
-        
-        # Устанавливаем высоту строк для видимости кнопок
-        self.services_table.verticalHeader().setDefaultSectionSize(75)
-        
-        for i, service in enumerate(services):
-            self.services_table.setItem(i, 0, QTableWidgetItem(str(service['id'])))
-            self.services_table.setItem(i, 1, QTableWidgetItem(service['name']))
-            self.services_table.setItem(i, 2, QTableWidgetItem(f"{service['price']} руб."))
-            self.services_table.setItem(i, 3, QTableWidgetItem(str(service['duration_minutes'])))
-            
-            # Кнопки действий - контейнер с выравниванием по правому краю
-            actions = QWidget()
-            actions_layout = QHBoxLayout(actions)
-            actions_layout.setContentsMargins(5, 10, 10, 10)  # Вертикальные отступы для центрирования
-            actions_layout.setSpacing(8)  # Промежуток между кнопками
-            actions_layout.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            edit_btn = QPushButton("Изменить")
-            edit_btn.setFixedSize(130, 36)  # Фиксированный размер кнопки
-            edit_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {Colors.PRIMARY};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 13px;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{
-                    background-color: {Colors.PRIMARY_DARK};
-                }}
-                QPushButton:pressed {{
-                    background-color: #3730A3;
-                }}
-            """)
-            edit_btn.setCursor(Qt.PointingHandCursor)
-            edit_btn.clicked.connect(lambda checked, s=service: self.show_edit_service_dialog(s))
-            actions_layout.addWidget(edit_btn)
-            
-            delete_btn = QPushButton("Удалить")
-            delete_btn.setFixedSize(130, 36)  # Фиксированный размер кнопки
-            delete_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {Colors.DANGER};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 13px;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{
-                    background-color: #DC2626;
-                }}
-                QPushButton:pressed {{
-                    background-color: #B91C1C;
-                }}
-            """)
-            delete_btn.setCursor(Qt.PointingHandCursor)
-            delete_btn.clicked.connect(lambda checked, s=service: self.delete_service(s))
-            actions_layout.addWidget(delete_btn)
-            
-            self.services_table.setCellWidget(i, 4, actions)
+        self.services_model.set_records(result["data"])
+    
+    def on_service_action(self, row, action):
+        """Нажата кнопка в строке таблицы услуг"""
+        service = self.services_model.record(row)
+        if action == "edit":
+            self.show_edit_service_dialog(service)
+        else:
+            self.delete_service(service)
     
     def show_add_service_dialog(self):
         """Показать диалог добавления услуги"""
@@ -2834,9 +2994,8 @@ class BeautyProApp(QMainWindow):
         prof_input = ModernInput("Введите профессию")
         layout.addWidget(prof_input)
         
-        # Загружаем профессии для поиска
-        result = self.api.get_professions()
-        professions = result["data"] if result["success"] else []
+        # Профессии для поиска загружаются в фоне
+        professions = []
         
         # Цена
         price_label = QLabel("Цена (руб.)")
@@ -2932,21 +3091,19 @@ class BeautyProApp(QMainWindow):
                     profession_id = prof['id']
                     break
             
-            result = self.api.create_service(name, price, duration, profession_id)
-            
-            if result["success"]:
-                self.styled_info(dialog, "Успех", "Услуга добавлена")
-                dialog.accept()
-                self.load_services_table()
-            else:
-                QMessageBox.critical(dialog, "Ошибка", result["error"])
+            self.submit_dialog_save(
+                dialog, save_btn, "Услуга добавлена", self.load_services_table,
+                self.api.create_service, name, price, duration, profession_id
+            )
         
         save_btn.clicked.connect(save_service)
         buttons_layout.addWidget(save_btn)
         
         layout.addWidget(buttons)
         
+        self.load_dialog_data(dialog, save_btn, professions=professions.extend)
         dialog.exec()
+        self.cancel_dialog_data()
     
     def show_edit_service_dialog(self, service):
         """Показать диалог редактирования услуги"""
@@ -2979,15 +3136,19 @@ class BeautyProApp(QMainWindow):
         layout.addWidget(prof_label)
         
         prof_input = ModernInput()
-        # Устанавливаем текущую профессию
-        result = self.api.get_professions()
-        professions = result["data"] if result["success"] else []
-        for prof in professions:
-            if prof['id'] == service.get('profession_id'):
-                prof_input.setText(prof['name'])
-                break
         layout.addWidget(prof_input)
         
+        # Профессии для поиска загружаются в фоне
+        professions = []
+        
+        def fill_professions(loaded):
+            professions.extend(loaded)
+            # Устанавливаем текущую профессию, если ее еще не начали вводить
+            for prof in professions:
+                if prof['id'] == service.get('profession_id') and not prof_input.text():
+                    prof_input.setText(prof['name'])
+                    break
+        
         # Цена
         price_label = QLabel("Цена (руб.)")
         price_label.setFont(QFont("Arial", 12, QFont.Bold))
@@ -3082,21 +3243,19 @@ class BeautyProApp(QMainWindow):
                     profession_id = prof['id']
                     break
             
-            result = self.api.update_service(service['id'], name, price, duration, profession_id)
-            
-            if result["success"]:
-                self.styled_info(dialog, "Успех", "Услуга обновлена")
-                dialog.accept()
-                self.load_services_table()
-            else:
-                QMessageBox.critical(dialog, "Ошибка", result["error"])
+            self.submit_dialog_save(
+                dialog, save_btn, "Услуга обновлена", self.load_services_table,
+                self.api.update_service, service['id'], name, price, duration, profession_id
+            )
         
         save_btn.clicked.connect(update_service)
         buttons_layout.addWidget(save_btn)
         
         layout.addWidget(buttons)
         
+        self.load_dialog_data(dialog, save_btn, professions=fill_professions)
         dialog.exec()
+        self.cancel_dialog_data()
     
     def delete_service(self, service):
         """Удалить услугу"""
@@ -3107,13 +3266,18 @@ class BeautyProApp(QMainWindow):
         )
         
         if confirm:
-            result = self.api.delete_service(service['id'])
-            
-            if result["success"]:
-                QMessageBox.information(self, "Успех", "Услуга удалена")
-                self.load_services_table()
-            else:
-                QMessageBox.critical(self, "Ошибка", result["error"])
+            self.requests.submit(
+                f"delete_service_{service['id']}", self.api.delete_service, service['id'],
+                on_result=self.on_service_deleted
+            )
+    
+    def on_service_deleted(self, result):
+        """Обработать ответ на удаление услуги"""
+        if result["success"]:
+            QMessageBox.information(self, "Успех", "Услуга удалена")
+            self.load_services_table()
+        else:
+            QMessageBox.critical(self, "Ошибка", result["error"])
 
 
 def main():
@@ -3135,7 +3299,10 @@ def main():
     window = BeautyProApp()
     window.show()
     
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    # Пул соединений асинхронного клиента закрывается в его цикле asyncio
+    window.requests.shutdown(close=[window.async_api.aclose] if window.async_api is not None else [])
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,309 @@
+"""
+Табличные модели (мастера, услуги, история записей) и делегат кнопок действий
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QPainter
+from PySide6.QtWidgets import QStyledItemDelegate, QTableView
+
+
+# Статусы записей для отображения
+STATUS_TEXT = {
+    'scheduled': 'Запланировано',
+    'completed': 'Завершено',
+    'cancelled': 'Отменено',
+    'canceled': 'Отменено'  # Оба варианта написания
+}
+
+
+class DataTableView(QTableView):
+    """Таблица данных; имя класса используется как селектор в стилях приложения"""
+    pass
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Таблица записей-словарей с уникальным ключом (по умолчанию id).
+
+    Текст ячеек считается один раз при добавлении записи, а не при каждой
+    отрисовке. set_records сравнивает новый список с текущим и сообщает
+    представлению только об удаленных, добавленных, перемещенных и
+    измененных строках - остальные строки не перерисовываются.
+    """
+
+    # (заголовок, функция запись -> текст ячейки)
+    COLUMNS: Sequence[Tuple[str, Callable[[Dict], str]]] = ()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records: List[Dict] = []
+        self._cells: List[Tuple[str, ...]] = []
+
+    def key(self, record: Dict) -> Hashable:
+        return record['id']
+
+    def _render(self, record: Dict) -> Tuple[str, ...]:
+        return tuple(cell(record) for _, cell in self.COLUMNS)
+
+    # ==================== QAbstractTableModel ====================
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and index.isValid():
+            return self._cells[index.row()][index.column()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+
+    # ==================== ДАННЫЕ ====================
+
+    def record(self, row: int) -> Dict:
+        """Запись в строке row"""
+        return self._records[row]
+
+    def clear(self):
+        """Удалить все строки"""
+        self.beginResetModel()
+        self._records = []
+        self._cells = []
+        self.endResetModel()
+
+    def append_records(self, records: Sequence[Dict]):
+        """Дописать строки в конец таблицы"""
+        if not records:
+            return
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._records.extend(records)
+        self._cells.extend(self._render(record) for record in records)
+        self.endInsertRows()
+
+    def set_records(self, records: Sequence[Dict]):
+        """Привести таблицу к новому списку записей минимальным числом изменений строк"""
+        if not self._records:
+            self.beginResetModel()
+            self._records = list(records)
+            self._cells = [self._render(record) for record in records]
+            self.endResetModel()
+            return
+
+        new_keys = {self.key(record) for record in records}
+
+        # Удаляем исчезнувшие строки сплошными диапазонами, с конца
+        row = len(self._records) - 1
+        while row >= 0:
+            if self.key(self._records[row]) in new_keys:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self.key(self._records[row]) not in new_keys:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._records[row + 1:last + 1]
+            del self._cells[row + 1:last + 1]
+            self.endRemoveRows()
+
+        old_keys = {self.key(record) for record in self._records}
+        row = 0
+        while row < len(records):
+            record = records[row]
+            key = self.key(record)
+
+            if key not in old_keys:
+                # Новые записи подряд вставляются одним диапазоном
+                end = row
+                while end < len(records) and self.key(records[end]) not in old_keys:
+                    end += 1
+                self.beginInsertRows(QModelIndex(), row, end - 1)
+                self._records[row:row] = records[row:end]
+                self._cells[row:row] = [self._render(r) for r in records[row:end]]
+                self.endInsertRows()
+                row = end
+                continue
+
+            if self.key(self._records[row]) != key:
+                # Запись сменила позицию
+                source = next(
+                    i for i in range(row + 1, len(self._records))
+                    if self.key(self._records[i]) == key
+                )
+                self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), row)
+                self._records.insert(row, self._records.pop(source))
+                self._cells.insert(row, self._cells.pop(source))
+                self.endMoveRows()
+
+            if self._records[row] != record:
+                self._records[row] = record
+                self._cells[row] = self._render(record)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+            row += 1
+
+
+class MastersTableModel(RecordTableModel):
+    """Мастера в админ-панели"""
+
+    COLUMNS = (
+        ("ID", lambda master: str(master['id'])),
+        ("ФИО", lambda master: master['full_name']),
+        ("Профессия", lambda master: (master.get('profession') or {}).get('name', '')),
+        ("Контакт", lambda master: master.get('contact_info') or ''),
+        ("Действия", lambda master: ''),
+    )
+
+
+class ServicesTableModel(RecordTableModel):
+    """Услуги в админ-панели"""
+
+    COLUMNS = (
+        ("ID", lambda service: str(service['id'])),
+        ("Название", lambda service: service['name']),
+        ("Цена", lambda service: f"{service['price']} руб."),
+        ("Время (мин)", lambda service: str(service['duration_minutes'])),
+        ("Действия", lambda service: ''),
+    )
+
+
+def _appointment_datetime(appointment: Dict) -> datetime:
+    return datetime.fromisoformat(appointment['appointment_datetime'].replace('Z', '+00:00'))
+
+
+class HistoryTableModel(RecordTableModel):
+    """
+    История записей клиента с ленивой подгрузкой страниц.
+
+    Представление вызывает fetchMore, когда таблица прокручена до конца;
+    модель просит следующую страницу через fetch_page и ждет finish_page.
+    """
+
+    COLUMNS = (
+        ("Дата", lambda appointment: _appointment_datetime(appointment).strftime('%d.%m.%Y')),
+        ("Время", lambda appointment: _appointment_datetime(appointment).strftime('%H:%M')),
+        ("Услуга", lambda appointment: (appointment.get('service') or {}).get('name', '')),
+        ("Мастер", lambda appointment: (appointment.get('master') or {}).get('full_name', '')),
+        ("Статус", lambda appointment: STATUS_TEXT.get(
+            appointment.get('status', ''), appointment.get('status') or 'Неизвестно'
+        )),
+    )
+
+    def __init__(self, fetch_page: Callable[[], None], parent=None):
+        super().__init__(parent)
+        self.fetch_page = fetch_page
+        self.has_more = False
+        self.loading = False
+
+    def restart(self):
+        """Очистить историю и разрешить загрузку с первой страницы"""
+        self.clear()
+        self.has_more = True
+        self.loading = False
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self.has_more and not self.loading
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if self.canFetchMore(parent):
+            self.loading = True
+            self.fetch_page()
+
+    def finish_page(self, records: Sequence[Dict], has_more: bool):
+        """Дописать загруженную страницу"""
+        self.loading = False
+        self.has_more = has_more
+        self.append_records(records)
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Кнопки действий, нарисованные в ячейке, вместо виджетов QPushButton
+    в каждой строке. Нажатие сообщается сигналом action_clicked(строка, действие).
+    """
+
+    action_clicked = Signal(int, str)
+
+    BUTTON_WIDTH = 130
+    BUTTON_HEIGHT = 36
+    SPACING = 8
+    RIGHT_MARGIN = 10
+
+    def __init__(self, buttons: Sequence[Tuple[str, str, str, str]], view: QTableView):
+        """buttons - (действие, надпись, цвет, цвет при наведении) слева направо"""
+        super().__init__(view)
+        self.buttons = buttons
+        self.view = view
+        self.font = QFont("Arial")
+        self.font.setPixelSize(13)
+        self.font.setBold(True)
+        # (строка, действие) кнопки под курсором
+        self._hovered: Optional[Tuple[int, str]] = None
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def _button_rects(self, cell: QRect) -> List[Tuple[str, QRect]]:
+        """Прямоугольники кнопок, выровненных по правому краю ячейки"""
+        top = cell.top() + (cell.height() - self.BUTTON_HEIGHT) // 2
+        right = cell.right() - self.RIGHT_MARGIN
+        rects = []
+        for action, *_ in reversed(self.buttons):
+            left = right - self.BUTTON_WIDTH + 1
+            rects.append((action, QRect(left, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)))
+            right = left - self.SPACING - 1
+        return list(reversed(rects))
+
+    def _action_at(self, cell: QRect, position) -> Optional[str]:
+        for action, rect in self._button_rects(cell):
+            if rect.contains(position):
+                return action
+        return None
+
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        super().paint(painter, option, index)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.font)
+        painter.setPen(Qt.NoPen)
+        styles = {action: (text, color, hover) for action, text, color, hover in self.buttons}
+        for action, rect in self._button_rects(option.rect):
+            text, color, hover = styles[action]
+            painter.setBrush(QColor(hover if self._hovered == (index.row(), action) else color))
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignCenter, text)
+            painter.setPen(Qt.NoPen)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action = self._action_at(option.rect, event.position().toPoint())
+            if action is not None:
+                self.action_clicked.emit(index.row(), action)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def eventFilter(self, watched, event) -> bool:
+        # Подсветка кнопки под курсором и курсор-указатель
+        if event.type() in (QEvent.MouseMove, QEvent.Leave):
+            hovered = None
+            if event.type() == QEvent.MouseMove:
+                index = self.view.indexAt(event.position().toPoint())
+                if index.isValid() and self.view.itemDelegateForColumn(index.column()) is self:
+                    action = self._action_at(self.view.visualRect(index), event.position().toPoint())
+                    if action is not None:
+                        hovered = (index.row(), action)
+            if hovered != self._hovered:
+                self._hovered = hovered
+                if hovered:
+                    self.view.viewport().setCursor(Qt.PointingHandCursor)
+                else:
+                    self.view.viewport().unsetCursor()
+                self.view.viewport().update()
+        return False
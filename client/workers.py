@@ -0,0 +1,227 @@
+"""
+Выполнение запросов к API в пуле потоков, чтобы сеть не блокировала интерфейс
+"""
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from shiboken6 import isValid
+
+
+class _TaskSignals(QObject):
+    """Сигналы задачи: QRunnable не является QObject и не может их объявить"""
+    finished = Signal(int, object)
+
+
+class ApiTask(QRunnable):
+    """Один вызов API в рабочем потоке"""
+
+    def __init__(self, task_id: int, call: Callable[..., Dict], args: tuple, kwargs: dict):
+        super().__init__()
+        self.task_id = task_id
+        self.call = call
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _TaskSignals()
+        # Задачу хранит RequestExecutor до доставки результата: без этого
+        # пул удалил бы ее сразу после run, пока сигнал еще в очереди
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = self.call(*self.args, **self.kwargs)
+        except Exception as e:
+            # Исключение в рабочем потоке иначе потерялось бы молча
+            result = {"success": False, "error": str(e)}
+        self.signals.finished.emit(self.task_id, result)
+
+
+class AsyncLoopThread:
+    """
+    Цикл asyncio в отдельном потоке для асинхронного клиента API.
+    Корутины запускаются из потока интерфейса через submit,
+    а результат возвращается в него сигналом RequestExecutor.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name="api-event-loop", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coroutine) -> Future:
+        """Запустить корутину в цикле; возвращает concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def stop(self):
+        """Остановить цикл и дождаться завершения потока"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+class RequestExecutor(QObject):
+    """
+    Выполняет вызовы BeautyProAPI в QThreadPool и передает результат
+    в поток интерфейса через сигнал.
+
+    Запросы группируются по ключу (например, "masters_table"): новый запрос
+    с тем же ключом делает предыдущий устаревшим, и его результат отбрасывается.
+    Результат отбрасывается и тогда, когда виджет-владелец уже удален.
+
+    Корутинные функции (методы AsyncBeautyProAPI) выполняются не в пуле,
+    а в общем цикле asyncio: одновременные запросы не занимают потоки
+    и используют общий пул соединений клиента.
+    """
+
+    # Есть ли незавершенные запросы (для индикатора загрузки)
+    busy_changed = Signal(bool)
+
+    # Сколько секунд ждать закрытия асинхронных клиентов при выходе
+    SHUTDOWN_TIMEOUT = 5
+
+    def __init__(self, parent: Optional[QObject] = None, max_threads: int = 4):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._generations: Dict[str, int] = {}
+        # ID задачи -> (ключ, поколение, обработчик, владелец, задача)
+        self._tasks: Dict[int, tuple] = {}
+        self._next_id = 0
+        # Цикл asyncio создается при первом асинхронном запросе
+        self._async_loop: Optional[AsyncLoopThread] = None
+        self._async_signals = _TaskSignals()
+        self._async_signals.finished.connect(self._on_task_finished)
+
+    def submit(
+        self,
+        key: str,
+        call: Callable[..., Dict],
+        *args: Any,
+        on_result: Optional[Callable[[Dict], None]] = None,
+        owner: Optional[QObject] = None,
+        **kwargs: Any
+    ):
+        """
+        Выполнить call(*args, **kwargs) в пуле (или в цикле asyncio, если call -
+        корутинная функция); on_result получит результат в потоке интерфейса
+        """
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        self._drop_queued(key)
+
+        task_id = self._next_id
+        self._next_id += 1
+        was_busy = self.is_busy()
+
+        if inspect.iscoroutinefunction(call):
+            if self._async_loop is None:
+                self._async_loop = AsyncLoopThread()
+            task = self._async_loop.submit(call(*args, **kwargs))
+        else:
+            task = ApiTask(task_id, call, args, kwargs)
+            task.signals.finished.connect(self._on_task_finished)
+
+        # Задача учитывается до запуска в пуле и до подписки на Future:
+        # готовый результат не должен опередить учет
+        self._tasks[task_id] = (key, generation, on_result, owner, task)
+        if not was_busy:
+            self.busy_changed.emit(True)
+
+        if isinstance(task, Future):
+            task.add_done_callback(lambda done: self._deliver_async(task_id, done))
+        else:
+            self.pool.start(task)
+
+    def is_pending(self, key: str) -> bool:
+        """Ждет ли актуальный (не устаревший) запрос с этим ключом"""
+        generation = self._generations.get(key)
+        return any(
+            task_key == key and task_generation == generation
+            for task_key, task_generation, *_ in self._tasks.values()
+        )
+
+    def is_busy(self) -> bool:
+        """Есть ли незавершенные запросы"""
+        return bool(self._tasks)
+
+    def cancel(self, key: str):
+        """Отменить запрос: еще не начатый снимается с очереди, результат начатого отбрасывается"""
+        if key in self._generations:
+            self._generations[key] += 1
+        self._drop_queued(key)
+
+    def cancel_all(self):
+        """Отменить все запросы (например, при выходе из аккаунта)"""
+        for key in list(self._generations):
+            self.cancel(key)
+
+    def shutdown(self, close: Sequence[Callable[[], Awaitable[Any]]] = ()):
+        """
+        Остановить цикл asyncio (при закрытии приложения). close - корутинные
+        функции, которые выполняются в цикле до его остановки, например
+        AsyncBeautyProAPI.aclose: соединения клиента принадлежат этому циклу
+        """
+        for closer in close:
+            if self._async_loop is None:
+                # Асинхронных запросов не было, соединений у клиента нет
+                asyncio.run(closer())
+                continue
+            try:
+                self._async_loop.submit(closer()).result(timeout=self.SHUTDOWN_TIMEOUT)
+            except TimeoutError:
+                pass  # Не задерживаем выход из приложения из-за зависшего соединения
+        if self._async_loop is not None:
+            self._async_loop.stop()
+            self._async_loop = None
+
+    def _drop_queued(self, key: str):
+        """
+        Снять с очереди пула еще не начатые задачи с этим ключом;
+        асинхронные запросы прерываются, даже если уже начались
+        """
+        for task_id, (task_key, _, _, _, task) in list(self._tasks.items()):
+            if task_key != key:
+                continue
+            if isinstance(task, Future):
+                dropped = task.cancel()
+            else:
+                dropped = self.pool.tryTake(task)
+            if dropped:
+                self._finish(task_id)
+
+    def _deliver_async(self, task_id: int, future: Future):
+        """Передать результат корутины в поток интерфейса (вызывается в потоке цикла)"""
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        self._async_signals.finished.emit(task_id, result)
+
+    def _finish(self, task_id: int) -> Optional[tuple]:
+        """Убрать задачу из учета и сообщить, если запросов больше нет"""
+        entry = self._tasks.pop(task_id, None)
+        if entry is not None and not self._tasks:
+            self.busy_changed.emit(False)
+        return entry
+
+    @Slot(int, object)
+    def _on_task_finished(self, task_id: int, result: Dict):
+        entry = self._finish(task_id)
+        if entry is None:
+            return
+
+        key, generation, on_result, owner, _ = entry
+        if generation != self._generations.get(key):
+            return  # Устаревший запрос
+        if owner is not None and not isValid(owner):
+            return  # Экран, для которого грузились данные, уже закрыт
+        if on_result is not None:
+            on_result(result)
@@ -0,0 +1,112 @@
+"""
+Расчет свободного времени мастеров на битовых масках занятости
+"""
+from math import gcd
+from typing import Iterable, List, Optional, Tuple
+from datetime import datetime, date, timedelta
+
+from server import schemas
+
+
+# Рабочие часы салона (9:00 - 20:00)
+WORK_START_HOUR = 9
+WORK_END_HOUR = 20
+
+# Шаг сетки слотов, предлагаемых клиенту
+SLOT_STEP_MINUTES = 30
+
+# Разрешение битовой карты: один бит - 5 минут дня
+RESOLUTION_MINUTES = 5
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class DayOccupancy:
+    """
+    Битовая карта занятости мастера на один день.
+
+    Бит i установлен, если ячейка [i * resolution, (i + 1) * resolution)
+    минут от начала дня занята хотя бы одной записью. Если границы записей
+    или длительность услуги не кратны 5 минутам, разрешение уменьшается до
+    их общего делителя, поэтому результат совпадает с поминутной проверкой.
+    """
+
+    def __init__(self, target_date: date, busy_minutes: List[Tuple[int, int]], resolution: int):
+        self.target_date = target_date
+        self.resolution = resolution
+        self.cells = MINUTES_PER_DAY // resolution
+
+        mask = 0
+        for start, end in busy_minutes:
+            first = max(start // resolution, 0)
+            last = min(-(-end // resolution), self.cells)
+            if first < last:
+                mask |= ((1 << (last - first)) - 1) << first
+        self.busy_mask = mask
+
+    @classmethod
+    def build(
+        cls,
+        target_date: date,
+        busy_periods: Iterable[Tuple[datetime, int]],
+        duration_minutes: int
+    ) -> "DayOccupancy":
+        """Построить карту по парам (начало записи, длительность в минутах) за один проход"""
+        day_start = datetime.combine(target_date, datetime.min.time())
+        resolution = gcd(RESOLUTION_MINUTES, duration_minutes)
+
+        busy_minutes = []
+        for busy_start, busy_duration in busy_periods:
+            offset = (busy_start - day_start).total_seconds()
+            # Слоты начинаются на целой минуте, поэтому округление начала вниз,
+            # а конца вверх не меняет результат проверки пересечения
+            start = int(offset // 60)
+            end = -int(-(offset + busy_duration * 60) // 60)
+            resolution = gcd(resolution, gcd(start, end))
+            busy_minutes.append((start, end))
+
+        return cls(target_date, busy_minutes, resolution)
+
+    def free_window_mask(self, duration_minutes: int) -> int:
+        """
+        Маска стартовых ячеек, с которых свободно duration_minutes минут подряд.
+
+        Окно считается удвоением: на каждом шаге маска покрывает вдвое больше
+        ячеек, поэтому требуется O(log n) побитовых операций.
+        """
+        length = -(-duration_minutes // self.resolution)
+        window = ~self.busy_mask & ((1 << self.cells) - 1)
+        if length <= 0:
+            return window
+
+        covered = 1
+        while covered * 2 <= length:
+            window &= window >> covered
+            covered *= 2
+        if covered < length:
+            window &= window >> (length - covered)
+        return window
+
+    def free_slots(
+        self,
+        duration_minutes: int,
+        now: Optional[datetime] = None
+    ) -> List[schemas.TimeSlot]:
+        """Свободные слоты с шагом SLOT_STEP_MINUTES внутри рабочего дня"""
+        if now is None:
+            now = datetime.now()
+
+        window = self.free_window_mask(duration_minutes)
+        day_start = datetime.combine(self.target_date, datetime.min.time())
+
+        slots = []
+        minute = WORK_START_HOUR * 60
+        while minute + duration_minutes <= WORK_END_HOUR * 60:
+            slot_time = day_start + timedelta(minutes=minute)
+            if window >> (minute // self.resolution) & 1 and slot_time > now:
+                slots.append(schemas.TimeSlot(
+                    time=slot_time.strftime("%H:%M"),
+                    datetime=slot_time
+                ))
+            minute += SLOT_STEP_MINUTES
+        return slots
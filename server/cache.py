@@ -0,0 +1,75 @@
+"""
+Кэш справочников (профессии, услуги, мастера) в памяти процесса
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from server import config
+
+
+class CatalogCache:
+    """
+    Версионированный LRU-кэш с TTL.
+
+    Любое изменение справочников увеличивает версию и очищает кэш. Значение,
+    загруженное до изменения, не сохраняется: set() принимает версию, с
+    которой началась загрузка. TTL ограничивает устаревание данных, если их
+    изменил другой процесс сервера.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Значение из кэша или None при промахе"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, version: int):
+        """Сохранить значение, если справочники не менялись с начала загрузки"""
+        with self._lock:
+            if version != self.version or self.max_entries <= 0:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Сбросить кэш после изменения справочников"""
+        with self._lock:
+            self.version += 1
+            self.invalidations += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Счетчики для диагностики"""
+        with self._lock:
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+catalog_cache = CatalogCache(config.CATALOG_CACHE_TTL_SECONDS, config.CATALOG_CACHE_SIZE)
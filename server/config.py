@@ -0,0 +1,49 @@
+"""
+Настройки сервера BeautyPro из переменных окружения
+"""
+import os
+import secrets
+
+
+def _env_int(name: str, default=None):
+    """Прочитать целочисленную переменную окружения"""
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    return int(value)
+
+
+# URL базы данных SQLAlchemy; по умолчанию - файл SQLite рядом с проектом
+DATABASE_URL = os.environ.get("BEAUTYPRO_DATABASE_URL")
+
+# URL для асинхронного движка; по умолчанию выводится из DATABASE_URL
+# (sqlite -> sqlite+aiosqlite, postgresql -> postgresql+asyncpg)
+ASYNC_DATABASE_URL = os.environ.get("BEAUTYPRO_ASYNC_DATABASE_URL")
+
+# Профиль движка: "default" (настройки драйвера) или "production"
+DB_PROFILE = os.environ.get("BEAUTYPRO_DB_PROFILE", "default")
+
+# Параметры пула соединений; если не заданы, берутся из профиля
+DB_POOL_SIZE = _env_int("BEAUTYPRO_DB_POOL_SIZE")
+DB_MAX_OVERFLOW = _env_int("BEAUTYPRO_DB_MAX_OVERFLOW")
+DB_POOL_RECYCLE = _env_int("BEAUTYPRO_DB_POOL_RECYCLE", -1)  # секунды, -1 - без пересоздания
+
+# Стоимость bcrypt (log2 числа раундов)
+BCRYPT_ROUNDS = _env_int("BEAUTYPRO_BCRYPT_ROUNDS", 12)
+
+# Пул для хеширования паролей: "thread" или "process" (параллельно на нескольких ядрах)
+PASSWORD_EXECUTOR = os.environ.get("BEAUTYPRO_PASSWORD_EXECUTOR", "thread")
+PASSWORD_WORKERS = _env_int("BEAUTYPRO_PASSWORD_WORKERS", min(4, os.cpu_count() or 1))
+
+# Секрет подписи токенов сессии. Если не задан, генерируется при запуске, и токены
+# не переживают перезапуск; при нескольких воркерах секрет нужно задать явно
+TOKEN_SECRET = os.environ.get("BEAUTYPRO_TOKEN_SECRET") or secrets.token_hex(32)
+TOKEN_TTL_SECONDS = _env_int("BEAUTYPRO_TOKEN_TTL", 12 * 60 * 60)
+TOKEN_CACHE_SIZE = _env_int("BEAUTYPRO_TOKEN_CACHE_SIZE", 10000)
+
+# Кэш справочников: время жизни записи и максимальное число записей (0 - выключен)
+CATALOG_CACHE_TTL_SECONDS = _env_int("BEAUTYPRO_CATALOG_CACHE_TTL", 60)
+CATALOG_CACHE_SIZE = _env_int("BEAUTYPRO_CATALOG_CACHE_SIZE", 256)
+
+# Класс JSON-ответа по умолчанию: "json" (стандартный) или "orjson" (нужен пакет orjson)
+JSON_RESPONSE = os.environ.get("BEAUTYPRO_JSON_RESPONSE", "json")
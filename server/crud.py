@@ -1,25 +1,49 @@
 """
 CRUD операции для работы с базой данных
 """
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from datetime import datetime, date, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from passlib.hash import bcrypt
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import Select, and_, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
 
-from server import models, schemas
+from server import models, passwords, schemas, stats
+from server.availability import DayOccupancy
+from server.cache import catalog_cache
+
+
+# ==================== LOADER OPTIONS ====================
+
+# Связи, которые попадают в ответы API, загружаются вместе со списком:
+# иначе сериализация делает по запросу на каждую строку (N+1)
+MASTER_LOAD_OPTIONS = (
+    joinedload(models.Master.profession),
+    selectinload(models.Master.services),
+)
+
+SERVICE_LOAD_OPTIONS = (
+    joinedload(models.Service.profession),
+)
+
+APPOINTMENT_LOAD_OPTIONS = (
+    joinedload(models.Appointment.master).joinedload(models.Master.profession),
+    joinedload(models.Appointment.service),
+)
+
+# Размер пачки строк при потоковом чтении больших выборок
+STREAM_BATCH_SIZE = 500
 
 
 # ==================== PASSWORD UTILS ====================
 
 def hash_password(password: str) -> str:
     """Хеширование пароля"""
-    return bcrypt.hash(password)
+    return passwords.hash_password(password)
 
 
 def verify_password(password: str, hashed: str) -> bool:
     """Проверка пароля"""
-    return bcrypt.verify(password, hashed)
+    return passwords.verify_password(password, hashed)
 
 
 # ==================== USER CRUD ====================
@@ -72,12 +96,14 @@ def get_profession_by_id(db: Session, profession_id: int) -> Optional[models.Pro
 
 def get_services(db: Session) -> List[models.Service]:
     """Получить все услуги"""
-    return db.query(models.Service).all()
+    return db.query(models.Service).options(*SERVICE_LOAD_OPTIONS).all()
 
 
 def get_services_by_profession(db: Session, profession_id: int) -> List[models.Service]:
     """Получить услуги по профессии"""
-    return db.query(models.Service).filter(models.Service.profession_id == profession_id).all()
+    return db.query(models.Service).options(*SERVICE_LOAD_OPTIONS).filter(
+        models.Service.profession_id == profession_id
+    ).all()
 
 
 def get_service_by_id(db: Session, service_id: int) -> Optional[models.Service]:
@@ -103,6 +129,7 @@ def create_service(db: Session, service: schemas.ServiceCreate) -> models.Servic
     )
     db.add(db_service)
     db.commit()
+    catalog_cache.invalidate()
     db.refresh(db_service)
     return db_service
 
@@ -122,7 +149,13 @@ def update_service(db: Session, service_id: int, service: schemas.ServiceUpdate)
     if service.profession_id is not None:
         db_service.profession_id = service.profession_id
     
+    if service.price is not None or service.duration_minutes is not None:
+        # Выручка и занятые минуты в сводке считаются по цене и длительности услуги
+        db.flush()
+        stats.refresh_rows(db, service_ids=[service_id])
+    
     db.commit()
+    catalog_cache.invalidate()
     db.refresh(db_service)
     return db_service
 
@@ -134,7 +167,10 @@ def delete_service(db: Session, service_id: int) -> bool:
         return False
     
     db.delete(db_service)
+    db.flush()
+    stats.refresh_rows(db, service_ids=[service_id])
     db.commit()
+    catalog_cache.invalidate()
     return True
 
 
@@ -142,7 +178,7 @@ def delete_service(db: Session, service_id: int) -> bool:
 
 def get_masters(db: Session, active_only: bool = True) -> List[models.Master]:
     """Получить всех мастеров"""
-    query = db.query(models.Master)
+    query = db.query(models.Master).options(*MASTER_LOAD_OPTIONS)
     if active_only:
         query = query.filter(models.Master.is_active == True)
     return query.all()
@@ -155,10 +191,10 @@ def get_master_by_id(db: Session, master_id: int) -> Optional[models.Master]:
 
 def get_masters_by_service(db: Session, service_id: int) -> List[models.Master]:
     """Получить мастеров, оказывающих определенную услугу"""
-    service = db.query(models.Service).filter(models.Service.id == service_id).first()
-    if service:
-        return [m for m in service.masters if m.is_active]
-    return []
+    return db.query(models.Master).options(*MASTER_LOAD_OPTIONS).join(models.Master.services).filter(
+        models.Service.id == service_id,
+        models.Master.is_active == True
+    ).all()
 
 
 def create_master(db: Session, master: schemas.MasterCreate) -> models.Master:
@@ -176,6 +212,7 @@ def create_master(db: Session, master: schemas.MasterCreate) -> models.Master:
     
     db.add(db_master)
     db.commit()
+    catalog_cache.invalidate()
     db.refresh(db_master)
     return db_master
 
@@ -197,6 +234,7 @@ def update_master(db: Session, master_id: int, master_update: schemas.MasterUpda
         db_master.services = services
     
     db.commit()
+    catalog_cache.invalidate()
     db.refresh(db_master)
     return db_master
 
@@ -211,6 +249,7 @@ def delete_master(db: Session, master_id: int) -> bool:
         # Удаляем мастера
         db.delete(db_master)
         db.commit()
+        catalog_cache.invalidate()
         return True
     return False
 
@@ -224,10 +263,196 @@ def assign_services_to_master(db: Session, master_id: int, service_ids: List[int
     services = db.query(models.Service).filter(models.Service.id.in_(service_ids)).all()
     db_master.services = services
     db.commit()
+    catalog_cache.invalidate()
     db.refresh(db_master)
     return db_master
 
 
+# ==================== BULK CRUD ====================
+
+# Ошибка для корректных элементов, если пакет отклонен целиком (atomic)
+BULK_REJECTED = "Пакет не применен: в нем есть элементы с ошибками"
+
+
+def _existing_ids(db: Session, model, ids: Iterable[Optional[int]]) -> Set[int]:
+    """Какие из ID есть в таблице (одним запросом на весь пакет)"""
+    ids = {item_id for item_id in ids if item_id is not None}
+    if not ids:
+        return set()
+    return {row.id for row in db.query(model.id).filter(model.id.in_(ids))}
+
+
+def _service_error(service, profession_ids: Set[int]) -> Optional[str]:
+    """Ошибка в данных услуги из пакета или None"""
+    if service.name is not None and not service.name.strip():
+        return "Название услуги не может быть пустым"
+    if service.price is not None and service.price < 0:
+        return "Цена не может быть отрицательной"
+    if service.duration_minutes is not None and service.duration_minutes <= 0:
+        return "Длительность должна быть больше нуля"
+    if service.profession_id is not None and service.profession_id not in profession_ids:
+        return f"Профессия {service.profession_id} не найдена"
+    return None
+
+
+def _master_error(master, profession_ids: Set[int], service_ids: Set[int]) -> Optional[str]:
+    """Ошибка в данных мастера из пакета или None"""
+    if master.full_name is not None and not master.full_name.strip():
+        return "Имя мастера не может быть пустым"
+    if master.profession_id is not None and master.profession_id not in profession_ids:
+        return f"Профессия {master.profession_id} не найдена"
+    missing = sorted(set(master.service_ids or []) - service_ids)
+    if missing:
+        return f"Услуги не найдены: {', '.join(map(str, missing))}"
+    return None
+
+
+def _update_errors(items, existing_ids: Set[int], item_error: Callable[[Any], Optional[str]]) -> List[Optional[str]]:
+    """Ошибки пакета обновления: несуществующие и повторяющиеся ID, затем данные"""
+    errors = []
+    seen = set()
+    for item in items:
+        if item.id not in existing_ids:
+            errors.append(f"Запись {item.id} не найдена")
+        elif item.id in seen:
+            errors.append(f"Запись {item.id} указана в пакете повторно")
+        else:
+            errors.append(item_error(item))
+        seen.add(item.id)
+    return errors
+
+
+def _apply_bulk(
+    db: Session,
+    errors: List[Optional[str]],
+    atomic: bool,
+    apply: Callable[[List[int]], List[int]]
+) -> List[schemas.BulkItemResult]:
+    """
+    Применить корректные элементы пакета одной транзакцией.
+    apply получает позиции корректных элементов и возвращает их ID в том же порядке.
+    """
+    valid = [index for index, error in enumerate(errors) if error is None]
+    if atomic and len(valid) < len(errors):
+        errors = [error or BULK_REJECTED for error in errors]
+        valid = []
+    
+    ids = {}
+    if valid:
+        ids = dict(zip(valid, apply(valid)))
+        db.commit()
+        catalog_cache.invalidate()
+    
+    return [
+        schemas.BulkItemResult(index=index, success=error is None, id=ids.get(index), error=error)
+        for index, error in enumerate(errors)
+    ]
+
+
+def _link_services(db: Session, links: List[Tuple[int, Optional[List[int]]]]):
+    """Вставить связи мастер-услуга одним executemany"""
+    rows = [
+        {"master_id": master_id, "service_id": service_id}
+        for master_id, service_ids in links
+        for service_id in dict.fromkeys(service_ids or [])
+    ]
+    if rows:
+        db.execute(insert(models.master_services), rows)
+
+
+def bulk_create_services(
+    db: Session,
+    services: List[schemas.ServiceCreate],
+    atomic: bool = False
+) -> List[schemas.BulkItemResult]:
+    """Создать пакет услуг одним INSERT ... RETURNING"""
+    profession_ids = _existing_ids(db, models.Profession, [s.profession_id for s in services])
+    errors = [_service_error(service, profession_ids) for service in services]
+    
+    def apply(valid: List[int]) -> List[int]:
+        return db.scalars(
+            insert(models.Service).returning(models.Service.id, sort_by_parameter_order=True),
+            [services[index].model_dump() for index in valid]
+        ).all()
+    
+    return _apply_bulk(db, errors, atomic, apply)
+
+
+def bulk_update_services(
+    db: Session,
+    services: List[schemas.ServiceBulkUpdate],
+    atomic: bool = False
+) -> List[schemas.BulkItemResult]:
+    """Обновить пакет услуг по первичному ключу одним executemany"""
+    existing = _existing_ids(db, models.Service, [s.id for s in services])
+    profession_ids = _existing_ids(db, models.Profession, [s.profession_id for s in services])
+    errors = _update_errors(services, existing, lambda service: _service_error(service, profession_ids))
+    
+    def apply(valid: List[int]) -> List[int]:
+        rows = [services[index].model_dump(exclude_none=True) for index in valid]
+        changed = [row for row in rows if len(row) > 1]
+        if changed:
+            db.execute(update(models.Service), changed)
+        
+        # Цена и длительность входят в дневную сводку
+        repriced = [row["id"] for row in changed if "price" in row or "duration_minutes" in row]
+        if repriced:
+            stats.refresh_rows(db, service_ids=repriced)
+        return [row["id"] for row in rows]
+    
+    return _apply_bulk(db, errors, atomic, apply)
+
+
+def bulk_create_masters(
+    db: Session,
+    masters: List[schemas.MasterCreate],
+    atomic: bool = False
+) -> List[schemas.BulkItemResult]:
+    """Создать пакет мастеров и их связи с услугами двумя executemany"""
+    profession_ids = _existing_ids(db, models.Profession, [m.profession_id for m in masters])
+    service_ids = _existing_ids(db, models.Service, [sid for m in masters for sid in m.service_ids or []])
+    errors = [_master_error(master, profession_ids, service_ids) for master in masters]
+    
+    def apply(valid: List[int]) -> List[int]:
+        ids = db.scalars(
+            insert(models.Master).returning(models.Master.id, sort_by_parameter_order=True),
+            [masters[index].model_dump(exclude={"service_ids"}) for index in valid]
+        ).all()
+        _link_services(db, [(master_id, masters[index].service_ids) for master_id, index in zip(ids, valid)])
+        return ids
+    
+    return _apply_bulk(db, errors, atomic, apply)
+
+
+def bulk_update_masters(
+    db: Session,
+    masters: List[schemas.MasterBulkUpdate],
+    atomic: bool = False
+) -> List[schemas.BulkItemResult]:
+    """Обновить пакет мастеров по первичному ключу; service_ids заменяет услуги мастера"""
+    existing = _existing_ids(db, models.Master, [m.id for m in masters])
+    profession_ids = _existing_ids(db, models.Profession, [m.profession_id for m in masters])
+    service_ids = _existing_ids(db, models.Service, [sid for m in masters for sid in m.service_ids or []])
+    errors = _update_errors(masters, existing, lambda master: _master_error(master, profession_ids, service_ids))
+    
+    def apply(valid: List[int]) -> List[int]:
+        rows = [masters[index].model_dump(exclude_none=True, exclude={"service_ids"}) for index in valid]
+        changed = [row for row in rows if len(row) > 1]
+        if changed:
+            db.execute(update(models.Master), changed)
+        
+        relinked = [masters[index] for index in valid if masters[index].service_ids is not None]
+        if relinked:
+            db.execute(
+                delete(models.master_services)
+                .where(models.master_services.c.master_id.in_([master.id for master in relinked]))
+            )
+            _link_services(db, [(master.id, master.service_ids) for master in relinked])
+        return [row["id"] for row in rows]
+    
+    return _apply_bulk(db, errors, atomic, apply)
+
+
 # ==================== APPOINTMENT CRUD ====================
 
 def get_appointments_by_client(
@@ -237,7 +462,9 @@ def get_appointments_by_client(
     upcoming_only: bool = False
 ) -> List[models.Appointment]:
     """Получить записи клиента"""
-    query = db.query(models.Appointment).filter(models.Appointment.client_id == client_id)
+    query = db.query(models.Appointment).options(*APPOINTMENT_LOAD_OPTIONS).filter(
+        models.Appointment.client_id == client_id
+    )
     
     if status:
         query = query.filter(models.Appointment.status == status)
@@ -251,6 +478,84 @@ def get_appointments_by_client(
     return query.order_by(models.Appointment.appointment_datetime.desc()).all()
 
 
+def _filter_appointment_period(query, start_date: Optional[date], end_date: Optional[date]):
+    """Ограничить выборку записей диапазоном дат (границы включительно)"""
+    if start_date:
+        query = query.filter(
+            models.Appointment.appointment_datetime >= datetime.combine(start_date, datetime.min.time())
+        )
+    if end_date:
+        query = query.filter(
+            models.Appointment.appointment_datetime <= datetime.combine(end_date, datetime.max.time())
+        )
+    return query
+
+
+def iter_appointments(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    master_id: Optional[int] = None,
+    service_id: Optional[int] = None,
+    status: Optional[str] = None
+) -> Iterator[models.Appointment]:
+    """
+    Перебрать записи салона по фильтрам через серверный курсор: строки
+    читаются из БД пачками по STREAM_BATCH_SIZE, а не загружаются целиком
+    """
+    query = db.query(models.Appointment).options(
+        *APPOINTMENT_LOAD_OPTIONS,
+        joinedload(models.Appointment.client)
+    )
+    
+    query = _filter_appointment_period(query, start_date, end_date)
+    if master_id:
+        query = query.filter(models.Appointment.master_id == master_id)
+    if service_id:
+        query = query.filter(models.Appointment.service_id == service_id)
+    if status:
+        query = query.filter(models.Appointment.status == status)
+    
+    return iter(query.order_by(
+        models.Appointment.appointment_datetime,
+        models.Appointment.id
+    ).yield_per(STREAM_BATCH_SIZE))
+
+
+def iter_appointment_export_rows(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> Iterator[Tuple]:
+    """
+    Перебрать строки выгрузки для бухгалтерии: запись, мастер и цена услуги.
+    Выбираются только нужные колонки, без создания ORM-объектов
+    """
+    query = db.query(
+        models.Appointment.id,
+        models.Appointment.appointment_datetime,
+        models.Appointment.status,
+        models.Appointment.client_id,
+        models.Appointment.master_id,
+        models.Master.full_name,
+        models.Appointment.service_id,
+        models.Service.name,
+        models.Service.duration_minutes,
+        models.Service.price
+    ).join(
+        models.Master, models.Appointment.master_id == models.Master.id
+    ).join(
+        models.Service, models.Appointment.service_id == models.Service.id
+    )
+    
+    query = _filter_appointment_period(query, start_date, end_date)
+    
+    return iter(query.order_by(
+        models.Appointment.appointment_datetime,
+        models.Appointment.id
+    ).yield_per(STREAM_BATCH_SIZE))
+
+
 def get_appointment_by_id(db: Session, appointment_id: int) -> Optional[models.Appointment]:
     """Получить запись по ID"""
     return db.query(models.Appointment).filter(models.Appointment.id == appointment_id).first()
@@ -260,33 +565,126 @@ def create_appointment(
     db: Session, 
     client_id: int, 
     appointment: schemas.AppointmentCreate
-) -> models.Appointment:
-    """Создать новую запись"""
-    db_appointment = models.Appointment(
-        client_id=client_id,
-        master_id=appointment.master_id,
-        service_id=appointment.service_id,
-        appointment_datetime=appointment.appointment_datetime,
-        status="scheduled"
-    )
-    db.add(db_appointment)
-    db.commit()
+) -> Optional[models.Appointment]:
+    """
+    Создать новую запись, атомарно проверив, что время мастера свободно.
+    Возвращает None, если слот пересекается с другой записью.
+    """
+    master_id = appointment.master_id
+    start_datetime = appointment.appointment_datetime
+    
+    try:
+        # Первым оператором транзакции "трогаем" строку мастера: в PostgreSQL это
+        # блокировка строки, в SQLite - блокировка записи всей БД. Параллельные
+        # брони одного мастера проходят проверку и вставку строго по очереди.
+        db.execute(
+            update(models.Master)
+            .where(models.Master.id == master_id)
+            .values(id=models.Master.id)
+        )
+        
+        service = get_service_by_id(db, appointment.service_id)
+        end_datetime = start_datetime + timedelta(minutes=service.duration_minutes)
+        day_start = datetime.combine(start_datetime.date(), datetime.min.time())
+        
+        for busy_start, busy_duration in get_busy_periods(db, master_id, day_start, end_datetime):
+            busy_end = busy_start + timedelta(minutes=busy_duration)
+            if busy_start < end_datetime and start_datetime < busy_end:
+                db.rollback()
+                return None
+        
+        db_appointment = models.Appointment(
+            client_id=client_id,
+            master_id=master_id,
+            service_id=appointment.service_id,
+            appointment_datetime=start_datetime,
+            status="scheduled"
+        )
+        db.add(db_appointment)
+        stats.record_appointment(db, start_datetime, master_id, service)
+        db.commit()
+    except IntegrityError:
+        # Уникальный индекс (мастер, время) среди активных записей
+        db.rollback()
+        return None
+    
     db.refresh(db_appointment)
     return db_appointment
 
 
 def cancel_appointment(db: Session, appointment_id: int, client_id: int) -> bool:
     """Отменить запись"""
-    appointment = db.query(models.Appointment).filter(
-        models.Appointment.id == appointment_id,
-        models.Appointment.client_id == client_id
-    ).first()
+    # Статус меняется условным UPDATE: при повторной или параллельной отмене
+    # строка не совпадет, и сводка не будет уменьшена дважды
+    canceled = db.execute(
+        update(models.Appointment)
+        .where(
+            models.Appointment.id == appointment_id,
+            models.Appointment.client_id == client_id,
+            models.Appointment.status == "scheduled"
+        )
+        .values(status="canceled")
+    ).rowcount
+    if not canceled:
+        db.rollback()
+        return False
     
-    if appointment and appointment.status == "scheduled":
-        appointment.status = "canceled"
-        db.commit()
-        return True
-    return False
+    appointment = get_appointment_by_id(db, appointment_id)
+    stats.record_appointment(
+        db, appointment.appointment_datetime, appointment.master_id, appointment.service, sign=-1
+    )
+    db.commit()
+    return True
+
+
+def busy_periods_query(start_datetime: datetime, end_datetime: datetime) -> Select:
+    """
+    Запрос занятых периодов: начало записи и длительность услуги одним JOIN
+    (общий для синхронных и асинхронных функций)
+    """
+    return select(
+        models.Appointment.master_id,
+        models.Appointment.appointment_datetime,
+        models.Service.duration_minutes
+    ).join(
+        models.Service, models.Appointment.service_id == models.Service.id
+    ).where(
+        models.Appointment.appointment_datetime >= start_datetime,
+        models.Appointment.appointment_datetime <= end_datetime,
+        models.Appointment.status == "scheduled"
+    )
+
+
+def get_busy_periods(
+    db: Session,
+    master_id: int,
+    start_datetime: datetime,
+    end_datetime: datetime
+) -> List[Tuple[datetime, int]]:
+    """Получить занятые периоды мастера: (начало записи, длительность услуги в минутах)"""
+    rows = db.execute(busy_periods_query(start_datetime, end_datetime).where(
+        models.Appointment.master_id == master_id
+    ))
+    return [(row.appointment_datetime, row.duration_minutes) for row in rows]
+
+
+def get_busy_periods_by_master(
+    db: Session,
+    master_ids: List[int],
+    start_datetime: datetime,
+    end_datetime: datetime
+) -> Dict[int, List[Tuple[datetime, int]]]:
+    """Получить занятые периоды сразу нескольких мастеров одним запросом"""
+    busy_by_master = {master_id: [] for master_id in master_ids}
+    if not master_ids:
+        return busy_by_master
+    
+    rows = db.execute(busy_periods_query(start_datetime, end_datetime).where(
+        models.Appointment.master_id.in_(master_ids)
+    ))
+    for row in rows:
+        busy_by_master[row.master_id].append((row.appointment_datetime, row.duration_minutes))
+    return busy_by_master
 
 
 def get_available_time_slots(
@@ -296,10 +694,6 @@ def get_available_time_slots(
     target_date: date
 ) -> List[schemas.TimeSlot]:
     """Получить доступные временные слоты для записи"""
-    # Рабочие часы салона (9:00 - 20:00)
-    work_start = 9
-    work_end = 20
-    
     # Получаем услугу для определения длительности
     service = get_service_by_id(db, service_id)
     if not service:
@@ -307,53 +701,44 @@ def get_available_time_slots(
     
     duration_minutes = service.duration_minutes
     
-    # Получаем все записи мастера на эту дату
+    # Получаем занятые периоды мастера на эту дату
     start_datetime = datetime.combine(target_date, datetime.min.time())
     end_datetime = datetime.combine(target_date, datetime.max.time())
+    busy_periods = get_busy_periods(db, master_id, start_datetime, end_datetime)
     
-    existing_appointments = db.query(models.Appointment).filter(
-        models.Appointment.master_id == master_id,
-        models.Appointment.appointment_datetime >= start_datetime,
-        models.Appointment.appointment_datetime <= end_datetime,
-        models.Appointment.status == "scheduled"
-    ).all()
+    occupancy = DayOccupancy.build(target_date, busy_periods, duration_minutes)
+    return occupancy.free_slots(duration_minutes)
+
+
+def get_service_availability(
+    db: Session,
+    service_id: int,
+    target_date: date
+) -> List[Tuple[models.Master, List[schemas.TimeSlot]]]:
+    """Получить свободные слоты всех активных мастеров, оказывающих услугу"""
+    service = get_service_by_id(db, service_id)
+    if not service:
+        return []
     
-    # Собираем занятые периоды
-    busy_periods = []
-    for apt in existing_appointments:
-        apt_service = get_service_by_id(db, apt.service_id)
-        if apt_service:
-            end_time = apt.appointment_datetime + timedelta(minutes=apt_service.duration_minutes)
-            busy_periods.append((apt.appointment_datetime, end_time))
-    
-    # Генерируем доступные слоты (каждые 30 минут)
-    available_slots = []
-    current_time = datetime.combine(target_date, datetime.min.time().replace(hour=work_start))
-    end_work_time = datetime.combine(target_date, datetime.min.time().replace(hour=work_end))
-    
-    while current_time + timedelta(minutes=duration_minutes) <= end_work_time:
-        slot_end = current_time + timedelta(minutes=duration_minutes)
-        
-        # Проверяем, не пересекается ли слот с занятыми периодами
-        is_available = True
-        for busy_start, busy_end in busy_periods:
-            if not (slot_end <= busy_start or current_time >= busy_end):
-                is_available = False
-                break
-        
-        # Проверяем, что слот не в прошлом
-        if current_time <= datetime.now():
-            is_available = False
-        
-        if is_available:
-            available_slots.append(schemas.TimeSlot(
-                time=current_time.strftime("%H:%M"),
-                datetime=current_time
-            ))
-        
-        current_time += timedelta(minutes=30)
+    duration_minutes = service.duration_minutes
+    masters = db.query(models.Master).options(
+        joinedload(models.Master.profession)
+    ).join(models.Master.services).filter(
+        models.Service.id == service_id,
+        models.Master.is_active == True
+    ).order_by(models.Master.id).all()
+    
+    start_datetime = datetime.combine(target_date, datetime.min.time())
+    end_datetime = datetime.combine(target_date, datetime.max.time())
+    busy_by_master = get_busy_periods_by_master(
+        db, [m.id for m in masters], start_datetime, end_datetime
+    )
     
-    return available_slots
+    availability = []
+    for master in masters:
+        occupancy = DayOccupancy.build(target_date, busy_by_master[master.id], duration_minutes)
+        availability.append((master, occupancy.free_slots(duration_minutes)))
+    return availability
 
 
 # ==================== INIT DATA ====================
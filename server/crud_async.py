@@ -0,0 +1,236 @@
+"""
+Асинхронные CRUD операции для нагруженных эндпоинтов чтения
+"""
+from typing import List, Optional, Tuple
+from datetime import datetime, date, timedelta
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server import models, passwords, schemas
+from server.availability import DayOccupancy
+# Связи загружаются заранее: в AsyncSession ленивая загрузка при сериализации невозможна
+from server.crud import MASTER_LOAD_OPTIONS, SERVICE_LOAD_OPTIONS, APPOINTMENT_LOAD_OPTIONS, busy_periods_query
+
+
+# ==================== USER CRUD ====================
+
+async def get_user_by_phone(db: AsyncSession, phone_number: str) -> Optional[models.User]:
+    """Получить пользователя по номеру телефона"""
+    return await db.scalar(select(models.User).where(models.User.phone_number == phone_number))
+
+
+async def create_user(db: AsyncSession, user: schemas.UserCreate) -> models.User:
+    """Создать нового пользователя (клиента); bcrypt считается в отдельном пуле"""
+    db_user = models.User(
+        phone_number=user.phone_number,
+        password_hash=await passwords.hash_password_async(user.password),
+        full_name=user.full_name,
+        role="client"
+    )
+    db.add(db_user)
+    await db.commit()
+    return db_user
+
+
+async def authenticate_user(db: AsyncSession, phone_number: str, password: str) -> Optional[models.User]:
+    """Аутентификация пользователя с пересчетом хеша, если изменилась стоимость bcrypt"""
+    user = await get_user_by_phone(db, phone_number)
+    if not user:
+        return None
+
+    verified, new_hash = await passwords.verify_and_update_async(password, user.password_hash)
+    if not verified:
+        return None
+
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+    return user
+
+
+# ==================== PROFESSION CRUD ====================
+
+async def get_professions(db: AsyncSession) -> List[models.Profession]:
+    """Получить все профессии"""
+    result = await db.scalars(select(models.Profession))
+    return list(result)
+
+
+# ==================== SERVICE CRUD ====================
+
+async def get_services(db: AsyncSession) -> List[models.Service]:
+    """Получить все услуги"""
+    result = await db.scalars(select(models.Service).options(*SERVICE_LOAD_OPTIONS))
+    return list(result)
+
+
+async def get_services_by_profession(db: AsyncSession, profession_id: int) -> List[models.Service]:
+    """Получить услуги по профессии"""
+    result = await db.scalars(
+        select(models.Service)
+        .options(*SERVICE_LOAD_OPTIONS)
+        .where(models.Service.profession_id == profession_id)
+    )
+    return list(result)
+
+
+async def get_service_by_id(db: AsyncSession, service_id: int) -> Optional[models.Service]:
+    """Получить услугу по ID"""
+    return await db.get(models.Service, service_id)
+
+
+# ==================== MASTER CRUD ====================
+
+async def get_masters(db: AsyncSession, active_only: bool = True) -> List[models.Master]:
+    """Получить всех мастеров"""
+    query = select(models.Master).options(*MASTER_LOAD_OPTIONS)
+    if active_only:
+        query = query.where(models.Master.is_active == True)
+    result = await db.scalars(query)
+    return list(result.unique())
+
+
+async def get_masters_page(
+    db: AsyncSession,
+    limit: int,
+    after_id: Optional[int] = None,
+    active_only: bool = True
+) -> List[models.Master]:
+    """Страница мастеров по возрастанию ID (keyset)"""
+    query = select(models.Master).options(*MASTER_LOAD_OPTIONS)
+    if active_only:
+        query = query.where(models.Master.is_active == True)
+    if after_id is not None:
+        query = query.where(models.Master.id > after_id)
+    result = await db.scalars(query.order_by(models.Master.id).limit(limit))
+    return list(result.unique())
+
+
+async def get_masters_by_service(db: AsyncSession, service_id: int) -> List[models.Master]:
+    """Получить мастеров, оказывающих определенную услугу"""
+    result = await db.scalars(
+        select(models.Master)
+        .options(*MASTER_LOAD_OPTIONS)
+        .join(models.Master.services)
+        .where(models.Service.id == service_id, models.Master.is_active == True)
+    )
+    return list(result.unique())
+
+
+# ==================== APPOINTMENT CRUD ====================
+
+async def get_appointments_by_client(
+    db: AsyncSession,
+    client_id: int,
+    status: Optional[str] = None,
+    upcoming_only: bool = False
+) -> List[models.Appointment]:
+    """Получить записи клиента"""
+    query = select(models.Appointment).options(*APPOINTMENT_LOAD_OPTIONS).where(
+        models.Appointment.client_id == client_id
+    )
+
+    if status:
+        query = query.where(models.Appointment.status == status)
+
+    if upcoming_only:
+        query = query.where(
+            models.Appointment.appointment_datetime >= datetime.now(),
+            models.Appointment.status == "scheduled"
+        )
+
+    result = await db.scalars(query.order_by(models.Appointment.appointment_datetime.desc()))
+    return list(result)
+
+
+async def get_appointments_page(
+    db: AsyncSession,
+    client_id: int,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    status: Optional[str] = None
+) -> List[models.Appointment]:
+    """
+    Страница записей клиента от новых к старым (keyset по дате и ID).
+    after - (дата, ID) последней записи предыдущей страницы.
+    """
+    query = select(models.Appointment).options(*APPOINTMENT_LOAD_OPTIONS).where(
+        models.Appointment.client_id == client_id
+    )
+
+    if status:
+        query = query.where(models.Appointment.status == status)
+
+    if after is not None:
+        after_datetime, after_id = after
+        query = query.where(or_(
+            models.Appointment.appointment_datetime < after_datetime,
+            and_(
+                models.Appointment.appointment_datetime == after_datetime,
+                models.Appointment.id < after_id
+            )
+        ))
+
+    result = await db.scalars(
+        query.order_by(
+            models.Appointment.appointment_datetime.desc(),
+            models.Appointment.id.desc()
+        ).limit(limit)
+    )
+    return list(result)
+
+
+async def get_busy_periods(
+    db: AsyncSession,
+    master_id: int,
+    start_datetime: datetime,
+    end_datetime: datetime
+) -> List[Tuple[datetime, int]]:
+    """Получить занятые периоды мастера: (начало записи, длительность услуги в минутах)"""
+    result = await db.execute(busy_periods_query(start_datetime, end_datetime).where(
+        models.Appointment.master_id == master_id
+    ))
+    return [(row.appointment_datetime, row.duration_minutes) for row in result]
+
+
+async def get_available_time_slots(
+    db: AsyncSession,
+    master_id: int,
+    service_id: int,
+    target_date: date
+) -> List[schemas.TimeSlot]:
+    """Получить доступные временные слоты для записи"""
+    days = await get_available_time_slots_range(db, master_id, service_id, target_date, target_date)
+    return days[0][1] if days else []
+
+
+async def get_available_time_slots_range(
+    db: AsyncSession,
+    master_id: int,
+    service_id: int,
+    start_date: date,
+    end_date: date
+) -> List[Tuple[date, List[schemas.TimeSlot]]]:
+    """Получить доступные слоты на каждый день диапазона одним запросом записей"""
+    service = await get_service_by_id(db, service_id)
+    if not service:
+        return []
+
+    duration_minutes = service.duration_minutes
+
+    start_datetime = datetime.combine(start_date, datetime.min.time())
+    end_datetime = datetime.combine(end_date, datetime.max.time())
+
+    # Раскладываем занятые периоды по дням
+    busy_by_day = {}
+    for busy_start, busy_duration in await get_busy_periods(db, master_id, start_datetime, end_datetime):
+        busy_by_day.setdefault(busy_start.date(), []).append((busy_start, busy_duration))
+
+    days = []
+    current_date = start_date
+    while current_date <= end_date:
+        occupancy = DayOccupancy.build(current_date, busy_by_day.get(current_date, []), duration_minutes)
+        days.append((current_date, occupancy.free_slots(duration_minutes)))
+        current_date += timedelta(days=1)
+
+    return days
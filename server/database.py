@@ -1,22 +1,110 @@
 """
 Настройка базы данных SQLAlchemy
 """
-import os
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+from server import config
 
 # SQLite база данных - используем абсолютный путь для кроссплатформенности
 BASE_DIR = Path(__file__).resolve().parent.parent
 DB_PATH = BASE_DIR / "beautypro.db"
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
+SQLALCHEMY_DATABASE_URL = config.DATABASE_URL or f"sqlite:///{DB_PATH}"
+
+DATABASE_URL = make_url(SQLALCHEMY_DATABASE_URL)
+IS_SQLITE = DATABASE_URL.get_backend_name() == "sqlite"
+
+# Асинхронные драйверы для поддерживаемых СУБД
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+# Профили движка: размер пула и PRAGMA для каждого нового соединения SQLite
+ENGINE_PROFILES = {
+    # Настройки драйвера по умолчанию (rollback journal, без mmap)
+    "default": {
+        "sqlite_pragmas": {},
+        "pool_size": 5,
+        "max_overflow": 10,
+    },
+    # WAL: запись не блокирует чтение календаря; synchronous=NORMAL в режиме WAL
+    # не теряет целостность, а mmap и увеличенный кэш страниц ускоряют чтение
+    "production": {
+        "sqlite_pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": 256 * 1024 * 1024,
+            "cache_size": -64 * 1024,  # в КиБ (отрицательное значение), т.е. 64 МиБ
+            "busy_timeout": 5000,  # мс ожидания блокировки вместо "database is locked"
+            "temp_store": "MEMORY",
+        },
+        "pool_size": 20,
+        "max_overflow": 20,
+    },
+}
+
+if config.DB_PROFILE not in ENGINE_PROFILES:
+    raise ValueError(
+        f"Неизвестный профиль БД: {config.DB_PROFILE}. "
+        f"Доступные: {', '.join(ENGINE_PROFILES)}"
+    )
+DB_PROFILE = ENGINE_PROFILES[config.DB_PROFILE]
+
+
+def engine_options(is_async: bool = False) -> dict:
+    """Параметры create_engine/create_async_engine для текущего URL и профиля"""
+    options = {}
+    if IS_SQLITE:
+        if not is_async:
+            options["connect_args"] = {"check_same_thread": False}
+        # SQLite в памяти работает на одном соединении без очереди пула
+        if DATABASE_URL.database in (None, "", ":memory:"):
+            if is_async:
+                options["poolclass"] = StaticPool
+            return options
+        # aiosqlite по умолчанию открывает новое соединение на каждый запрос
+        if is_async:
+            options["poolclass"] = AsyncAdaptedQueuePool
+    
+    pool_size = config.DB_POOL_SIZE
+    max_overflow = config.DB_MAX_OVERFLOW
+    options["pool_size"] = DB_PROFILE["pool_size"] if pool_size is None else pool_size
+    options["max_overflow"] = DB_PROFILE["max_overflow"] if max_overflow is None else max_overflow
+    options["pool_recycle"] = config.DB_POOL_RECYCLE
+    options["pool_pre_ping"] = not IS_SQLITE
+    return options
+
+
+def async_database_url() -> str:
+    """URL для асинхронного движка: тот же сервер БД через асинхронный драйвер"""
+    if config.ASYNC_DATABASE_URL:
+        return config.ASYNC_DATABASE_URL
+    drivername = ASYNC_DRIVERS.get(DATABASE_URL.get_backend_name(), DATABASE_URL.drivername)
+    return DATABASE_URL.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Применить PRAGMA выбранного профиля к новому соединению"""
+    cursor = dbapi_connection.cursor()
+    for name, value in DB_PROFILE["sqlite_pragmas"].items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options())
+async_engine = create_async_engine(async_database_url(), **engine_options(is_async=True))
+
+if IS_SQLITE:
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", apply_sqlite_pragmas)
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Для SQLite
-)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
@@ -31,3 +119,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency для получения асинхронной сессии БД"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,150 @@
+"""
+Потоковая выгрузка записей для бухгалтерии (CSV и Parquet)
+"""
+import csv
+import io
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+from datetime import date
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pyarrow - необязательная зависимость, нужна только для Parquet
+    pyarrow = None
+
+from server import crud
+from server.database import SessionLocal
+
+
+# Строк в одном куске выгрузки (и в одной группе строк Parquet):
+# память сервера ограничена размером куска, а не всей истории
+EXPORT_CHUNK_SIZE = 10000
+
+EXPORT_COLUMNS = (
+    "appointment_id",
+    "appointment_datetime",
+    "status",
+    "client_id",
+    "master_id",
+    "master_name",
+    "service_id",
+    "service_name",
+    "duration_minutes",
+    "price",
+)
+
+# Формат -> (MIME-тип, расширение файла)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def parquet_available() -> bool:
+    """Установлен ли pyarrow для выгрузки в Parquet"""
+    return pyarrow is not None
+
+
+def iter_chunks(start_date: Optional[date], end_date: Optional[date]) -> Iterator[List[Tuple]]:
+    """
+    Строки выгрузки кусками по EXPORT_CHUNK_SIZE.
+    Сессия открывается внутри генератора: она нужна, пока отправляется ответ.
+    """
+    db = SessionLocal()
+    try:
+        rows = crud.iter_appointment_export_rows(db, start_date, end_date)
+        while True:
+            chunk = list(islice(rows, EXPORT_CHUNK_SIZE))
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        db.close()
+
+
+def stream_csv(chunks: Iterator[List[Tuple]]) -> Iterator[bytes]:
+    """CSV с заголовком; BOM нужен, чтобы Excel распознал UTF-8"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+
+    for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _StreamSink:
+    """Файлоподобный приемник для ParquetWriter: копит байты до отправки клиенту"""
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """Забрать накопленные байты"""
+        data = b"".join(self.parts)
+        self.parts.clear()
+        return data
+
+
+def _parquet_schema():
+    """Типы колонок Parquet в порядке EXPORT_COLUMNS"""
+    return pyarrow.schema([
+        ("appointment_id", pyarrow.int64()),
+        ("appointment_datetime", pyarrow.timestamp("us")),
+        ("status", pyarrow.string()),
+        ("client_id", pyarrow.int64()),
+        ("master_id", pyarrow.int64()),
+        ("master_name", pyarrow.string()),
+        ("service_id", pyarrow.int64()),
+        ("service_name", pyarrow.string()),
+        ("duration_minutes", pyarrow.int32()),
+        ("price", pyarrow.float64()),
+    ])
+
+
+def stream_parquet(chunks: Iterator[List[Tuple]]) -> Iterator[bytes]:
+    """Parquet: каждый кусок записывается отдельной группой строк и сразу отправляется"""
+    schema = _parquet_schema()
+    sink = _StreamSink()
+    writer = pyarrow.parquet.ParquetWriter(pyarrow.PythonFile(sink, mode="w"), schema)
+    try:
+        for chunk in chunks:
+            columns = zip(*chunk)
+            batch = pyarrow.record_batch(
+                [pyarrow.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema
+            )
+            writer.write_batch(batch)
+            yield sink.drain()
+    finally:
+        writer.close()
+    # Метаданные файла дописываются при закрытии
+    yield sink.drain()
+
+
+def stream_export(output_format: str, start_date: Optional[date], end_date: Optional[date]) -> Iterator[bytes]:
+    """Выгрузка записей за период в заданном формате"""
+    chunks = iter_chunks(start_date, end_date)
+    if output_format == "parquet":
+        return stream_parquet(chunks)
+    return stream_csv(chunks)
@@ -2,22 +2,41 @@
 BeautyPro REST API Server
 FastAPI приложение для салона красоты
 """
-from typing import Annotated, List, Optional
-from datetime import date
-from fastapi import FastAPI, Depends, HTTPException, status
+import base64
+from typing import Annotated, Any, Awaitable, Callable, Hashable, Iterator, List, Optional
+from datetime import date, datetime
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from server.database import engine, get_db, Base
-from server import crud, schemas, models
+from server.cache import catalog_cache
+from server.serialization import (
+    default_response_class, dump_json, etag_response, json_response, model_response, render_json
+)
+from server.database import engine, get_db, get_async_db, Base, SessionLocal
+from server import crud, crud_async, export, passwords, schemas, models, stats, tokens
 
 # Создаем таблицы
 Base.metadata.create_all(bind=engine)
 
+# create_all не добавляет новые индексы в уже существующие таблицы
+for table in Base.metadata.sorted_tables:
+    for index in table.indexes:
+        try:
+            index.create(bind=engine, checkfirst=True)
+        except IntegrityError:
+            # Уникальный индекс не создается, пока в таблице остаются дубликаты
+            print(f"Не удалось создать индекс {index.name}: в таблице {table.name} есть дубликаты")
+
 app = FastAPI(
     title="BeautyPro API",
     description="REST API для салона красоты BeautyPro",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=default_response_class()
 )
 
 # CORS настройки
@@ -32,6 +51,143 @@ app.add_middleware(
 # Dependency для получения сессии БД
 SessionDep = Annotated[Session, Depends(get_db)]
 
+# Асинхронная сессия для нагруженных эндпоинтов чтения: запрос не занимает
+# поток из пула, пока ждет ответа БД
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def get_token_payload(
+    credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(bearer_scheme)]
+) -> Optional[schemas.TokenPayload]:
+    """Dependency: содержимое токена из заголовка Authorization (если он передан)"""
+    if credentials is None:
+        return None
+    payload = tokens.verify_token(credentials.credentials)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Сессия недействительна или истекла, войдите заново"
+        )
+    return payload
+
+
+TokenDep = Annotated[Optional[schemas.TokenPayload], Depends(get_token_payload)]
+
+
+def get_client_id(token: TokenDep, client_id: Optional[int] = None) -> int:
+    """
+    Dependency: ID клиента запроса. Клиент определяется по токену;
+    администратор может указать client_id явно.
+    """
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Требуется авторизация"
+        )
+    if client_id is None or client_id == token.sub:
+        return token.sub
+    if token.role == "admin":
+        return client_id
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Нет доступа к записям другого клиента"
+    )
+
+
+ClientIdDep = Annotated[int, Depends(get_client_id)]
+
+
+def require_admin(token: TokenDep) -> schemas.TokenPayload:
+    """Dependency: запрос должен быть выполнен с токеном администратора"""
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Требуется авторизация"
+        )
+    if token.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Доступно только администратору"
+        )
+    return token
+
+
+AdminDep = Annotated[schemas.TokenPayload, Depends(require_admin)]
+
+async def cached_catalog(
+    request: Request,
+    key: Hashable,
+    response_type: Any,
+    load: Callable[[], Awaitable[Any]]
+) -> Response:
+    """
+    Ответ справочника из кэша; при промахе загружается из БД и сохраняется
+    в кэш уже сериализованным вместе с ETag
+    """
+    rendered = catalog_cache.get(key)
+    if rendered is None:
+        version = catalog_cache.version
+        rendered = render_json(response_type, await load())
+        catalog_cache.set(key, rendered, version)
+    return etag_response(request, rendered)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Непрозрачный курсор страницы из значений ключа сортировки"""
+    raw = "|".join(v.isoformat() if isinstance(v, datetime) else str(v) for v in values)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> List[str]:
+    """Значения ключа сортировки из курсора (ValueError, если курсор испорчен)"""
+    return base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+
+
+# Максимальная длина диапазона для /api/available-slots/range (около трех месяцев)
+MAX_SLOTS_RANGE_DAYS = 93
+
+# Максимальный размер страницы для постраничных списков
+MAX_PAGE_SIZE = 200
+
+# Максимальное число элементов в одном пакетном запросе
+MAX_BULK_ITEMS = 1000
+
+
+def check_bulk_size(items: list):
+    """Проверить размер пакета"""
+    if len(items) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"В пакете не может быть больше {MAX_BULK_ITEMS} элементов"
+        )
+
+
+def bulk_response(results: List[schemas.BulkItemResult]) -> schemas.BulkResponse:
+    """Сводный ответ пакетной операции"""
+    applied = sum(result.success for result in results)
+    return schemas.BulkResponse(applied=applied, failed=len(results) - applied, results=results)
+
+
+# Максимальная длина периода для отчетов /api/admin/stats (год)
+MAX_STATS_RANGE_DAYS = 366
+
+
+def check_stats_period(date_from: date, date_to: date):
+    """Проверить период отчета статистики"""
+    if date_to < date_from:
+        raise HTTPException(
+            status_code=400,
+            detail="Дата окончания диапазона раньше даты начала"
+        )
+    if (date_to - date_from).days >= MAX_STATS_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Диапазон не может превышать {MAX_STATS_RANGE_DAYS} дней"
+        )
+
 
 # ==================== STARTUP EVENT ====================
 
@@ -40,54 +196,109 @@ def startup_event():
     """Инициализация при запуске"""
     db = next(get_db())
     crud.init_database(db)
+    stats.ensure_built(db)
     db.close()
 
 
+@app.on_event("shutdown")
+def shutdown_event():
+    """Освобождение ресурсов при остановке"""
+    passwords.shutdown_executor()
+
+
 # ==================== AUTH ENDPOINTS ====================
 
 @app.post("/api/auth/register", response_model=schemas.UserResponse)
-def register(user: schemas.UserCreate, db: SessionDep):
+async def register(user: schemas.UserCreate, db: AsyncSessionDep):
     """Регистрация нового клиента"""
     # Проверяем, существует ли пользователь
-    existing = crud.get_user_by_phone(db, user.phone_number)
+    existing = await crud_async.get_user_by_phone(db, user.phone_number)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Пользователь с таким номером телефона уже существует"
         )
     
-    db_user = crud.create_user(db, user)
+    db_user = await crud_async.create_user(db, user)
     return db_user
 
 
-@app.post("/api/auth/login", response_model=schemas.UserResponse)
-def login(credentials: schemas.UserLogin, db: SessionDep):
-    """Авторизация пользователя"""
-    user = crud.authenticate_user(db, credentials.phone_number, credentials.password)
+@app.post("/api/auth/login", response_model=schemas.LoginResponse)
+async def login(credentials: schemas.UserLogin, db: AsyncSessionDep):
+    """Авторизация пользователя: возвращает токен для последующих запросов"""
+    user = await crud_async.authenticate_user(db, credentials.phone_number, credentials.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неверный номер телефона или пароль"
         )
-    return user
+    return schemas.LoginResponse(
+        id=user.id,
+        phone_number=user.phone_number,
+        full_name=user.full_name,
+        role=user.role,
+        access_token=tokens.issue_token(user)
+    )
 
 
 # ==================== PROFESSION ENDPOINTS ====================
 
 @app.get("/api/professions", response_model=List[schemas.ProfessionResponse])
-def get_professions(db: SessionDep):
+async def get_professions(request: Request, db: AsyncSessionDep):
     """Получить список всех профессий"""
-    return crud.get_professions(db)
+    return await cached_catalog(
+        request,
+        ("professions",),
+        List[schemas.ProfessionResponse],
+        lambda: crud_async.get_professions(db)
+    )
 
 
 # ==================== SERVICE ENDPOINTS ====================
 
 @app.get("/api/services", response_model=List[schemas.ServiceResponse])
-def get_services(db: SessionDep, profession_id: Optional[int] = None):
+async def get_services(request: Request, db: AsyncSessionDep, profession_id: Optional[int] = None):
     """Получить список услуг (можно фильтровать по профессии)"""
     if profession_id:
-        return crud.get_services_by_profession(db, profession_id)
-    return crud.get_services(db)
+        return await cached_catalog(
+            request,
+            ("services", profession_id),
+            List[schemas.ServiceResponse],
+            lambda: crud_async.get_services_by_profession(db, profession_id)
+        )
+    return await cached_catalog(
+        request,
+        ("services", None),
+        List[schemas.ServiceResponse],
+        lambda: crud_async.get_services(db)
+    )
+
+
+@app.post("/api/services/bulk", response_model=schemas.BulkResponse)
+def bulk_create_services(
+    admin: AdminDep,
+    services: List[schemas.ServiceCreate],
+    db: SessionDep,
+    atomic: bool = False
+):
+    """
+    Создать пакет услуг одной транзакцией (только для админа).
+    При atomic=true пакет с ошибками не применяется целиком.
+    """
+    check_bulk_size(services)
+    return bulk_response(crud.bulk_create_services(db, services, atomic))
+
+
+@app.put("/api/services/bulk", response_model=schemas.BulkResponse)
+def bulk_update_services(
+    admin: AdminDep,
+    services: List[schemas.ServiceBulkUpdate],
+    db: SessionDep,
+    atomic: bool = False
+):
+    """Обновить пакет услуг одной транзакцией (только для админа)"""
+    check_bulk_size(services)
+    return bulk_response(crud.bulk_update_services(db, services, atomic))
 
 
 @app.get("/api/services/{service_id}", response_model=schemas.ServiceResponse)
@@ -100,10 +311,47 @@ def get_service(service_id: int, db: SessionDep):
 
 
 @app.get("/api/services/{service_id}/masters", response_model=List[schemas.MasterResponse])
-def get_service_masters(service_id: int, db: SessionDep):
+async def get_service_masters(service_id: int, request: Request, db: AsyncSessionDep):
     """Получить мастеров, оказывающих услугу"""
-    masters = crud.get_masters_by_service(db, service_id)
-    return masters
+    return await cached_catalog(
+        request,
+        ("service_masters", service_id),
+        List[schemas.MasterResponse],
+        lambda: crud_async.get_masters_by_service(db, service_id)
+    )
+
+
+@app.get("/api/services/{service_id}/availability", response_model=schemas.ServiceAvailabilityResponse)
+def get_service_availability(service_id: int, target_date: date, db: SessionDep):
+    """Получить свободное время всех мастеров, оказывающих услугу"""
+    service = crud.get_service_by_id(db, service_id)
+    if not service:
+        raise HTTPException(status_code=404, detail="Услуга не найдена")
+    
+    availability = crud.get_service_availability(db, service_id, target_date)
+    
+    # Сводим слоты всех мастеров по времени для записи "к любому мастеру"
+    any_master = {}
+    for master, slots in availability:
+        for slot in slots:
+            if slot.time not in any_master:
+                any_master[slot.time] = schemas.AnyMasterSlot(
+                    time=slot.time,
+                    datetime=slot.datetime,
+                    master_id=master.id,
+                    master_ids=[]
+                )
+            any_master[slot.time].master_ids.append(master.id)
+    
+    return json_response(schemas.ServiceAvailabilityResponse, {
+        "date": target_date.isoformat(),
+        "service_id": service_id,
+        "masters": [
+            {"master": master, "slots": slots}
+            for master, slots in availability
+        ],
+        "any_master": [any_master[time] for time in sorted(any_master)]
+    })
 
 
 @app.post("/api/services", response_model=schemas.ServiceResponse)
@@ -133,9 +381,62 @@ def delete_service(service_id: int, db: SessionDep):
 # ==================== MASTER ENDPOINTS ====================
 
 @app.get("/api/masters", response_model=List[schemas.MasterResponse])
-def get_masters(db: SessionDep, active_only: bool = True):
+async def get_masters(request: Request, db: AsyncSessionDep, active_only: bool = True):
     """Получить список всех мастеров"""
-    return crud.get_masters(db, active_only)
+    return await cached_catalog(
+        request,
+        ("masters", active_only),
+        List[schemas.MasterResponse],
+        lambda: crud_async.get_masters(db, active_only)
+    )
+
+
+@app.get("/api/masters/page", response_model=schemas.MasterPage)
+async def get_masters_page(
+    db: AsyncSessionDep,
+    active_only: bool = True,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """Получить страницу мастеров (keyset по ID)"""
+    after_id = None
+    if cursor:
+        try:
+            after_id = int(decode_cursor(cursor)[0])
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректный курсор страницы")
+    
+    # Запрашиваем на одну строку больше, чтобы узнать, есть ли следующая страница
+    masters = await crud_async.get_masters_page(db, limit + 1, after_id, active_only)
+    next_cursor = encode_cursor(masters[limit - 1].id) if len(masters) > limit else None
+    return json_response(schemas.MasterPage, {"items": masters[:limit], "next_cursor": next_cursor})
+
+
+@app.post("/api/masters/bulk", response_model=schemas.BulkResponse)
+def bulk_create_masters(
+    admin: AdminDep,
+    masters: List[schemas.MasterCreate],
+    db: SessionDep,
+    atomic: bool = False
+):
+    """
+    Создать пакет мастеров одной транзакцией (только для админа).
+    При atomic=true пакет с ошибками не применяется целиком.
+    """
+    check_bulk_size(masters)
+    return bulk_response(crud.bulk_create_masters(db, masters, atomic))
+
+
+@app.put("/api/masters/bulk", response_model=schemas.BulkResponse)
+def bulk_update_masters(
+    admin: AdminDep,
+    masters: List[schemas.MasterBulkUpdate],
+    db: SessionDep,
+    atomic: bool = False
+):
+    """Обновить пакет мастеров одной транзакцией (только для админа)"""
+    check_bulk_size(masters)
+    return bulk_response(crud.bulk_update_masters(db, masters, atomic))
 
 
 @app.get("/api/masters/{master_id}", response_model=schemas.MasterResponse)
@@ -192,19 +493,47 @@ def assign_services(master_id: int, service_ids: List[int], db: SessionDep):
 # ==================== APPOINTMENT ENDPOINTS ====================
 
 @app.get("/api/appointments", response_model=List[schemas.AppointmentResponse])
-def get_appointments(
-    client_id: int,
-    db: SessionDep,
+async def get_appointments(
+    request: Request,
+    client_id: ClientIdDep,
+    db: AsyncSessionDep,
     status: Optional[str] = None,
     upcoming_only: bool = False
 ):
-    """Получить записи клиента"""
-    return crud.get_appointments_by_client(db, client_id, status, upcoming_only)
+    """Получить записи клиента (с ETag: если записи не менялись, ответ 304)"""
+    appointments = await crud_async.get_appointments_by_client(db, client_id, status, upcoming_only)
+    return etag_response(request, render_json(List[schemas.AppointmentResponse], appointments))
+
+
+@app.get("/api/appointments/page", response_model=schemas.AppointmentPage)
+async def get_appointments_page(
+    client_id: ClientIdDep,
+    db: AsyncSessionDep,
+    status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+):
+    """Получить страницу записей клиента, от новых к старым (keyset по дате и ID)"""
+    after = None
+    if cursor:
+        try:
+            after_datetime, after_id = decode_cursor(cursor)
+            after = (datetime.fromisoformat(after_datetime), int(after_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректный курсор страницы")
+    
+    # Запрашиваем на одну строку больше, чтобы узнать, есть ли следующая страница
+    appointments = await crud_async.get_appointments_page(db, client_id, limit + 1, after, status)
+    next_cursor = None
+    if len(appointments) > limit:
+        last = appointments[limit - 1]
+        next_cursor = encode_cursor(last.appointment_datetime, last.id)
+    return json_response(schemas.AppointmentPage, {"items": appointments[:limit], "next_cursor": next_cursor})
 
 
 @app.post("/api/appointments", response_model=schemas.AppointmentResponse)
 def create_appointment(
-    client_id: int,
+    client_id: ClientIdDep,
     appointment: schemas.AppointmentCreate,
     db: SessionDep
 ):
@@ -231,11 +560,17 @@ def create_appointment(
             detail="Выбранный мастер не оказывает данную услугу"
         )
     
-    return crud.create_appointment(db, client_id, appointment)
+    db_appointment = crud.create_appointment(db, client_id, appointment)
+    if not db_appointment:
+        raise HTTPException(
+            status_code=409,
+            detail="Это время уже занято, выберите другое"
+        )
+    return db_appointment
 
 
 @app.delete("/api/appointments/{appointment_id}", response_model=schemas.MessageResponse)
-def cancel_appointment(appointment_id: int, client_id: int, db: SessionDep):
+def cancel_appointment(appointment_id: int, client_id: ClientIdDep, db: SessionDep):
     """Отменить запись"""
     success = crud.cancel_appointment(db, appointment_id, client_id)
     if not success:
@@ -247,20 +582,188 @@ def cancel_appointment(appointment_id: int, client_id: int, db: SessionDep):
 
 
 @app.get("/api/available-slots", response_model=schemas.AvailableSlotsResponse)
-def get_available_slots(
+async def get_available_slots(
     master_id: int,
     service_id: int,
     target_date: date,
-    db: SessionDep
+    db: AsyncSessionDep
 ):
     """Получить доступные временные слоты"""
-    slots = crud.get_available_time_slots(db, master_id, service_id, target_date)
-    return schemas.AvailableSlotsResponse(
+    slots = await crud_async.get_available_time_slots(db, master_id, service_id, target_date)
+    return model_response(schemas.AvailableSlotsResponse(
         date=target_date.isoformat(),
         slots=slots
+    ))
+
+
+@app.get("/api/available-slots/range", response_model=schemas.AvailableSlotsRangeResponse)
+async def get_available_slots_range(
+    master_id: int,
+    service_id: int,
+    db: AsyncSessionDep,
+    date_from: date = Query(alias="from"),
+    date_to: date = Query(alias="to")
+):
+    """Получить доступные временные слоты на каждый день диапазона"""
+    if date_to < date_from:
+        raise HTTPException(
+            status_code=400,
+            detail="Дата окончания диапазона раньше даты начала"
+        )
+    if (date_to - date_from).days >= MAX_SLOTS_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Диапазон не может превышать {MAX_SLOTS_RANGE_DAYS} дней"
+        )
+    
+    days = await crud_async.get_available_time_slots_range(db, master_id, service_id, date_from, date_to)
+    return model_response(schemas.AvailableSlotsRangeResponse(
+        date_from=date_from.isoformat(),
+        date_to=date_to.isoformat(),
+        days=[
+            schemas.DaySlots(date=day.isoformat(), slots=slots, free_count=len(slots))
+            for day, slots in days
+        ]
+    ))
+
+
+# ==================== ADMIN ENDPOINTS ====================
+
+def stream_appointments(output_format: str, **filters) -> Iterator[bytes]:
+    """
+    Сериализовать записи по одной по мере чтения из серверного курсора.
+    Сессия открывается внутри генератора: она нужна, пока отправляется ответ.
+    """
+    db = SessionLocal()
+    try:
+        separator = b""
+        if output_format == "json":
+            yield b"["
+        for appointment in crud.iter_appointments(db, **filters):
+            row = dump_json(schemas.AppointmentWithClient, appointment)
+            if output_format == "json":
+                yield separator + row
+                separator = b","
+            else:
+                yield row + b"\n"
+        if output_format == "json":
+            yield b"]"
+    finally:
+        db.close()
+
+
+@app.get("/api/admin/appointments", response_model=List[schemas.AppointmentWithClient])
+def get_all_appointments(
+    admin: AdminDep,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    master_id: Optional[int] = None,
+    service_id: Optional[int] = None,
+    status: Optional[str] = None,
+    output_format: str = Query("ndjson", alias="format", pattern="^(ndjson|json)$")
+):
+    """
+    Все записи салона с фильтрами (только для админа). Ответ передается
+    потоком: NDJSON (по записи в строке) или JSON-массив
+    """
+    media_type = "application/x-ndjson" if output_format == "ndjson" else "application/json"
+    return StreamingResponse(
+        stream_appointments(
+            output_format,
+            start_date=date_from,
+            end_date=date_to,
+            master_id=master_id,
+            service_id=service_id,
+            status=status
+        ),
+        media_type=media_type
     )
 
 
+@app.get("/api/admin/export/appointments")
+def export_appointments(
+    admin: AdminDep,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    output_format: str = Query("csv", alias="format", pattern="^(csv|parquet)$")
+):
+    """Выгрузка записей с мастерами и ценами услуг для бухгалтерии (CSV или Parquet)"""
+    if output_format == "parquet" and not export.parquet_available():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Выгрузка в Parquet недоступна: на сервере не установлен pyarrow"
+        )
+    
+    media_type, extension = export.EXPORT_FORMATS[output_format]
+    filename = f"appointments_{date_from or 'all'}_{date_to or 'all'}.{extension}"
+    return StreamingResponse(
+        export.stream_export(output_format, date_from, date_to),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@app.get("/api/admin/stats/revenue", response_model=schemas.RevenueStatsResponse)
+def get_revenue_stats(
+    admin: AdminDep,
+    db: SessionDep,
+    date_from: date = Query(alias="from"),
+    date_to: date = Query(alias="to"),
+    group_by: List[str] = Query(["day", "master", "service"])
+):
+    """Выручка за период по дням, мастерам и/или услугам (из дневной сводки)"""
+    check_stats_period(date_from, date_to)
+    unknown = set(group_by) - set(stats.REVENUE_GROUPS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Неизвестная группировка: {', '.join(sorted(unknown))}"
+        )
+    
+    return stats.get_revenue(db, date_from, date_to, list(dict.fromkeys(group_by)))
+
+
+@app.get("/api/admin/stats/utilization", response_model=schemas.UtilizationStatsResponse)
+def get_utilization_stats(
+    admin: AdminDep,
+    db: SessionDep,
+    date_from: date = Query(alias="from"),
+    date_to: date = Query(alias="to"),
+    master_id: Optional[int] = None
+):
+    """Загрузка мастеров за период: занятые минуты относительно рабочего времени"""
+    check_stats_period(date_from, date_to)
+    return stats.get_utilization(db, date_from, date_to, master_id)
+
+
+@app.post("/api/admin/stats/rebuild", response_model=schemas.StatsRebuildResponse)
+def rebuild_stats(
+    admin: AdminDep,
+    db: SessionDep,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to")
+):
+    """Пересобрать дневную сводку по таблице записей (весь период, если даты не заданы)"""
+    return schemas.StatsRebuildResponse(rows=stats.rebuild(db, date_from, date_to))
+
+
+@app.get("/api/admin/stats/check", response_model=schemas.StatsCheckResponse)
+def check_stats(
+    admin: AdminDep,
+    db: SessionDep,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to")
+):
+    """Сверить дневную сводку с полным пересчетом по записям"""
+    return stats.check(db, date_from, date_to)
+
+
+@app.get("/api/admin/cache", response_model=schemas.CacheStatsResponse)
+def get_cache_stats(admin: AdminDep):
+    """Статистика кэша справочников"""
+    return schemas.CacheStatsResponse(**catalog_cache.stats())
+
+
 # ==================== HEALTH CHECK ====================
 
 @app.get("/api/health")
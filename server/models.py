@@ -2,8 +2,8 @@
 SQLAlchemy ORM модели для BeautyPro
 """
 from typing import List, Optional
-from datetime import datetime
-from sqlalchemy import String, Integer, Float, ForeignKey, DateTime, Table, Column
+from datetime import date, datetime
+from sqlalchemy import String, Integer, Float, ForeignKey, Date, DateTime, Table, Column, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from server.database import Base
 
@@ -96,6 +96,23 @@ class Service(Base):
 class Appointment(Base):
     """Модель записи на процедуру"""
     __tablename__ = "appointments"
+    __table_args__ = (
+        # Поиск занятых слотов: мастер + диапазон дат + статус
+        Index("ix_appointments_master_datetime_status", "master_id", "appointment_datetime", "status"),
+        # Выборки салона за период (админка, выгрузки)
+        Index("ix_appointments_datetime", "appointment_datetime"),
+        # История клиента, отсортированная по дате
+        Index("ix_appointments_client_datetime", "client_id", "appointment_datetime"),
+        # Защита от двойной записи к мастеру на одно и то же время
+        Index(
+            "ux_appointments_master_datetime_scheduled",
+            "master_id",
+            "appointment_datetime",
+            unique=True,
+            sqlite_where=text("status = 'scheduled'"),
+            postgresql_where=text("status = 'scheduled'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     client_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -111,3 +128,21 @@ class Appointment(Base):
 
     def __repr__(self) -> str:
         return f"Appointment(id={self.id}, datetime={self.appointment_datetime}, status={self.status})"
+
+
+class DailyStats(Base):
+    """
+    Дневная сводка по мастеру и услуге: активные записи, занятые минуты и выручка.
+    Обновляется вместе с записями, поэтому отчеты не сканируют таблицу appointments
+    """
+    __tablename__ = "daily_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    master_id: Mapped[int] = mapped_column(primary_key=True)
+    service_id: Mapped[int] = mapped_column(primary_key=True)
+    appointments_count: Mapped[int] = mapped_column(Integer, default=0)
+    booked_minutes: Mapped[int] = mapped_column(Integer, default=0)
+    revenue: Mapped[float] = mapped_column(Float, default=0)
+
+    def __repr__(self) -> str:
+        return f"DailyStats(day={self.day}, master_id={self.master_id}, service_id={self.service_id})"
@@ -0,0 +1,67 @@
+"""
+Хеширование паролей bcrypt в отдельном ограниченном пуле
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple
+from passlib.context import CryptContext
+
+from server import config
+
+# Стоимость bcrypt задается настройкой; хеши с другой стоимостью
+# пересчитываются при следующем успешном входе
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=config.BCRYPT_ROUNDS)
+
+_executor: Optional[Executor] = None
+
+
+def hash_password(password: str) -> str:
+    """Хеширование пароля"""
+    return pwd_context.hash(password)
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    """Проверка пароля"""
+    return pwd_context.verify(password, hashed)
+
+
+def verify_and_update(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """Проверка пароля; второй элемент - новый хеш, если стоимость устарела"""
+    return pwd_context.verify_and_update(password, hashed)
+
+
+def get_executor() -> Executor:
+    """
+    Пул для работы с паролями. Его размер ограничивает число одновременных
+    вычислений bcrypt, поэтому волна входов не занимает все потоки сервера.
+    """
+    global _executor
+    if _executor is None:
+        if config.PASSWORD_EXECUTOR == "process":
+            _executor = ProcessPoolExecutor(max_workers=config.PASSWORD_WORKERS)
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.PASSWORD_WORKERS,
+                thread_name_prefix="bcrypt"
+            )
+    return _executor
+
+
+def shutdown_executor():
+    """Остановить пул при завершении сервера"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def hash_password_async(password: str) -> str:
+    """Хеширование пароля в пуле, не блокируя обработку запросов"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), hash_password, password)
+
+
+async def verify_and_update_async(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """Проверка пароля в пуле, не блокируя обработку запросов"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), verify_and_update, password, hashed)
@@ -32,6 +32,19 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class LoginResponse(UserResponse):
+    """Ответ на вход: пользователь и токен сессии"""
+    access_token: str
+    token_type: str = "bearer"
+
+
+class TokenPayload(BaseModel):
+    """Содержимое токена сессии"""
+    sub: int  # ID пользователя
+    role: str
+    exp: int  # Unix-время окончания действия
+
+
 # ==================== PROFESSION SCHEMAS ====================
 
 class ProfessionBase(BaseModel):
@@ -123,6 +136,33 @@ class MasterBrief(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# ==================== BULK SCHEMAS ====================
+
+class ServiceBulkUpdate(ServiceUpdate):
+    """Обновление услуги в пакете"""
+    id: int
+
+
+class MasterBulkUpdate(MasterUpdate):
+    """Обновление мастера в пакете"""
+    id: int
+
+
+class BulkItemResult(BaseModel):
+    """Результат для одного элемента пакета (index - позиция в запросе)"""
+    index: int
+    success: bool
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    """Результат пакетной операции"""
+    applied: int
+    failed: int
+    results: List[BulkItemResult]
+
+
 # ==================== APPOINTMENT SCHEMAS ====================
 
 class AppointmentBase(BaseModel):
@@ -154,6 +194,20 @@ class AppointmentWithClient(AppointmentResponse):
     model_config = ConfigDict(from_attributes=True)
 
 
+# ==================== PAGINATION SCHEMAS ====================
+
+class AppointmentPage(BaseModel):
+    """Страница записей; next_cursor передается в следующий запрос"""
+    items: List[AppointmentResponse]
+    next_cursor: Optional[str] = None
+
+
+class MasterPage(BaseModel):
+    """Страница мастеров; next_cursor передается в следующий запрос"""
+    items: List[MasterResponse]
+    next_cursor: Optional[str] = None
+
+
 # ==================== TIME SLOT SCHEMAS ====================
 
 class TimeSlot(BaseModel):
@@ -168,6 +222,122 @@ class AvailableSlotsResponse(BaseModel):
     slots: List[TimeSlot]
 
 
+class DaySlots(BaseModel):
+    """Доступные слоты на один день диапазона"""
+    date: str
+    slots: List[TimeSlot]
+    free_count: int
+
+
+class AvailableSlotsRangeResponse(BaseModel):
+    """Ответ с доступными слотами на диапазон дат"""
+    date_from: str
+    date_to: str
+    days: List[DaySlots]
+
+
+class MasterSlots(BaseModel):
+    """Свободные слоты одного мастера"""
+    master: MasterBrief
+    slots: List[TimeSlot]
+
+
+class AnyMasterSlot(TimeSlot):
+    """Слот для записи к любому мастеру"""
+    master_id: int  # Первый свободный мастер в это время
+    master_ids: List[int]  # Все мастера, свободные в это время
+
+
+class ServiceAvailabilityResponse(BaseModel):
+    """Свободное время всех мастеров, оказывающих услугу"""
+    date: str
+    service_id: int
+    masters: List[MasterSlots]
+    any_master: List[AnyMasterSlot]
+
+
+# ==================== ADMIN SCHEMAS ====================
+
+class CacheStatsResponse(BaseModel):
+    """Статистика кэша справочников"""
+    version: int
+    entries: int
+    hits: int
+    misses: int
+    invalidations: int
+
+
+class StatsRebuildResponse(BaseModel):
+    """Результат пересборки статистики"""
+    rows: int
+
+
+class StatsValues(BaseModel):
+    """Показатели одной строки дневной сводки"""
+    appointments: int
+    booked_minutes: int
+    revenue: float
+
+
+class StatsMismatch(BaseModel):
+    """Расхождение сводки с пересчетом по записям"""
+    date: str
+    master_id: int
+    service_id: int
+    stored: StatsValues
+    expected: StatsValues
+
+
+class StatsCheckResponse(BaseModel):
+    """Результат проверки сводки"""
+    consistent: bool
+    checked_rows: int
+    mismatches: List[StatsMismatch]
+
+
+class RevenueRow(BaseModel):
+    """Выручка в разрезе дня, мастера и/или услуги"""
+    date: Optional[str] = None
+    master_id: Optional[int] = None
+    service_id: Optional[int] = None
+    appointments: int
+    revenue: float
+
+
+class RevenueStatsResponse(BaseModel):
+    """Выручка за период"""
+    date_from: str
+    date_to: str
+    total_appointments: int
+    total_revenue: float
+    rows: List[RevenueRow]
+
+
+class DayUtilization(BaseModel):
+    """Загрузка мастера за день"""
+    date: str
+    booked_minutes: int
+    utilization: float
+
+
+class MasterUtilization(BaseModel):
+    """Загрузка мастера за период (доля занятых рабочих минут)"""
+    master_id: int
+    full_name: str
+    booked_minutes: int
+    working_minutes: int
+    utilization: float
+    days: List[DayUtilization]
+
+
+class UtilizationStatsResponse(BaseModel):
+    """Загрузка мастеров за период"""
+    date_from: str
+    date_to: str
+    working_minutes_per_day: int
+    masters: List[MasterUtilization]
+
+
 # ==================== GENERIC RESPONSES ====================
 
 class MessageResponse(BaseModel):
@@ -0,0 +1,84 @@
+"""
+Быстрая сериализация ответов API
+"""
+import hashlib
+from importlib.util import find_spec
+from typing import Any, NamedTuple
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from server import config
+
+try:
+    from fastapi.responses import ORJSONResponse
+except ImportError:  # orjson - необязательная зависимость
+    ORJSONResponse = None
+
+# Адаптеры pydantic по типу ответа: их создание дорогое, поэтому создаются один раз
+_adapters = {}
+
+
+class RenderedJSON(NamedTuple):
+    """Сериализованный ответ и его ETag"""
+    body: bytes
+    etag: str
+
+
+def default_response_class() -> type:
+    """Класс ответа по умолчанию: ORJSONResponse, если включен и установлен orjson"""
+    if config.JSON_RESPONSE == "orjson":
+        # fastapi объявляет ORJSONResponse и без пакета orjson - проверяем сам пакет
+        if ORJSONResponse is None or find_spec("orjson") is None:
+            print("BEAUTYPRO_JSON_RESPONSE=orjson, но пакет orjson не установлен - используется JSONResponse")
+            return JSONResponse
+        return ORJSONResponse
+    return JSONResponse
+
+
+def get_adapter(response_type: Any) -> TypeAdapter:
+    """TypeAdapter для типа ответа"""
+    adapter = _adapters.get(response_type)
+    if adapter is None:
+        adapter = _adapters[response_type] = TypeAdapter(response_type)
+    return adapter
+
+
+def dump_json(response_type: Any, value: Any) -> bytes:
+    """
+    Один проход pydantic по ORM-объектам (from_attributes) и сериализация
+    в JSON на стороне pydantic-core, без jsonable_encoder и json.dumps
+    """
+    adapter = get_adapter(response_type)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+def render_json(response_type: Any, value: Any) -> RenderedJSON:
+    """Сериализовать ответ и вычислить его ETag"""
+    body = dump_json(response_type, value)
+    return RenderedJSON(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def json_response(response_type: Any, value: Any) -> Response:
+    """Готовый JSON-ответ: FastAPI не будет повторно проверять его по response_model"""
+    return Response(content=dump_json(response_type, value), media_type="application/json")
+
+
+def model_response(model: BaseModel) -> Response:
+    """JSON-ответ из уже собранной схемы без повторной валидации"""
+    return Response(
+        content=get_adapter(type(model)).dump_json(model),
+        media_type="application/json"
+    )
+
+
+def etag_response(request: Request, rendered: RenderedJSON) -> Response:
+    """Ответ с ETag; если у клиента та же версия (If-None-Match) - 304 без тела"""
+    headers = {"ETag": rendered.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        validators = [v.strip() for v in if_none_match.split(",")]
+        if rendered.etag in validators or "*" in validators:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
@@ -0,0 +1,290 @@
+"""
+Предрассчитанная статистика: выручка и загрузка мастеров по дням
+"""
+from typing import Dict, List, Optional, Sequence
+from datetime import date, datetime
+from sqlalchemy import Date, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from server import models, schemas
+from server.availability import WORK_START_HOUR, WORK_END_HOUR
+
+
+# Рабочих минут у мастера в день (9:00 - 20:00)
+WORKING_MINUTES_PER_DAY = (WORK_END_HOUR - WORK_START_HOUR) * 60
+
+# Записи, которые занимают время мастера и приносят выручку
+COUNTED_STATUSES = ("scheduled", "completed")
+
+# Колонки сводки, по которым можно группировать выручку
+REVENUE_GROUPS = {
+    "day": models.DailyStats.day,
+    "master": models.DailyStats.master_id,
+    "service": models.DailyStats.service_id,
+}
+
+# Допустимое расхождение выручки при проверке (накопленная погрешность float)
+REVENUE_TOLERANCE = 0.01
+
+
+# ==================== ИНКРЕМЕНТАЛЬНОЕ ОБНОВЛЕНИЕ ====================
+
+def _upsert(db: Session):
+    """INSERT ... ON CONFLICT для диалекта текущего подключения"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
+def record_appointment(
+    db: Session,
+    appointment_datetime: datetime,
+    master_id: int,
+    service: models.Service,
+    sign: int = 1
+):
+    """
+    Учесть запись в дневной сводке (sign=1) или убрать ее (sign=-1).
+    Выполняется в транзакции вызывающего кода одним атомарным UPSERT.
+    """
+    stats = models.DailyStats
+    statement = _upsert(db)(stats).values(
+        day=appointment_datetime.date(),
+        master_id=master_id,
+        service_id=service.id,
+        appointments_count=sign,
+        booked_minutes=sign * service.duration_minutes,
+        revenue=sign * service.price
+    )
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[stats.day, stats.master_id, stats.service_id],
+        set_={
+            "appointments_count": stats.appointments_count + statement.excluded.appointments_count,
+            "booked_minutes": stats.booked_minutes + statement.excluded.booked_minutes,
+            "revenue": stats.revenue + statement.excluded.revenue,
+        }
+    ))
+
+
+# ==================== ПЕРЕСЧЕТ ====================
+
+def _recompute_query(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    service_ids: Optional[Sequence[int]] = None
+):
+    """Сводка, посчитанная заново по таблице appointments"""
+    day = func.date(models.Appointment.appointment_datetime, type_=Date)
+    query = select(
+        day.label("day"),
+        models.Appointment.master_id,
+        models.Appointment.service_id,
+        func.count().label("appointments_count"),
+        func.sum(models.Service.duration_minutes).label("booked_minutes"),
+        func.sum(models.Service.price).label("revenue")
+    ).join(
+        models.Service, models.Appointment.service_id == models.Service.id
+    ).where(
+        models.Appointment.status.in_(COUNTED_STATUSES)
+    )
+
+    if start_date:
+        query = query.where(
+            models.Appointment.appointment_datetime >= datetime.combine(start_date, datetime.min.time())
+        )
+    if end_date:
+        query = query.where(
+            models.Appointment.appointment_datetime <= datetime.combine(end_date, datetime.max.time())
+        )
+    if service_ids is not None:
+        query = query.where(models.Appointment.service_id.in_(service_ids))
+
+    return query.group_by(day, models.Appointment.master_id, models.Appointment.service_id)
+
+
+def _filter_stats(
+    query,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    service_ids: Optional[Sequence[int]] = None
+):
+    """Ограничить строки сводки периодом и услугами"""
+    if start_date:
+        query = query.where(models.DailyStats.day >= start_date)
+    if end_date:
+        query = query.where(models.DailyStats.day <= end_date)
+    if service_ids is not None:
+        query = query.where(models.DailyStats.service_id.in_(service_ids))
+    return query
+
+
+def refresh_rows(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    service_ids: Optional[Sequence[int]] = None
+) -> int:
+    """
+    Пересчитать строки сводки за период (или по отдельным услугам) одним
+    INSERT ... SELECT. Не фиксирует транзакцию; возвращает число строк.
+    """
+    db.execute(_filter_stats(delete(models.DailyStats), start_date, end_date, service_ids))
+    result = db.execute(
+        insert(models.DailyStats).from_select(
+            ["day", "master_id", "service_id", "appointments_count", "booked_minutes", "revenue"],
+            _recompute_query(start_date, end_date, service_ids)
+        )
+    )
+    return result.rowcount
+
+
+def rebuild(db: Session, start_date: Optional[date] = None, end_date: Optional[date] = None) -> int:
+    """Полностью пересобрать сводку за период (по умолчанию - за все время)"""
+    rows = refresh_rows(db, start_date, end_date)
+    db.commit()
+    return rows
+
+
+def ensure_built(db: Session):
+    """Собрать сводку, если она пуста, а записи уже есть (первый запуск на старой БД)"""
+    if db.query(models.DailyStats).first() is None and db.query(models.Appointment).first() is not None:
+        rows = rebuild(db)
+        print(f"Статистика пересобрана: {rows} строк")
+
+
+def check(
+    db: Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> schemas.StatsCheckResponse:
+    """Сравнить сводку с полным пересчетом по таблице appointments"""
+    expected = {
+        (row.day, row.master_id, row.service_id): (row.appointments_count, row.booked_minutes, row.revenue)
+        for row in db.execute(_recompute_query(start_date, end_date))
+    }
+    stored = {
+        (row.day, row.master_id, row.service_id): (row.appointments_count, row.booked_minutes, row.revenue)
+        for row in db.execute(_filter_stats(select(models.DailyStats.__table__), start_date, end_date))
+    }
+
+    empty = (0, 0, 0.0)
+    mismatches = []
+    for key in sorted(expected.keys() | stored.keys()):
+        want = expected.get(key, empty)
+        have = stored.get(key, empty)
+        if want[:2] != have[:2] or abs(want[2] - have[2]) > REVENUE_TOLERANCE:
+            day, master_id, service_id = key
+            mismatches.append(schemas.StatsMismatch(
+                date=day.isoformat(),
+                master_id=master_id,
+                service_id=service_id,
+                stored=schemas.StatsValues(appointments=have[0], booked_minutes=have[1], revenue=have[2]),
+                expected=schemas.StatsValues(appointments=want[0], booked_minutes=want[1], revenue=want[2])
+            ))
+
+    return schemas.StatsCheckResponse(
+        consistent=not mismatches,
+        checked_rows=len(expected),
+        mismatches=mismatches
+    )
+
+
+# ==================== ОТЧЕТЫ ====================
+
+def get_revenue(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    group_by: Sequence[str]
+) -> schemas.RevenueStatsResponse:
+    """Выручка и число записей за период с группировкой по дню, мастеру и/или услуге"""
+    columns = [REVENUE_GROUPS[name] for name in group_by]
+    query = _filter_stats(
+        select(
+            *columns,
+            func.sum(models.DailyStats.appointments_count).label("appointments"),
+            func.sum(models.DailyStats.revenue).label("revenue")
+        ),
+        start_date,
+        end_date
+    ).having(func.sum(models.DailyStats.appointments_count) > 0)
+    if columns:
+        query = query.group_by(*columns).order_by(*columns)
+
+    rows = []
+    for row in db.execute(query):
+        values = row._mapping
+        rows.append(schemas.RevenueRow(
+            date=values["day"].isoformat() if "day" in group_by else None,
+            master_id=values["master_id"] if "master" in group_by else None,
+            service_id=values["service_id"] if "service" in group_by else None,
+            appointments=values["appointments"],
+            revenue=values["revenue"]
+        ))
+
+    return schemas.RevenueStatsResponse(
+        date_from=start_date.isoformat(),
+        date_to=end_date.isoformat(),
+        total_appointments=sum(row.appointments for row in rows),
+        total_revenue=sum(row.revenue for row in rows),
+        rows=rows
+    )
+
+
+def get_utilization(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    master_id: Optional[int] = None
+) -> schemas.UtilizationStatsResponse:
+    """Загрузка мастеров за период: занятые минуты / рабочие минуты"""
+    masters_query = db.query(models.Master)
+    if master_id:
+        masters_query = masters_query.filter(models.Master.id == master_id)
+    else:
+        masters_query = masters_query.filter(models.Master.is_active == True)
+    masters = masters_query.order_by(models.Master.id).all()
+
+    query = _filter_stats(
+        select(
+            models.DailyStats.master_id,
+            models.DailyStats.day,
+            func.sum(models.DailyStats.booked_minutes).label("booked_minutes")
+        ),
+        start_date,
+        end_date
+    )
+    if master_id:
+        query = query.where(models.DailyStats.master_id == master_id)
+    query = query.group_by(models.DailyStats.master_id, models.DailyStats.day).order_by(models.DailyStats.day)
+
+    days_by_master: Dict[int, List[schemas.DayUtilization]] = {}
+    for row in db.execute(query):
+        if row.booked_minutes > 0:
+            days_by_master.setdefault(row.master_id, []).append(schemas.DayUtilization(
+                date=row.day.isoformat(),
+                booked_minutes=row.booked_minutes,
+                utilization=row.booked_minutes / WORKING_MINUTES_PER_DAY
+            ))
+
+    working_minutes = ((end_date - start_date).days + 1) * WORKING_MINUTES_PER_DAY
+    result = []
+    for master in masters:
+        days = days_by_master.get(master.id, [])
+        booked_minutes = sum(day.booked_minutes for day in days)
+        result.append(schemas.MasterUtilization(
+            master_id=master.id,
+            full_name=master.full_name,
+            booked_minutes=booked_minutes,
+            working_minutes=working_minutes,
+            utilization=booked_minutes / working_minutes,
+            days=days
+        ))
+
+    return schemas.UtilizationStatsResponse(
+        date_from=start_date.isoformat(),
+        date_to=end_date.isoformat(),
+        working_minutes_per_day=WORKING_MINUTES_PER_DAY,
+        masters=result
+    )
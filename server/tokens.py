@@ -0,0 +1,68 @@
+"""
+Подписанные токены сессии (HMAC-SHA256) с кэшем проверенных токенов
+"""
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from server import config, models, schemas
+
+_SECRET = config.TOKEN_SECRET.encode()
+
+# LRU-кэш уже проверенных токенов: повторная проверка - поиск в словаре
+_verified: "OrderedDict[str, schemas.TokenPayload]" = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: str) -> str:
+    return _b64encode(hmac.new(_SECRET, payload.encode(), hashlib.sha256).digest())
+
+
+def issue_token(user: models.User) -> str:
+    """Выдать токен пользователю после успешного входа"""
+    payload = {
+        "sub": user.id,
+        "role": user.role,
+        "exp": int(time.time()) + config.TOKEN_TTL_SECONDS,
+    }
+    encoded = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return f"{encoded}.{_sign(encoded)}"
+
+
+def verify_token(token: str) -> Optional[schemas.TokenPayload]:
+    """Проверить подпись и срок действия токена; None, если токен недействителен"""
+    with _verified_lock:
+        payload = _verified.get(token)
+        if payload is not None:
+            _verified.move_to_end(token)
+
+    if payload is None:
+        encoded, _, signature = token.partition(".")
+        if not signature or not hmac.compare_digest(signature, _sign(encoded)):
+            return None
+        try:
+            payload = schemas.TokenPayload.model_validate_json(_b64decode(encoded))
+        except ValueError:
+            return None
+
+        with _verified_lock:
+            _verified[token] = payload
+            if len(_verified) > config.TOKEN_CACHE_SIZE:
+                _verified.popitem(last=False)
+
+    if payload.exp < time.time():
+        return None
+    return payload
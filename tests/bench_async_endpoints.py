@@ -0,0 +1,140 @@
+"""
+Бенчмарк асинхронных эндпоинтов: запросов в секунду при высокой конкурентности
+для синхронного обработчика (Session, пул потоков) и асинхронного (AsyncSession)
+"""
+import asyncio
+import os
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from server import crud, crud_async, schemas
+from server.database import ENGINE_PROFILES, Base, engine_options
+
+pytestmark = pytest.mark.bench
+
+REQUESTS = int(os.environ.get("BEAUTYPRO_BENCH_ROWS", 2000))
+CONCURRENCY = 200
+
+# Пул без ограничения overflow: сравнивается пропускная способность
+UNBOUNDED_POOL = {"pool_size": ENGINE_PROFILES["production"]["pool_size"], "max_overflow": -1}
+
+# Пул профиля default с коротким ожиданием соединения. Синхронные обработчики занимают
+# все потоки пула FastAPI ожиданием соединения, а закрытие сессий, которое вернуло бы
+# соединения, ждет свободный поток - запросы падают по pool_timeout
+BOUNDED_POOL = {
+    "pool_size": ENGINE_PROFILES["default"]["pool_size"],
+    "max_overflow": ENGINE_PROFILES["default"]["max_overflow"],
+    "pool_timeout": 2,
+}
+BOUNDED_REQUESTS = 400
+
+
+def bench_app(path: str, pool: dict) -> FastAPI:
+    """Одни и те же запросы в синхронном и асинхронном вариантах на базе бенчмарка"""
+    sync_engine = create_engine(f"sqlite:///{path}", **{**engine_options(), **pool})
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", **{**engine_options(is_async=True), **pool}
+    )
+    Base.metadata.create_all(bind=sync_engine)
+    session_factory = sessionmaker(bind=sync_engine, autoflush=False)
+    async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    with session_factory() as db:
+        crud.init_database(db)  # Пропускается, если данные уже есть
+
+    def get_db():
+        with session_factory() as db:
+            yield db
+
+    async def get_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    target_date = date.today() + timedelta(days=1)
+
+    @app.get("/sync/masters", response_model=List[schemas.MasterResponse])
+    def sync_masters(db=Depends(get_db)):
+        return crud.get_masters(db)
+
+    @app.get("/async/masters", response_model=List[schemas.MasterResponse])
+    async def async_masters(db=Depends(get_async_db)):
+        return await crud_async.get_masters(db)
+
+    @app.get("/sync/slots", response_model=List[schemas.TimeSlot])
+    def sync_slots(master_id: int, db=Depends(get_db)):
+        return crud.get_available_time_slots(db, master_id, 1, target_date)
+
+    @app.get("/async/slots", response_model=List[schemas.TimeSlot])
+    async def async_slots(master_id: int, db=Depends(get_async_db)):
+        return await crud_async.get_available_time_slots(db, master_id, 1, target_date)
+
+    app.state.engines = (sync_engine, async_engine)
+    return app
+
+
+async def measure(app: FastAPI, url: str, requests: int) -> Tuple[float, int]:
+    """requests запросов, не более CONCURRENCY одновременно: (запросов в секунду, ошибок)"""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    errors = 0
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def one(number: int):
+            nonlocal errors
+            async with semaphore:
+                response = await client.get(url.format(master_id=number % 15 + 1))
+                if response.status_code != 200:
+                    errors += 1
+
+        await one(0)  # Прогрев: пул соединений и кэш запросов SQLAlchemy
+        started = time.perf_counter()
+        await asyncio.gather(*(one(number) for number in range(requests)))
+        return requests / (time.perf_counter() - started), errors
+
+
+def run_variants(path: str, pool: dict, urls: List[str], requests: int) -> Dict[Tuple[str, str], Tuple[float, int]]:
+    app = bench_app(path, pool)
+
+    async def run():
+        results = {}
+        for url in urls:
+            for variant in ("sync", "async"):
+                results[url, variant] = await measure(app, f"/{variant}/{url}", requests)
+        await app.state.engines[1].dispose()
+        return results
+
+    try:
+        return asyncio.run(run())
+    finally:
+        app.state.engines[0].dispose()
+
+
+def test_async_endpoints_throughput(tmp_path, bench_report):
+    path = str(tmp_path / "bench.db")
+    urls = ["masters", "slots?master_id={master_id}"]
+
+    results = run_variants(path, UNBOUNDED_POOL, urls, REQUESTS)
+    for url in urls:
+        (sync_rps, _), (async_rps, _) = results[url, "sync"], results[url, "async"]
+        bench_report(
+            f"/{url.split('?')[0]}, {CONCURRENCY} одновременных, пул без ограничения: "
+            f"sync {sync_rps:.0f} запр/с, async {async_rps:.0f} запр/с"
+        )
+
+    results = run_variants(path, BOUNDED_POOL, urls[:1], BOUNDED_REQUESTS)
+    (sync_rps, sync_errors), (async_rps, async_errors) = results[urls[0], "sync"], results[urls[0], "async"]
+    bench_report(
+        f"/masters, {CONCURRENCY} одновременных, пул 5 + 10: "
+        f"sync {sync_rps:.0f} запр/с, ошибок {sync_errors}/{BOUNDED_REQUESTS}; "
+        f"async {async_rps:.0f} запр/с, ошибок {async_errors}/{BOUNDED_REQUESTS}"
+    )
+    # Асинхронные обработчики ждут соединения в цикле событий, не занимая потоки:
+    # в очереди к пулу они не зависают (редкие ошибки - очередь длиннее pool_timeout)
+    assert async_errors < sync_errors
@@ -0,0 +1,54 @@
+"""
+Бенчмарк пакетных операций справочника: 1000 отдельных запросов создания
+против одного пакетного запроса (время и число SQL-запросов)
+"""
+import os
+import time
+
+import pytest
+
+from server import models, tokens
+
+pytestmark = pytest.mark.bench
+
+ITEMS = int(os.environ.get("BEAUTYPRO_BENCH_ROWS", 1000))
+
+CASES = {
+    "услуги": (
+        "/api/services",
+        lambda number: {"name": f"Услуга бенчмарка {number}", "price": 1000 + number, "duration_minutes": 30}
+    ),
+    "мастера": (
+        "/api/masters",
+        lambda number: {"full_name": f"Мастер бенчмарка {number}", "profession_id": 1, "service_ids": [1, 2]}
+    ),
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_bulk_create_vs_single(api, db, statements, bench_report, name):
+    url, payload = CASES[name]
+    admin = db.query(models.User).filter(models.User.role == "admin").first()
+    headers = {"Authorization": f"Bearer {tokens.issue_token(admin)}"}
+
+    statements.count = 0
+    started = time.perf_counter()
+    for number in range(ITEMS):
+        response = api.post(url, json=payload(number), headers=headers)
+        assert response.status_code == 200, response.text
+    single_seconds, single_statements = time.perf_counter() - started, statements.count
+
+    statements.count = 0
+    started = time.perf_counter()
+    response = api.post(f"{url}/bulk", json=[payload(ITEMS + number) for number in range(ITEMS)], headers=headers)
+    bulk_seconds, bulk_statements = time.perf_counter() - started, statements.count
+    assert response.status_code == 200, response.text
+    assert response.json()["applied"] == ITEMS
+
+    bench_report(
+        f"{name}, {ITEMS} шт.: по одной {single_seconds:.2f} с ({ITEMS / single_seconds:.0f}/с, "
+        f"SQL {single_statements}), пакетом {bulk_seconds:.2f} с ({ITEMS / bulk_seconds:.0f}/с, "
+        f"SQL {bulk_statements}), ускорение x{single_seconds / bulk_seconds:.1f}"
+    )
+    assert bulk_seconds < single_seconds
+    assert bulk_statements < single_statements
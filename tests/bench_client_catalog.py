@@ -0,0 +1,105 @@
+"""
+Бенчмарк открытия диалога мастера: загрузка профессий, услуг и мастеров
+последовательно через BeautyProAPI и одновременно через AsyncBeautyProAPI.get_catalog
+"""
+import asyncio
+import os
+import socket
+import statistics
+import threading
+import time
+
+import pytest
+import uvicorn
+
+from client.api_client import BeautyProAPI
+from client.api_client_async import AsyncBeautyProAPI
+from server.main import app
+
+pytestmark = pytest.mark.bench
+
+REPEAT = int(os.environ.get("BEAUTYPRO_BENCH_ROWS", 50))
+# Задержка сети до сервера салона; 0 - сервер на той же машине
+LATENCIES_MS = (0, int(os.environ.get("BEAUTYPRO_BENCH_LATENCY_MS", 20)))
+
+
+def delayed(asgi_app, latency_ms: float):
+    """ASGI-обертка, добавляющая задержку сети к каждому HTTP-запросу"""
+    async def wrapper(scope, receive, send):
+        if scope["type"] == "http" and latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        await asgi_app(scope, receive, send)
+    return wrapper
+
+
+@pytest.fixture
+def serve(database):
+    """Запустить приложение в uvicorn в отдельном потоке: serve(latency_ms) -> base_url"""
+    servers = []
+
+    def start(latency_ms: float) -> str:
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        server = uvicorn.Server(uvicorn.Config(
+            delayed(app, latency_ms), host="127.0.0.1", port=port, log_level="warning"
+        ))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        while not server.started:
+            time.sleep(0.01)
+        servers.append((server, thread))
+        return f"http://127.0.0.1:{port}"
+
+    yield start
+    for server, thread in servers:
+        server.should_exit = True
+        thread.join()
+
+
+def forget(api):
+    """Сбросить кэш справочников и ETag клиента: каждое открытие диалога - с сервера"""
+    api.cache.invalidate()
+    api._validators.clear()
+
+
+def serial_ms(base_url: str) -> float:
+    """Медиана открытия диалога: три запроса по очереди через одну requests.Session"""
+    api = BeautyProAPI(base_url)
+    timings = []
+    for _ in range(REPEAT + 1):
+        forget(api)
+        started = time.perf_counter()
+        results = [api.get_professions(), api.get_services(), api.get_masters(active_only=False)]
+        timings.append((time.perf_counter() - started) * 1000)
+        assert all(result["success"] for result in results), results
+    api.session.close()
+    return statistics.median(timings[1:])  # Первое открытие устанавливает соединение
+
+
+async def fan_out_ms(base_url: str) -> float:
+    """Медиана открытия диалога: get_catalog отправляет запросы одновременно по пулу keep-alive"""
+    timings = []
+    async with AsyncBeautyProAPI(base_url) as api:
+        for _ in range(REPEAT + 1):
+            forget(api)
+            started = time.perf_counter()
+            results = await api.get_catalog()
+            timings.append((time.perf_counter() - started) * 1000)
+            assert all(result["success"] for result in results.values()), results
+    return statistics.median(timings[1:])
+
+
+def test_dialog_open_latency(serve, bench_report):
+    results = {}
+    for latency_ms in LATENCIES_MS:
+        base_url = serve(latency_ms)
+        results[latency_ms] = serial, fan_out = serial_ms(base_url), asyncio.run(fan_out_ms(base_url))
+        bench_report(
+            f"задержка сети {latency_ms} мс: последовательно {serial:.1f} мс, "
+            f"get_catalog {fan_out:.1f} мс (медиана из {REPEAT})"
+        )
+
+    # С задержкой сети одновременные запросы ждут ее один раз, а не три
+    serial, fan_out = results[LATENCIES_MS[-1]]
+    assert fan_out < serial
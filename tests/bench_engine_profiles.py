@@ -0,0 +1,147 @@
+"""
+Бенчмарк профилей движка SQLite: чтение календаря во время параллельной записи
+в профиле "default" (rollback journal) и "production" (WAL, mmap, пул побольше)
+"""
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from server import crud, models, schemas
+from server.database import ENGINE_PROFILES, Base
+
+pytestmark = pytest.mark.bench
+
+SEED_ROWS = int(os.environ.get("BEAUTYPRO_BENCH_ROWS", 100_000))
+READERS = 4
+WRITERS = 2
+DURATION_SECONDS = float(os.environ.get("BEAUTYPRO_BENCH_SECONDS", 5))
+MASTERS = 15
+DAYS = 60
+
+
+def profile_sessions(path: str, profile: dict) -> sessionmaker:
+    """Движок SQLite с размером пула и PRAGMA профиля, как в server.database"""
+    bench_engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=profile["pool_size"],
+        max_overflow=profile["max_overflow"]
+    )
+
+    @event.listens_for(bench_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in profile["sqlite_pragmas"].items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    Base.metadata.create_all(bind=bench_engine)
+    return sessionmaker(bind=bench_engine, autoflush=False)
+
+
+def seed(session_factory: sessionmaker, first_day: date):
+    with session_factory() as db:
+        crud.init_database(db)
+        start = datetime.combine(first_day, datetime.min.time())
+        db.execute(insert(models.Appointment), [
+            {
+                "client_id": 1,
+                "master_id": i % MASTERS + 1,
+                "service_id": 2,
+                # Прошедшие записи: календарь читает их, но не мешают новым броням
+                "appointment_datetime": start - timedelta(minutes=10 * (i // MASTERS + 1)),
+                "status": "completed",
+            }
+            for i in range(SEED_ROWS)
+        ])
+        db.commit()
+
+
+def load_worker(role: str, path: str, profile_name: str, first_day: date, seed_value: int, deadline: float) -> dict:
+    """
+    Процесс нагрузки: "read" читает свободные слоты, "write" бронирует до deadline.
+    Отдельные процессы, а не потоки: иначе время уходит на переключение GIL,
+    а не на ожидание блокировок БД
+    """
+    session_factory = profile_sessions(path, ENGINE_PROFILES[profile_name])
+    rng = random.Random(seed_value)
+    latencies, errors = [], []
+    with session_factory() as db:
+        while time.time() < deadline:
+            target_date = first_day + timedelta(days=rng.randrange(DAYS))
+            master_id = rng.randrange(MASTERS) + 1
+            started = time.perf_counter()
+            try:
+                if role == "read":
+                    crud.get_available_time_slots(db, master_id, 1, target_date)
+                    db.rollback()
+                else:
+                    start = datetime.combine(target_date, datetime.min.time().replace(hour=9))
+                    crud.create_appointment(db, 1, schemas.AppointmentCreate(
+                        master_id=master_id,
+                        service_id=2,
+                        appointment_datetime=start + timedelta(minutes=30 * rng.randrange(22))
+                    ))
+            except Exception as e:
+                db.rollback()
+                errors.append(repr(e))
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+    return {"role": role, "latencies": latencies, "errors": errors}
+
+
+def run_mixed_load(path: str, profile_name: str, first_day: date) -> dict:
+    """READERS процессов читают свободные слоты, WRITERS процессов бронируют, DURATION_SECONDS секунд"""
+    roles = ["read"] * READERS + ["write"] * WRITERS
+    # Процессам дается время запуститься до начала замера
+    started_at = time.time() + 3
+    deadline = started_at + DURATION_SECONDS
+    with ProcessPoolExecutor(len(roles), mp_context=multiprocessing.get_context("spawn")) as pool:
+        results = list(pool.map(
+            load_worker,
+            roles,
+            [path] * len(roles),
+            [profile_name] * len(roles),
+            [first_day] * len(roles),
+            range(len(roles)),
+            [deadline] * len(roles)
+        ))
+
+    reads_ms = sorted(latency for result in results if result["role"] == "read" for latency in result["latencies"])
+    writes_ms = sorted(latency for result in results if result["role"] == "write" for latency in result["latencies"])
+    return {
+        "reads": len(reads_ms) / DURATION_SECONDS,
+        "read_p50": statistics.median(reads_ms),
+        "read_p95": reads_ms[int(len(reads_ms) * 0.95)],
+        "writes": len(writes_ms) / DURATION_SECONDS,
+        "write_p50": statistics.median(writes_ms),
+        "errors": [error for result in results for error in result["errors"]],
+    }
+
+
+def test_engine_profiles_mixed_load(tmp_path, bench_report):
+    first_day = date.today() + timedelta(days=1)
+    results = {}
+    for name in ("default", "production"):
+        path = str(tmp_path / f"{name}.db")
+        session_factory = profile_sessions(path, ENGINE_PROFILES[name])
+        seed(session_factory, first_day)
+        session_factory.kw["bind"].dispose()
+        results[name] = result = run_mixed_load(path, name, first_day)
+        bench_report(
+            f"{name}: чтений {result['reads']:.0f}/с (p50 {result['read_p50']:.2f} мс, "
+            f"p95 {result['read_p95']:.2f} мс), броней {result['writes']:.0f}/с "
+            f"(p50 {result['write_p50']:.2f} мс), ошибок {len(result['errors'])}"
+        )
+
+    # Скорость зависит от числа ядер и диска, поэтому проверяется только отсутствие
+    # ошибок "database is locked" в профиле production; цифры - в сводке
+    assert not results["production"]["errors"], results["production"]["errors"][:5]
@@ -0,0 +1,92 @@
+"""
+Бенчмарк выгрузки для бухгалтерии: строк в секунду и прирост памяти процесса
+при выгрузке 1 млн записей в CSV и Parquet (и десятой части - для сравнения)
+"""
+import os
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from server import export
+from bench_indexes import FIRST_DAY, MASTERS, ROWS, STEP, seed_appointments
+
+pytestmark = pytest.mark.bench
+
+STATM_PATH = "/proc/self/statm"
+SAMPLE_INTERVAL = 0.005
+
+
+def current_rss() -> int:
+    """Текущий RSS процесса в байтах (Linux)"""
+    with open(STATM_PATH) as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class PeakRSS:
+    """Максимальный прирост RSS внутри блока with (опрос в отдельном потоке)"""
+
+    def __enter__(self):
+        self.baseline = self.peak = current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, current_rss())
+            time.sleep(SAMPLE_INTERVAL)
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+    @property
+    def growth_mb(self) -> float:
+        return (self.peak - self.baseline) / 2 ** 20
+
+
+def run_export(output_format: str, start_date: date, end_date: date):
+    """Выгрузить записи, не сохраняя ответ: (строк, байт, секунд, прирост RSS в МиБ)"""
+    rows = size = 0
+
+    def counted(chunks):
+        nonlocal rows
+        for chunk in chunks:
+            rows += len(chunk)
+            yield chunk
+
+    stream = export.stream_parquet if output_format == "parquet" else export.stream_csv
+    started = time.perf_counter()
+    with PeakRSS() as rss:
+        for part in stream(counted(export.iter_chunks(start_date, end_date))):
+            size += len(part)
+    return rows, size, time.perf_counter() - started, rss.growth_mb
+
+
+@pytest.mark.skipif(not os.path.exists(STATM_PATH), reason="RSS читается из /proc (Linux)")
+def test_export_rows_per_second_and_memory(bench_database, monkeypatch, bench_report):
+    bench_engine, session_factory = bench_database
+    monkeypatch.setattr(export, "SessionLocal", session_factory)
+    with session_factory() as db:
+        seed_appointments(db)
+
+    first_day = FIRST_DAY.date()
+    last_day = (FIRST_DAY + STEP * ((ROWS - 1) // MASTERS)).date()
+    tenth_day = first_day + (last_day - first_day) / 10
+
+    formats = ["csv"] + (["parquet"] if export.parquet_available() else [])
+    for output_format in formats:
+        run_export(output_format, first_day, first_day)  # Прогрев: пул памяти pyarrow, кэш запросов
+        growth = {}
+        for period, end_date in (("десятая часть", tenth_day), ("все", last_day)):
+            rows, size, seconds, growth[period] = run_export(output_format, first_day, end_date)
+            bench_report(
+                f"{output_format}, {rows} строк: {rows / seconds:,.0f} строк/с, "
+                f"{size / 2 ** 20:.0f} МиБ за {seconds:.1f} с, прирост RSS {growth[period]:.1f} МиБ"
+            )
+        # Память ограничена куском выгрузки: в 10 раз больше строк - не в 10 раз больше памяти
+        assert growth["все"] < growth["десятая часть"] * 2 + 16, growth
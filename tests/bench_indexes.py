@@ -0,0 +1,119 @@
+"""
+Бенчмарк индексов appointments: задержка запросов слотов, истории клиента и
+выборки за день на 1 млн записей до и после создания индексов
+"""
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from server import crud, models
+from test_indexes import assert_uses_index, query_plans
+
+pytestmark = pytest.mark.bench
+
+ROWS = int(os.environ.get("BEAUTYPRO_BENCH_ROWS", 1_000_000))
+MASTERS = 15
+CLIENTS = 20_000
+INSERT_BATCH = 50_000
+REPEAT = 20
+
+# Индексы, добавленные для запросов слотов и истории (индекс первичного ключа остается)
+INDEXES = (
+    "ix_appointments_master_datetime_status",
+    "ix_appointments_datetime",
+    "ix_appointments_client_datetime",
+    "ux_appointments_master_datetime_scheduled",
+)
+
+# Записи идут каждые 30 минут у каждого мастера: 1 млн строк - около 4 лет
+FIRST_DAY = datetime(2022, 1, 1)
+STEP = timedelta(minutes=30)
+
+
+def seed_appointments(db: Session):
+    """Записи по сетке: мастер i % MASTERS, клиент i % CLIENTS, в основном завершенные"""
+    statuses = ("completed",) * 8 + ("canceled", "scheduled")
+    for first in range(0, ROWS, INSERT_BATCH):
+        db.execute(insert(models.Appointment), [
+            {
+                "client_id": i % CLIENTS + 1,
+                "master_id": i % MASTERS + 1,
+                "service_id": i % 5 + 1,
+                "appointment_datetime": FIRST_DAY + STEP * (i // MASTERS),
+                "status": statuses[i % len(statuses)],
+            }
+            for i in range(first, min(first + INSERT_BATCH, ROWS))
+        ])
+    db.commit()
+
+
+def median_ms(call: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        result = call()
+        if not isinstance(result, list):
+            list(result)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def test_appointment_indexes_latency(bench_database, bench_report):
+    bench_engine, session_factory = bench_database
+    indexes = [index for index in models.Appointment.__table__.indexes if index.name in INDEXES]
+
+    # "До" - таблица только с первичным ключом, как до добавления индексов
+    for index in indexes:
+        index.drop(bind=bench_engine)
+
+    day = (FIRST_DAY + STEP * (ROWS // MASTERS // 2)).date()
+    day_start = datetime.combine(day, datetime.min.time())
+    day_end = datetime.combine(day, datetime.max.time())
+    queries: Dict[str, Callable[[Session], object]] = {
+        "занятые периоды мастера за день": lambda db: crud.get_busy_periods(db, 1, day_start, day_end),
+        "история клиента": lambda db: crud.get_appointments_by_client(db, CLIENTS // 2),
+        "записи салона за день": lambda db: crud.iter_appointment_export_rows(db, day, day),
+    }
+
+    with session_factory() as db:
+        started = time.perf_counter()
+        seed_appointments(db)
+        bench_report(f"{ROWS} записей добавлено за {time.perf_counter() - started:.1f} с")
+
+        before = {name: median_ms(lambda: query(db)) for name, query in queries.items()}
+
+        started = time.perf_counter()
+        for index in indexes:
+            index.create(bind=bench_engine)
+        db.execute(text("ANALYZE"))
+        bench_report(f"индексы созданы за {time.perf_counter() - started:.1f} с")
+
+        after = {name: median_ms(lambda: query(db)) for name, query in queries.items()}
+
+        for name in queries:
+            bench_report(f"{name}: {before[name]:.2f} мс -> {after[name]:.2f} мс ({before[name] / after[name]:.0f}x)")
+            assert after[name] < before[name], name
+
+        # Планы на полной таблице: индекс, а не SCAN appointments
+        assert_uses_index(
+            query_plans(db, lambda: crud.get_busy_periods(db, 1, day_start, day_end)),
+            "ux_appointments_master_datetime_scheduled"
+        )
+        assert_uses_index(
+            query_plans(db, lambda: crud.iter_appointments(db, day, day, master_id=1)),
+            "ix_appointments_master_datetime_status"
+        )
+        assert_uses_index(
+            query_plans(db, lambda: crud.get_appointments_by_client(db, CLIENTS // 2)),
+            "ix_appointments_client_datetime"
+        )
+        assert_uses_index(
+            query_plans(db, lambda: crud.iter_appointment_export_rows(db, day, day)),
+            "ix_appointments_datetime"
+        )
@@ -0,0 +1,106 @@
+"""
+Бенчмарк входа: пропускная способность проверки паролей и задержка обычных
+запросов во время волны входов - bcrypt в потоке запроса против отдельного пула
+"""
+import asyncio
+import os
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from passlib.context import CryptContext
+
+from server import passwords, schemas
+
+pytestmark = pytest.mark.bench
+
+# Стоимость bcrypt как в рабочей конфигурации (в тестах она снижена до 4)
+ROUNDS = int(os.environ.get("BEAUTYPRO_BENCH_BCRYPT_ROUNDS", 12))
+LOGINS = int(os.environ.get("BEAUTYPRO_BENCH_ROWS", 60))
+CONCURRENCY = 50
+PING_INTERVAL = 0.01
+PASSWORD = "secret1"
+
+
+def bench_app(hashed: str) -> FastAPI:
+    """Вход в прежнем виде (bcrypt в обработчике) и через пул passwords, плюс легкий запрос"""
+    app = FastAPI()
+
+    @app.post("/inline/login")
+    def inline_login(credentials: schemas.UserLogin):
+        # Как до переноса в пул: синхронный обработчик занимает поток пула FastAPI
+        verified, _ = passwords.verify_and_update(credentials.password, hashed)
+        if not verified:
+            raise HTTPException(status_code=401)
+        return {"ok": True}
+
+    @app.post("/pooled/login")
+    async def pooled_login(credentials: schemas.UserLogin):
+        verified, _ = await passwords.verify_and_update_async(credentials.password, hashed)
+        if not verified:
+            raise HTTPException(status_code=401)
+        return {"ok": True}
+
+    @app.get("/ping")
+    def ping():
+        # Обычный синхронный запрос (например, бронь) тоже выполняется в пуле потоков
+        return {"ok": True}
+
+    return app
+
+
+async def login_burst(app: FastAPI, url: str) -> Dict[str, float]:
+    """LOGINS входов по CONCURRENCY одновременно и параллельно - ping каждые PING_INTERVAL"""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    ping_latencies: List[float] = []
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def login():
+            async with semaphore:
+                response = await client.post(url, json={"phone_number": "+79990000001", "password": PASSWORD})
+                assert response.status_code == 200, response.text
+
+        async def pinger():
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/ping")
+                ping_latencies.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(PING_INTERVAL)
+
+        await login()  # Прогрев: пул bcrypt и потоки
+        ping_task = asyncio.create_task(pinger())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(LOGINS)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await ping_task
+
+    ping_latencies.sort()
+    return {
+        "logins": LOGINS / elapsed,
+        "ping_p50": statistics.median(ping_latencies),
+        "ping_p95": ping_latencies[int(len(ping_latencies) * 0.95)],
+    }
+
+
+def test_login_burst(monkeypatch, bench_report):
+    monkeypatch.setattr(passwords, "pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=ROUNDS))
+    app = bench_app(passwords.hash_password(PASSWORD))
+
+    results = {}
+    for variant in ("inline", "pooled"):
+        results[variant] = result = asyncio.run(login_burst(app, f"/{variant}/login"))
+        bench_report(
+            f"{variant}, bcrypt {ROUNDS}, {CONCURRENCY} одновременных входов: "
+            f"{result['logins']:.1f} входов/с, ping p50 {result['ping_p50']:.1f} мс, "
+            f"p95 {result['ping_p95']:.1f} мс"
+        )
+    passwords.shutdown_executor()
+
+    # Волна входов не должна задерживать остальные запросы
+    assert results["pooled"]["ping_p95"] < results["inline"]["ping_p95"]
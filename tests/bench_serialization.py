@@ -0,0 +1,122 @@
+"""
+Микробенчмарк сериализации: время на 1000 мастеров и 1000 записей с клиентом
+через стандартный путь FastAPI (response_model + JSONResponse) и через dump_json
+"""
+import asyncio
+import gc
+import time
+from datetime import datetime, timedelta
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, List
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from server import models, schemas
+from server.serialization import dump_json
+
+pytestmark = pytest.mark.bench
+
+ITEMS = 1000
+REPEAT = 50
+
+
+def build_masters() -> List[models.Master]:
+    """Мастера с профессией и тремя услугами, как их загружает MASTER_LOAD_OPTIONS"""
+    professions = [models.Profession(id=number, name=f"Профессия {number}") for number in range(1, 4)]
+    services = [
+        models.Service(id=number, name=f"Услуга {number}", price=1000 + number, duration_minutes=30 + number)
+        for number in range(1, 10)
+    ]
+    return [
+        models.Master(
+            id=number,
+            full_name=f"Мастер {number}",
+            profession_id=professions[number % 3].id,
+            profession=professions[number % 3],
+            contact_info=f"+7999{number:07d}",
+            is_active=True,
+            services=services[number % 7:number % 7 + 3]
+        )
+        for number in range(ITEMS)
+    ]
+
+
+def build_appointments(masters: List[models.Master]) -> List[models.Appointment]:
+    """Записи с мастером, услугой и клиентом (ответ /api/admin/appointments)"""
+    client = models.User(id=1, phone_number="+79990000001", full_name="Клиент", role="client")
+    start = datetime(2026, 1, 1, 9)
+    return [
+        models.Appointment(
+            id=number,
+            appointment_datetime=start + timedelta(minutes=30 * number),
+            status="scheduled",
+            master=masters[number % len(masters)],
+            service=masters[number % len(masters)].services[0],
+            client=client
+        )
+        for number in range(ITEMS)
+    ]
+
+
+def fastapi_default(response_type: Any, loop: asyncio.AbstractEventLoop, response_class=JSONResponse):
+    """Прежний путь: проверка по response_model, jsonable-данные и сериализация классом ответа"""
+    field = create_model_field(name="Response", type_=response_type, mode="serialization")
+
+    def render(value: Any) -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=value, is_coroutine=True)
+        )
+        return response_class(content).body
+    return render
+
+
+def best_ms(renderers: Dict[str, Callable[[Any], bytes]], value: Any) -> Dict[str, float]:
+    """
+    Лучшее время каждого варианта из REPEAT кругов без сборщика мусора (как в timeit).
+    Варианты чередуются внутри круга, поэтому замедления машины достаются всем поровну
+    """
+    for render in renderers.values():
+        render(value)  # Прогрев: адаптеры pydantic создаются при первом вызове
+    timings = {name: [] for name in renderers}
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(REPEAT):
+            for name, render in renderers.items():
+                started = time.perf_counter()
+                render(value)
+                timings[name].append((time.perf_counter() - started) * 1000)
+    finally:
+        gc.enable()
+    return {name: min(values) for name, values in timings.items()}
+
+
+def test_serialization_per_1k(bench_report):
+    masters = build_masters()
+    appointments = build_appointments(masters)
+    cases = {
+        "мастера (MasterResponse)": (List[schemas.MasterResponse], masters),
+        "записи с клиентом (AppointmentWithClient)": (List[schemas.AppointmentWithClient], appointments),
+    }
+
+    loop = asyncio.new_event_loop()
+    try:
+        for name, (response_type, value) in cases.items():
+            renderers = {
+                "FastAPI": fastapi_default(response_type, loop),
+                "dump_json": lambda items, response_type=response_type: dump_json(response_type, items),
+            }
+            if find_spec("orjson") is not None:
+                from fastapi.responses import ORJSONResponse
+                renderers["ORJSONResponse"] = fastapi_default(response_type, loop, ORJSONResponse)
+
+            results = best_ms(renderers, value)
+            bench_report(f"{name}, {ITEMS} шт.: " + ", ".join(
+                f"{variant} {milliseconds:.1f} мс" for variant, milliseconds in results.items()
+            ))
+            assert results["dump_json"] < results["FastAPI"], name
+    finally:
+        loop.close()
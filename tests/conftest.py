@@ -0,0 +1,162 @@
+"""
+Общие фикстуры тестов: база из BEAUTYPRO_DATABASE_URL (например, PostgreSQL)
+или отдельная база SQLite на каждый запуск
+"""
+import os
+import tempfile
+
+# Движок БД создается при импорте server.database, поэтому база для тестов
+# задается до импорта модулей сервера. Заданная база должна быть отдельной:
+# тесты удаляют из нее все записи
+if not os.environ.get("BEAUTYPRO_DATABASE_URL"):
+    _DB_DIR = tempfile.mkdtemp(prefix="beautypro-tests-")
+    os.environ["BEAUTYPRO_DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+    os.environ.pop("BEAUTYPRO_ASYNC_DATABASE_URL", None)
+os.environ["BEAUTYPRO_BCRYPT_ROUNDS"] = "4"  # Минимальная стоимость bcrypt: тестам не нужна стойкость
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, event, func, or_
+from sqlalchemy.orm import sessionmaker
+
+from server import crud, models, schemas
+from server.cache import catalog_cache
+from server.database import Base, SessionLocal, async_engine, engine
+
+# Справочники, строки которых тест может добавить; удаляются после теста
+CATALOG_MODELS = (models.Master, models.Service, models.Profession)
+
+# Результаты бенчмарков для итоговой сводки pytest
+BENCH_RESULTS = []
+
+
+# ==================== БЕНЧМАРКИ ====================
+# Бенчмарки лежат в tests/bench_*.py и запускаются только с --bench:
+#     python -m pytest tests --bench -k bench
+
+def pytest_addoption(parser):
+    parser.addoption("--bench", action="store_true", help="запустить бенчмарки tests/bench_*.py")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "bench: бенчмарк, запускается только с --bench")
+    if config.getoption("--bench"):
+        config.addinivalue_line("python_files", "bench_*.py")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench"):
+        return
+    skip_bench = pytest.mark.skip(reason="бенчмарк: запустите pytest с --bench")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip_bench)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if BENCH_RESULTS:
+        terminalreporter.section("бенчмарки")
+        for line in BENCH_RESULTS:
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture
+def bench_report(request):
+    """Добавить строку в сводку бенчмарков"""
+    def report(line: str):
+        BENCH_RESULTS.append(f"{request.node.name}: {line}")
+    return report
+
+
+@pytest.fixture
+def bench_database(tmp_path):
+    """Отдельная база SQLite для бенчмарка: (движок, фабрика сессий) с начальными данными"""
+    bench_engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}")
+    Base.metadata.create_all(bind=bench_engine)
+    session_factory = sessionmaker(bind=bench_engine, autoflush=False)
+    with session_factory() as session:
+        crud.init_database(session)
+    yield bench_engine, session_factory
+    bench_engine.dispose()
+
+
+class StatementCounter:
+    """Считает SQL-запросы, выполненные синхронным и асинхронным движками"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Таблицы и начальные данные (профессии, услуги, мастера, администратор)"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        crud.init_database(db)
+    finally:
+        db.close()
+    yield
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def client_user(database) -> models.User:
+    """Клиент, от имени которого создаются записи"""
+    db = SessionLocal()
+    try:
+        # В заданной базе клиент мог остаться от прошлого запуска
+        user = crud.get_user_by_phone(db, "+79990000001") or crud.create_user(db, schemas.UserCreate(
+            phone_number="+79990000001",
+            password="secret1",
+            full_name="Тестовый клиент"
+        ))
+        db.expunge(user)
+        return user
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session")
+def api(database):
+    """Клиент FastAPI (с событиями startup/shutdown приложения)"""
+    from server.main import app
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def statements():
+    """Счетчик SQL-запросов; тест обнуляет count перед измеряемым вызовом"""
+    counter = StatementCounter()
+    engines = (engine, async_engine.sync_engine)
+    for target in engines:
+        event.listen(target, "before_cursor_execute", counter)
+    yield counter
+    for target in engines:
+        event.remove(target, "before_cursor_execute", counter)
+
+
+@pytest.fixture
+def db():
+    """Сессия БД; записи и строки справочников, созданные тестом, удаляются после него"""
+    session = SessionLocal()
+    last_ids = {model: session.query(func.max(model.id)).scalar() or 0 for model in CATALOG_MODELS}
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.query(models.Appointment).delete()
+        session.query(models.DailyStats).delete()
+        session.execute(delete(models.master_services).where(or_(
+            models.master_services.c.master_id > last_ids[models.Master],
+            models.master_services.c.service_id > last_ids[models.Service]
+        )))
+        for model in CATALOG_MODELS:
+            session.query(model).filter(model.id > last_ids[model]).delete()
+        session.commit()
+        session.close()
+        catalog_cache.invalidate()
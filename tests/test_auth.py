@@ -0,0 +1,45 @@
+"""
+Записи клиента доступны только по токену сессии
+"""
+from server import models, tokens
+
+
+def test_appointments_require_token(api, client_user):
+    response = api.get(f"/api/appointments?client_id={client_user.id}")
+    assert response.status_code == 401
+
+    response = api.post(f"/api/appointments?client_id={client_user.id}", json={
+        "master_id": 1, "service_id": 1, "appointment_datetime": "2100-01-01T10:00:00"
+    })
+    assert response.status_code == 401
+
+    response = api.delete(f"/api/appointments/1?client_id={client_user.id}")
+    assert response.status_code == 401
+
+
+def test_client_token_grants_only_own_appointments(api, client_user):
+    headers = {"Authorization": f"Bearer {tokens.issue_token(client_user)}"}
+
+    assert api.get("/api/appointments", headers=headers).status_code == 200
+    assert api.get(f"/api/appointments?client_id={client_user.id}", headers=headers).status_code == 200
+    assert api.get(f"/api/appointments?client_id={client_user.id + 1}", headers=headers).status_code == 403
+
+
+def test_invalid_token_is_rejected(api, client_user):
+    headers = {"Authorization": "Bearer invalid.token"}
+    assert api.get(f"/api/appointments?client_id={client_user.id}", headers=headers).status_code == 401
+
+
+def test_bulk_endpoints_require_admin(api, db, client_user):
+    client_headers = {"Authorization": f"Bearer {tokens.issue_token(client_user)}"}
+    admin = db.query(models.User).filter(models.User.role == "admin").first()
+    admin_headers = {"Authorization": f"Bearer {tokens.issue_token(admin)}"}
+    services = [{"name": "Тестовая услуга пакета", "price": 100, "duration_minutes": 30}]
+
+    for method, url in (("POST", "/api/services/bulk"), ("PUT", "/api/services/bulk"),
+                        ("POST", "/api/masters/bulk"), ("PUT", "/api/masters/bulk")):
+        assert api.request(method, url, json=[]).status_code == 401
+        assert api.request(method, url, json=[], headers=client_headers).status_code == 403
+
+    response = api.post("/api/services/bulk", json=services, headers=admin_headers)
+    assert response.status_code == 200, response.text
@@ -0,0 +1,197 @@
+"""
+Свободные слоты на битовых масках (server/availability.py) против прежнего перебора слотов:
+синхронная функция crud и асинхронная crud_async, через которую работают эндпоинты
+"""
+import random
+from datetime import date, datetime, timedelta
+from typing import List
+
+import pytest
+from sqlalchemy.orm import Session
+
+from server import crud, crud_async, models, schemas
+from server.database import AsyncSessionLocal, SessionLocal
+
+
+# Длительности, не кратные 5 минутам, уменьшают разрешение карты до общего делителя
+ODD_DURATIONS = (1, 7, 13, 25, 45, 61, 95, 659, 660, 661)
+
+STATUSES = ("scheduled", "scheduled", "scheduled", "canceled", "completed")
+
+
+def reference_time_slots(
+    db: Session,
+    master_id: int,
+    service_id: int,
+    target_date: date
+) -> List[schemas.TimeSlot]:
+    """Прежний алгоритм: каждый слот сравнивается с каждой записью мастера за день"""
+    # Рабочие часы салона (9:00 - 20:00)
+    work_start = 9
+    work_end = 20
+
+    service = crud.get_service_by_id(db, service_id)
+    if not service:
+        return []
+
+    duration_minutes = service.duration_minutes
+
+    start_datetime = datetime.combine(target_date, datetime.min.time())
+    end_datetime = datetime.combine(target_date, datetime.max.time())
+
+    existing_appointments = db.query(models.Appointment).filter(
+        models.Appointment.master_id == master_id,
+        models.Appointment.appointment_datetime >= start_datetime,
+        models.Appointment.appointment_datetime <= end_datetime,
+        models.Appointment.status == "scheduled"
+    ).all()
+
+    busy_periods = []
+    for apt in existing_appointments:
+        apt_service = crud.get_service_by_id(db, apt.service_id)
+        if apt_service:
+            end_time = apt.appointment_datetime + timedelta(minutes=apt_service.duration_minutes)
+            busy_periods.append((apt.appointment_datetime, end_time))
+
+    available_slots = []
+    current_time = datetime.combine(target_date, datetime.min.time().replace(hour=work_start))
+    end_work_time = datetime.combine(target_date, datetime.min.time().replace(hour=work_end))
+
+    while current_time + timedelta(minutes=duration_minutes) <= end_work_time:
+        slot_end = current_time + timedelta(minutes=duration_minutes)
+
+        is_available = True
+        for busy_start, busy_end in busy_periods:
+            if not (slot_end <= busy_start or current_time >= busy_end):
+                is_available = False
+                break
+
+        if current_time <= datetime.now():
+            is_available = False
+
+        if is_available:
+            available_slots.append(schemas.TimeSlot(
+                time=current_time.strftime("%H:%M"),
+                datetime=current_time
+            ))
+
+        current_time += timedelta(minutes=30)
+
+    return available_slots
+
+
+@pytest.fixture(scope="module")
+def services(database) -> List[models.Service]:
+    """Услуги из начальных данных и услуги с длительностью, не кратной 5 минутам"""
+    db = SessionLocal()
+    try:
+        added = [
+            models.Service(name=f"Тестовая услуга {duration} мин", price=100, duration_minutes=duration)
+            for duration in ODD_DURATIONS
+        ]
+        db.add_all(added)
+        db.commit()
+        result = db.query(models.Service).order_by(models.Service.id).all()
+        db.expunge_all()
+        yield result
+        # Добавленные услуги не остаются в базе, заданной через BEAUTYPRO_DATABASE_URL
+        db.query(models.Service).filter(models.Service.id.in_([service.id for service in added])).delete()
+        db.commit()
+    finally:
+        db.close()
+
+
+def add_appointment(db: Session, client_id: int, master_id: int, service_id: int, start: datetime, status: str):
+    db.add(models.Appointment(
+        client_id=client_id,
+        master_id=master_id,
+        service_id=service_id,
+        appointment_datetime=start,
+        status=status
+    ))
+
+
+def async_time_slots(api, master_id: int, service_id: int, target_date: date) -> List[schemas.TimeSlot]:
+    """Слоты асинхронной функции эндпоинтов; выполняется в цикле событий приложения"""
+    async def load():
+        async with AsyncSessionLocal() as session:
+            return await crud_async.get_available_time_slots(session, master_id, service_id, target_date)
+
+    return api.portal.call(load)
+
+
+def assert_same_slots(api, db: Session, master_id: int, services: List[models.Service], target_date: date):
+    for service in services:
+        expected = reference_time_slots(db, master_id, service.id, target_date)
+        message = f"мастер {master_id}, услуга {service.duration_minutes} мин, {target_date}"
+        assert crud.get_available_time_slots(db, master_id, service.id, target_date) == expected, message
+        assert async_time_slots(api, master_id, service.id, target_date) == expected, message
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_random_days_match_reference(api, db, client_user, services, seed):
+    rng = random.Random(seed)
+    master_id, other_master_id = 1, 2
+    # Прошлый день, сегодня (часть слотов уже в прошлом) и будущие дни
+    target_date = date.today() + timedelta(days=rng.choice((-1, 0, 1, 2, 5, 30)))
+    day_start = datetime.combine(target_date, datetime.min.time())
+
+    starts = set()
+    for _ in range(rng.randint(0, 14)):
+        start = day_start + timedelta(minutes=rng.randrange(0, 24 * 60))
+        if rng.random() < 0.25:
+            # Начало не на целой минуте
+            start += timedelta(seconds=rng.randrange(1, 60), microseconds=rng.randrange(0, 10 ** 6))
+        starts.add(start)
+    if rng.random() < 0.3:
+        # Границы суток: записи с полуночи, в последнюю микросекунду дня и через полночь
+        starts.update((
+            day_start,
+            datetime.combine(target_date, datetime.max.time()),
+            day_start - timedelta(minutes=30),
+            day_start + timedelta(days=1)
+        ))
+
+    for start in starts:
+        add_appointment(db, client_user.id, master_id, rng.choice(services).id, start, rng.choice(STATUSES))
+        # Записи другого мастера в то же время не должны влиять на результат
+        if rng.random() < 0.5:
+            add_appointment(db, client_user.id, other_master_id, rng.choice(services).id, start, "scheduled")
+    db.commit()
+
+    assert_same_slots(api, db, master_id, services, target_date)
+
+
+@pytest.mark.parametrize("busy", [
+    # Начало и конец записи не кратны 5 минутам
+    [("10:03", 7)],
+    [("10:01", 1), ("10:29", 1)],
+    [("09:00", 13), ("09:13", 13), ("09:26", 13)],
+    # Запись заканчивается ровно на начале слота и начинается ровно на его конце
+    [("09:30", 30), ("11:00", 25)],
+    # Запись с секундами: занимает минуту, на которой закончилась
+    [("10:29:30", 1)],
+    # Весь рабочий день и вне рабочих часов
+    [("09:00", 660)],
+    [("08:00", 61), ("19:59", 1)],
+    [("00:00", 540), ("20:00", 240)],
+])
+def test_gcd_resolution_cases_match_reference(api, db, client_user, services, busy):
+    target_date = date.today() + timedelta(days=1)
+    by_duration = {service.duration_minutes: service for service in services}
+    for start, duration in busy:
+        start_time = datetime.strptime(start, "%H:%M:%S" if start.count(":") == 2 else "%H:%M").time()
+        service = by_duration.get(duration)
+        if service is None:
+            service = models.Service(name=f"Тестовая услуга {duration} мин", price=100, duration_minutes=duration)
+            db.add(service)
+            db.flush()
+        add_appointment(db, client_user.id, 1, service.id, datetime.combine(target_date, start_time), "scheduled")
+    db.commit()
+
+    assert_same_slots(api, db, 1, services, target_date)
+
+
+def test_unknown_service_has_no_slots(api, db):
+    assert crud.get_available_time_slots(db, 1, 10 ** 6, date.today()) == []
+    assert async_time_slots(api, 1, 10 ** 6, date.today()) == []
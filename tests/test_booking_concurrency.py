@@ -0,0 +1,70 @@
+"""
+Параллельные брони пересекающихся слотов: ни одна пара записей мастера
+не пересекается, конфликт - только 409, дневная сводка сходится
+"""
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+from server import models, stats, tokens
+
+MASTER_ID = 1
+SERVICE_IDS = (1, 2, 3, 4, 5)  # Услуги мастера длительностью 30-120 минут
+
+THREADS = 8
+ATTEMPTS = 15
+
+
+def book_and_cancel(api, headers, target_date: date, seed: int) -> List[Tuple[str, int]]:
+    """Поток клиента: брони на один мастерский день, часть удачных броней отменяется"""
+    rng = random.Random(seed)
+    day_start = datetime.combine(target_date, datetime.min.time().replace(hour=10))
+    results = []
+    for _ in range(ATTEMPTS):
+        # Сетка 10 минут на 2 часа: брони почти всегда пересекаются
+        start = day_start + timedelta(minutes=10 * rng.randrange(12))
+        response = api.post("/api/appointments", headers=headers, json={
+            "master_id": MASTER_ID,
+            "service_id": rng.choice(SERVICE_IDS),
+            "appointment_datetime": start.isoformat()
+        })
+        results.append(("book", response.status_code))
+        if response.status_code == 200 and rng.random() < 0.3:
+            appointment_id = response.json()["id"]
+            response = api.delete(f"/api/appointments/{appointment_id}", headers=headers)
+            results.append(("cancel", response.status_code))
+    return results
+
+
+def test_concurrent_bookings_never_overlap(api, db, client_user):
+    target_date = date.today() + timedelta(days=3)
+    headers = {"Authorization": f"Bearer {tokens.issue_token(client_user)}"}
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        futures = [
+            pool.submit(book_and_cancel, api, headers, target_date, seed)
+            for seed in range(THREADS)
+        ]
+        results = [result for future in futures for result in future.result()]
+
+    booked = [code for action, code in results if action == "book"]
+    canceled = [code for action, code in results if action == "cancel"]
+    assert set(booked) <= {200, 409}, booked
+    assert set(canceled) <= {200}, canceled
+    assert 200 in booked and 409 in booked
+
+    scheduled = sorted(
+        (appointment.appointment_datetime,
+         appointment.appointment_datetime + timedelta(minutes=appointment.service.duration_minutes))
+        for appointment in db.query(models.Appointment).filter(
+            models.Appointment.master_id == MASTER_ID,
+            models.Appointment.status == "scheduled"
+        )
+    )
+    assert len(scheduled) == booked.count(200) - len(canceled)
+    for (_, previous_end), (start, _) in zip(scheduled, scheduled[1:]):
+        assert previous_end <= start, scheduled
+
+    check = stats.check(db, target_date, target_date)
+    assert check.consistent, check.mismatches
@@ -0,0 +1,97 @@
+"""
+Планы запросов к appointments: выборки должны идти по индексам, а не полным сканированием
+"""
+from datetime import date, datetime, timedelta
+from typing import Callable, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from server import crud
+from server.database import IS_SQLITE
+
+pytestmark = pytest.mark.skipif(not IS_SQLITE, reason="EXPLAIN QUERY PLAN есть только в SQLite")
+
+DAY = date.today() + timedelta(days=1)
+DAY_START = datetime.combine(DAY, datetime.min.time())
+DAY_END = datetime.combine(DAY, datetime.max.time())
+
+
+def query_plans(db: Session, call: Callable[[], object]) -> List[List[str]]:
+    """Выполнить call и вернуть планы его запросов к таблице appointments"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM appointments" in statement:
+            statements.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        result = call()
+        if not isinstance(result, list):
+            list(result)  # Итераторы выполняют запрос при чтении
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    assert statements, "запрос к appointments не выполнялся"
+    connection = db.connection().connection.dbapi_connection
+    return [
+        [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+        for statement, parameters in statements
+    ]
+
+
+def assert_uses_index(plans: List[List[str]], index_name: str):
+    for plan in plans:
+        assert any(f"USING INDEX {index_name}" in line for line in plan), plan
+        assert not any(line.startswith("SCAN appointments") for line in plan), plan
+
+
+def test_busy_periods_use_master_datetime_index(db):
+    # Условие status = 'scheduled' совпадает с условием частичного уникального
+    # индекса (master_id, appointment_datetime), и SQLite выбирает его: в нем
+    # только запланированные записи
+    assert_uses_index(
+        query_plans(db, lambda: crud.get_busy_periods(db, 1, DAY_START, DAY_END)),
+        "ux_appointments_master_datetime_scheduled"
+    )
+    assert_uses_index(
+        query_plans(db, lambda: crud.get_busy_periods_by_master(db, [1, 2, 3], DAY_START, DAY_END)),
+        "ux_appointments_master_datetime_scheduled"
+    )
+
+
+def test_master_period_uses_master_datetime_status_index(db):
+    # Записи мастера за период с любым статусом (фильтр админки)
+    assert_uses_index(
+        query_plans(db, lambda: crud.iter_appointments(db, DAY, DAY, master_id=1)),
+        "ix_appointments_master_datetime_status"
+    )
+    assert_uses_index(
+        query_plans(db, lambda: crud.iter_appointments(db, DAY, DAY, master_id=1, status="completed")),
+        "ix_appointments_master_datetime_status"
+    )
+
+
+def test_client_history_uses_client_datetime_index(db, client_user):
+    assert_uses_index(
+        query_plans(db, lambda: crud.get_appointments_by_client(db, client_user.id)),
+        "ix_appointments_client_datetime"
+    )
+    assert_uses_index(
+        query_plans(db, lambda: crud.get_appointments_by_client(db, client_user.id, upcoming_only=True)),
+        "ix_appointments_client_datetime"
+    )
+
+
+def test_day_range_uses_datetime_index(db):
+    assert_uses_index(
+        query_plans(db, lambda: crud.iter_appointments(db, DAY, DAY + timedelta(days=6))),
+        "ix_appointments_datetime"
+    )
+    assert_uses_index(
+        query_plans(db, lambda: crud.iter_appointment_export_rows(db, DAY, DAY + timedelta(days=6))),
+        "ix_appointments_datetime"
+    )
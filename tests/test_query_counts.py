@@ -0,0 +1,232 @@
+"""
+Число SQL-запросов эндпоинтов не должно расти вместе с числом строк
+"""
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, NamedTuple
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from server import models, tokens
+from server.cache import catalog_cache
+from server.database import SessionLocal
+
+
+# Строк в меньшем наборе данных; больший - в 10 раз больше
+ROWS = 10
+
+# Мастер, услуга и профессия из начальных данных (Анна Петрова, женская стрижка, парикмахер)
+MASTER_ID = 1
+SERVICE_ID = 1
+PROFESSION_ID = 1
+
+
+def target_date() -> date:
+    return date.today() + timedelta(days=1)
+
+
+class Context(NamedTuple):
+    """Данные, общие для наполнения БД и запроса"""
+    client_id: int
+    headers: Dict[str, str]
+
+
+def add_master(db: Session, number: int, service_ids=(SERVICE_ID,)) -> models.Master:
+    """Мастер со своей профессией: ленивая загрузка профессии дала бы запрос на каждого"""
+    master = models.Master(
+        full_name=f"Тестовый мастер {number}",
+        profession=models.Profession(name=f"Тестовая профессия {number}")
+    )
+    master.services = db.query(models.Service).filter(models.Service.id.in_(service_ids)).all()
+    db.add(master)
+    db.flush()
+    return master
+
+
+def add_service(db: Session, number: int, profession_id=None) -> models.Service:
+    """Услуга; без profession_id - со своей профессией"""
+    service = models.Service(name=f"Тестовая услуга {number}", price=100, duration_minutes=30)
+    if profession_id is None:
+        service.profession = models.Profession(name=f"Тестовая профессия {number}")
+    else:
+        service.profession_id = profession_id
+    db.add(service)
+    db.flush()
+    return service
+
+
+def add_appointments(db: Session, ctx: Context, master_id: int, first: int, count: int):
+    """Записи на завтра, каждая в свою минуту начиная с first"""
+    day_start = datetime.combine(target_date(), datetime.min.time())
+    db.execute(insert(models.Appointment), [
+        {
+            "client_id": ctx.client_id,
+            "master_id": master_id,
+            "service_id": SERVICE_ID,
+            "appointment_datetime": day_start + timedelta(minutes=minute),
+            "status": "scheduled",
+        }
+        for minute in range(first, first + count)
+    ])
+
+
+# ==================== НАПОЛНЕНИЕ ====================
+# seed(db, ctx, first, count) добавляет строки с номерами first..first+count-1
+
+def seed_professions(db: Session, ctx: Context, first: int, count: int):
+    for number in range(first, first + count):
+        db.add(models.Profession(name=f"Тестовая профессия {number}"))
+
+
+def seed_services(db: Session, ctx: Context, first: int, count: int):
+    for number in range(first, first + count):
+        add_service(db, number)
+
+
+def seed_profession_services(db: Session, ctx: Context, first: int, count: int):
+    for number in range(first, first + count):
+        add_service(db, number, profession_id=PROFESSION_ID)
+
+
+def seed_master_services(db: Session, ctx: Context, first: int, count: int):
+    master = db.get(models.Master, MASTER_ID)
+    for number in range(first, first + count):
+        master.services.append(add_service(db, number))
+
+
+def seed_masters(db: Session, ctx: Context, first: int, count: int):
+    for number in range(first, first + count):
+        add_master(db, number, service_ids=(SERVICE_ID, SERVICE_ID + 1))
+
+
+def seed_client_appointments(db: Session, ctx: Context, first: int, count: int):
+    # У каждой записи свой мастер со своей профессией
+    for number in range(first, first + count):
+        master = add_master(db, number)
+        add_appointments(db, ctx, master.id, number, 1)
+
+
+def seed_busy_day(db: Session, ctx: Context, first: int, count: int):
+    add_appointments(db, ctx, MASTER_ID, first, count)
+
+
+def seed_service_masters(db: Session, ctx: Context, first: int, count: int):
+    # Мастера услуги, у каждого записи на этот день
+    for number in range(first, first + count):
+        master = add_master(db, number)
+        add_appointments(db, ctx, master.id, 0, 2)
+
+
+class Case(NamedTuple):
+    url: Callable[[Context], str]
+    seed: Callable[[Session, Context, int, int], None]
+
+
+def slots_url(ctx: Context) -> str:
+    return (
+        f"/api/available-slots?master_id={MASTER_ID}&service_id={SERVICE_ID}"
+        f"&target_date={target_date().isoformat()}"
+    )
+
+
+def slots_range_url(ctx: Context) -> str:
+    return (
+        f"/api/available-slots/range?master_id={MASTER_ID}&service_id={SERVICE_ID}"
+        f"&from={target_date().isoformat()}&to={(target_date() + timedelta(days=6)).isoformat()}"
+    )
+
+
+CASES = {
+    # Справочники
+    "professions": Case(lambda ctx: "/api/professions", seed_professions),
+    "services": Case(lambda ctx: "/api/services", seed_services),
+    "services_by_profession": Case(
+        lambda ctx: f"/api/services?profession_id={PROFESSION_ID}", seed_profession_services
+    ),
+    # Мастера
+    "masters": Case(lambda ctx: "/api/masters", seed_masters),
+    "masters_page": Case(lambda ctx: "/api/masters/page?limit=200", seed_masters),
+    "service_masters": Case(lambda ctx: f"/api/services/{SERVICE_ID}/masters", seed_masters),
+    "master_services": Case(lambda ctx: f"/api/masters/{MASTER_ID}/services", seed_master_services),
+    # Записи
+    "appointments": Case(
+        lambda ctx: f"/api/appointments?client_id={ctx.client_id}", seed_client_appointments
+    ),
+    "appointments_page": Case(
+        lambda ctx: f"/api/appointments/page?client_id={ctx.client_id}&limit=200", seed_client_appointments
+    ),
+    "admin_appointments": Case(lambda ctx: "/api/admin/appointments?format=json", seed_client_appointments),
+    # Свободное время
+    "available_slots": Case(slots_url, seed_busy_day),
+    "available_slots_range": Case(slots_range_url, seed_busy_day),
+    "service_availability": Case(
+        lambda ctx: f"/api/services/{SERVICE_ID}/availability?target_date={target_date().isoformat()}",
+        seed_service_masters
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def context(client_user) -> Context:
+    """Клиент для эндпоинтов записей и токен администратора"""
+    db = SessionLocal()
+    try:
+        admin = db.query(models.User).filter(models.User.role == "admin").first()
+        token = tokens.issue_token(admin)
+    finally:
+        db.close()
+    return Context(client_id=client_user.id, headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_statement_count_does_not_grow_with_rows(api, statements, db, context, name):
+    case = CASES[name]
+
+    counts = []
+    seeded = 0
+    for size in (ROWS, ROWS * 10):
+        case.seed(db, context, seeded, size - seeded)
+        db.commit()
+        seeded = size
+
+        # Ответ справочника из кэша не дошел бы до БД
+        catalog_cache.invalidate()
+        statements.count = 0
+        response = api.get(case.url(context), headers=context.headers)
+        assert response.status_code == 200, response.text
+        counts.append(statements.count)
+
+    assert counts[0] > 0
+    assert counts[0] == counts[1], f"{name}: запросов при {ROWS} и {ROWS * 10} строках: {counts}"
+
+
+@pytest.mark.parametrize("url", [
+    "/api/professions",
+    "/api/services",
+    f"/api/services?profession_id={PROFESSION_ID}",
+    "/api/masters",
+    f"/api/services/{SERVICE_ID}/masters",
+])
+def test_catalog_cache_hit_skips_database(api, statements, db, context, url):
+    catalog_cache.invalidate()
+    statements.count = 0
+    first = api.get(url)
+    assert first.status_code == 200, first.text
+    assert statements.count > 0
+
+    # Повторный запрос отдается из кэша
+    statements.count = 0
+    second = api.get(url)
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert statements.count == 0
+
+    # Изменение справочника сбрасывает кэш: следующий запрос снова идет в БД
+    response = api.post("/api/services", headers=context.headers, json={
+        "name": "Тестовая услуга кэша", "price": 100, "duration_minutes": 30, "profession_id": PROFESSION_ID
+    })
+    assert response.status_code == 200, response.text
+    statements.count = 0
+    assert api.get(url).status_code == 200
+    assert statements.count > 0